@@ -3,23 +3,49 @@ import pandas as pd
 import numpy as np
 import seaborn as sns
 import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import functools
 import logging
+import os
+import threading
+from collections import deque
 from datetime import datetime
-from scipy import stats
-from scipy.stats import ttest_ind, f_oneway, chi2_contingency, shapiro, levene
 import warnings
 
+from yulu_analytics.aggregates import build_cubes, group_size, overall_mean, total
+from yulu_analytics.api import serve_in_thread as serve_api
+from yulu_analytics.dataset import data_source, open_dataset, open_partitioned
+from yulu_analytics.exports import EXPORT_FORMATS, available_formats, export_bytes
+from yulu_analytics.figure_cache import FigureCache
+from yulu_analytics.figures import (SCATTER_MAX_POINTS, inputs_of, plot_forecast, plot_profile_flame,
+                                   prebuild as prebuild_figure, render as render_figure, warm as warm_figures)
+from yulu_analytics.filters import FilterIndex
+from yulu_analytics.forecast import LEVEL_GROUPS, MAX_HOURS, MIN_HOURS, PROFILE_DAYS, DemandForecaster
+from yulu_analytics.ingest import SourceRewritten
+from yulu_analytics.insights import (HYPOTHESIS_TESTS, category_profile, correlation_matrix, count_correlations,
+                                     hourly_profile, hypothesis_tests, kpis, monthly_profile, statistics_table,
+                                     user_share, weekly_profile)
+from yulu_analytics.logs import configure_logging, tail_lines
+from yulu_analytics.online_stats import describe_columns
+from yulu_analytics.partitions import is_partitioned
+from yulu_analytics.profiling import Profiler, activate, span, summarize, traced
+from yulu_analytics.resampling import RESAMPLING_MODES, RESAMPLING_WORKERS, comparison_test, default_resampling_mode
+from yulu_analytics.sampling import stratified_sample
+from yulu_analytics.schema import memory_report
+from yulu_analytics.sections import EXECUTION_MODES, default_mode, run_sections
+from yulu_analytics.timeindex import TimeIndex
+
 warnings.filterwarnings('ignore')
 
-# Configure logging
-logging.basicConfig(
-    filename='yulu_app.log',
+# Configure logging: a size-bounded rotating file, optionally written from a
+# background thread so logging never blocks a rerun (see yulu_analytics/logs.py)
+LOG_FILE = 'yulu_app.log'
+configure_logging(
+    LOG_FILE,
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
+    max_bytes=int(os.environ.get("YULU_LOG_MAX_BYTES", 5 * 1024 * 1024)),
+    backup_count=int(os.environ.get("YULU_LOG_BACKUPS", 3)),
+    use_queue=os.environ.get("YULU_LOG_QUEUE", "0") == "1"
 )
 
 logger = logging.getLogger(__name__)
@@ -35,6 +61,17 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Per-rerun timing spans (see yulu_analytics/profiling.py), kept for the session's last few reruns
+# and, if YULU_PROFILE_LOG is set, appended to that file as JSON lines
+PROFILE_HISTORY = 20
+PROFILE_LOG = os.environ.get("YULU_PROFILE_LOG")
+
+st.session_state.profile_reruns = st.session_state.get("profile_reruns", 0) + 1
+profile_runs = st.session_state.setdefault("profile_runs", deque(maxlen=PROFILE_HISTORY))
+profiler = Profiler(f"rerun {st.session_state.profile_reruns}")
+profile_runs.append(profiler)
+activate(profiler)
+
 # Enhanced Custom CSS matching Aerofit style
 st.markdown("""
 <style>
@@ -305,6 +342,7 @@ with st.sidebar:
             <li>Univariate & Bivariate EDA</li>
             <li>Statistical Hypothesis Testing</li>
             <li>Insights & Recommendations</li>
+            <li>Hourly Demand Forecasting</li>
         </ul>
     </div>
     """, unsafe_allow_html=True)
@@ -320,82 +358,300 @@ with st.sidebar:
     </div>
     """, unsafe_allow_html=True)
 
-# Load and preprocess data
-@st.cache_data
-def load_data():
+@st.cache_resource
+def get_partitioned_dataset(source):
+    # A partition directory's manifest and every partition opened so far, shared by all sessions
+    logger.info(f"Opening partitioned dataset {source}")
+    return open_partitioned(source)
+
+@st.cache_resource(max_entries=8)
+def get_live_dataset(partitions=None, _execution_mode="threads"):
+    # The one frame every session reads (memory-mapped when the disk cache is available);
+    # refresh() folds rows appended to the source into it. Not st.cache_data: that would
+    # hand every caller a pickled heap copy instead of the shared mapped frame.
+    # For a partition directory: the selected partitions, loaded together and combined
     logger.info("Loading dataset...")
     try:
-        try:
-            df = pd.read_csv("yulu_data.csv")
-        except:
-            df = pd.read_csv("bike_sharing.txt")
-        
-        logger.info(f"Dataset loaded: {df.shape}")
-        
-        # Preprocessing
-        data = df.copy()
-        
-        data["weather"].replace({1: "Clear", 2: "Cloudy", 3: "Little Rain", 4: "Heavy Rain"}, inplace=True)
-        data["season"].replace({1: "Spring", 2: "Summer", 3: "Fall", 4: "Winter"}, inplace=True)
-        data["workingday"].replace({1: "Yes", 0: "No"}, inplace=True)
-        data["holiday"].replace({1: "Yes", 0: "No"}, inplace=True)
-        
-        data["datetime"] = pd.to_datetime(data["datetime"])
-        data["day"] = data["datetime"].dt.day_name()
-        data["date"] = data["datetime"].dt.date
-        data["hour"] = data["datetime"].dt.hour
-        data["Month"] = data["datetime"].dt.month
-        data["Month_name"] = data["datetime"].dt.month_name()
-        data["year"] = data["datetime"].dt.year
-        
-        def get_temp(temp):
-            if temp <= 12: return "Very Low"
-            elif temp > 12 and temp < 24: return "Low"
-            elif temp >= 24 and temp < 35: return "Moderate"
-            elif temp >= 35: return "High"
-        
-        data["temperature"] = data["atemp"].apply(get_temp)
-        
-        def get_humidity(H):
-            if 0 <= H <= 10: return "10%"
-            elif 11 <= H <= 20: return "20%"
-            elif 21 <= H <= 30: return "30%"
-            elif 31 <= H <= 40: return "40%"
-            elif 41 <= H <= 50: return "50%"
-            elif 51 <= H <= 60: return "60%"
-            elif 61 <= H <= 70: return "70%"
-            elif 71 <= H <= 80: return "80%"
-            elif 81 <= H <= 90: return "90%"
-            elif 91 <= H <= 100: return "100%"
-        
-        data["humidity_level"] = data["humidity"].apply(get_humidity)
-        
-        def get_windspeed(W):
-            if 0 <= W <= 10: return "Low"
-            elif 11 <= W <= 20: return "Moderate"
-            elif 21 <= W <= 30: return "High"
-            elif W > 30: return "Very High"
-        
-        data["windspeed_level"] = data["windspeed"].apply(get_windspeed)
-        
-        logger.info("Preprocessing completed")
-        return data
-    
+        if partitions is None:
+            return open_dataset(data_source())
+        return get_partitioned_dataset(data_source()).view(partitions, _execution_mode)
     except Exception as e:
         logger.error(f"Error: {str(e)}")
         st.error(f"Error loading data: {str(e)}")
-        return None
+        raise
+
+@traced("cache.time_index")
+@st.cache_resource(max_entries=8)
+def get_time_index(fingerprint, _data):
+    # Sorted datetimes and prefix sums of the measures, one per dataset version
+    return TimeIndex(_data)
+
+@traced("cache.window")
+@st.cache_resource(max_entries=8)
+def get_window(fingerprint, start, end, _data):
+    # The rows of a date window and their cubes, shared by every session viewing it
+    window = get_time_index(fingerprint, _data).slice(_data, start, end)
+    return window, build_cubes(window)
+
+# The helpers below take the frame they work on as an unhashed `_data` argument:
+# the full dataset or a date window, told apart by the fingerprint in the key
+@traced("cache.filter_index")
+@st.cache_resource(max_entries=4)
+def get_filter_index(fingerprint, _data):
+    # Shared by all sessions; FilterIndex keeps its own LRU of filter selections
+    return FilterIndex(_data, ['season', 'weather', 'workingday'])
+
+# Hypothesis test results, keyed on the dataset fingerprint and the tests run together
+# (the execution mode only changes how they run, so it is left out of the key)
+@traced("cache.hypothesis_tests")
+@st.cache_data(max_entries=64)
+def get_test_results(fingerprint, names, _execution_mode, _data, _cube):
+    return hypothesis_tests(_data, _cube, list(names), _execution_mode)
+
+# Bootstrap and permutation results depend only on the data, the resamples and the seed
+# (the mode only changes where the batches run, so it is left out of the key)
+@traced("cache.resampling")
+@st.cache_data(max_entries=32)
+def get_resampling(fingerprint, name, resamples, seed, _mode, _data):
+    return comparison_test(_data, name, resamples=resamples, seed=seed, mode=_mode)
+
+@traced("cache.sample_size")
+@st.cache_data(max_entries=8)
+def get_sample_size(fingerprint, columns, by, _data, max_points=SCATTER_MAX_POINTS):
+    # Rows in the stratified sample a scatter figure plots, for its caption
+    return len(stratified_sample(_data[columns], by, max_points))
+
+# Pre-rendered figures shared by all sessions (see figure_cache.py and figures.py)
+FIGURE_CACHE_ENTRIES = 128
+
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache(max_entries=FIGURE_CACHE_ENTRIES)
+
+@st.cache_resource(max_entries=4)
+def warm_figure_cache(fingerprint, _data, _cubes):
+    # Once per dataset version, render every figure in the background so first views are cache hits
+    thread = threading.Thread(target=warm_figures, args=(get_figure_cache(), fingerprint, _data, _cubes),
+                              name="figure-warmup", daemon=True)
+    thread.start()
+    return thread
+
+@st.cache_resource(max_entries=4)
+def get_forecaster(base_fingerprint):
+    # One model per loaded file (or partition selection), shared by all sessions; it keeps
+    # only its training sums, so each dataset version just fits the rows appended since the last one
+    return DemandForecaster()
+
+@traced("cache.forecast")
+@st.cache_data(max_entries=32)
+def get_forecast(fingerprint, hours, weather, _live, _data):
+    model = get_forecaster(_live.base_fingerprint).update(_data)
+    return model.forecast(_data, hours, weather), model.rows
+
+# Optional JSON API over the same loaded dataset (see api.py), e.g. YULU_API_PORT=8502
+API_PORT = os.environ.get("YULU_API_PORT")
+
+@st.cache_resource
+def start_api_server(port, _live):
+    logger.info(f"Starting API on port {port}")
+    return serve_api(_live, os.environ.get("YULU_API_HOST", "127.0.0.1"), int(port))
+
+# Pearson correlations of the numerical columns, computed once per dataset (or window)
+@traced("cache.correlations")
+@st.cache_data(max_entries=8)
+def get_correlations(fingerprint, _data):
+    return correlation_matrix(_data)
+
+# describe(include='all') of the frame, from the cubes and column statistics (see insights.py)
+@traced("cache.statistics_table")
+@st.cache_data(max_entries=8)
+def get_statistics_table(fingerprint, _cubes):
+    return statistics_table(_cubes)
+
+@traced("cache.memory_report")
+@st.cache_data(max_entries=4)
+def get_memory_report(fingerprint, _data):
+    return memory_report(_data)
+
+def date_range_picker(first, last):
+    # Sidebar date range between two timestamps -> picked dates and the [start, end) window
+    first, last = first.date(), last.date()
+    picked = st.date_input("📅 Date range", value=(first, last), min_value=first, max_value=last,
+                           key="date_range", help="Every tab is computed over the rows in these dates")
+    # While a range is being picked only its start is set
+    start_date, end_date = (tuple(picked) + (last,))[:2] if picked else (first, last)
+    return start_date, end_date, pd.Timestamp(start_date), pd.Timestamp(end_date) + pd.Timedelta(days=1)
+
+# Tab rendering mode: lazy tabs rerun the script on tab change and only execute
+# the selected tab (and sub-tab), so hidden figures and tests cost nothing
+with st.sidebar:
+    st.markdown("<br>", unsafe_allow_html=True)
+    lazy_tabs = st.toggle("⚡ Lazy tab rendering", value=True, key="lazy_tabs",
+                          help="Compute only the selected tab on each interaction")
+    # Independent sections (Complete Analysis sub-tabs, hypothesis tests, partition
+    # loads) run one after another or together on a thread pool (see sections.py)
+    execution_mode = st.selectbox("🧵 Section execution", EXECUTION_MODES,
+                                  index=EXECUTION_MODES.index(default_mode()), key="execution_mode",
+                                  help="Compute independent sections serially or in parallel threads")
+
+# A partition directory is pruned before loading: only the partitions of the zones and
+# dates picked in the sidebar are opened (see partitions.py)
+source = data_source()
+partitions = None
+if is_partitioned(source):
+    partition_set = get_partitioned_dataset(source)
+    partition_set.reload_manifest()
+    zone_options = partition_set.zones()
+    with st.sidebar:
+        zones = st.multiselect("📍 Zones", zone_options, default=zone_options, key="zones",
+                               help="Load and analyze only these zones") or zone_options
+        start_date, end_date, window_start, window_end = date_range_picker(*partition_set.span())
+    partitions = partition_set.select(zones, window_start, window_end)
+    if not partitions:
+        st.warning(f"⚠️ No partitions of {', '.join(zones)} between {start_date:%d %b %Y} and {end_date:%d %b %Y}")
+        st.stop()
 
 try:
-    df = load_data()
+    live = get_live_dataset(partitions, execution_mode)
+    try:
+        appended = live.refresh()
+        if appended:
+            logger.info(f"Appended {appended:,} new rows from {live.source}")
+    except SourceRewritten as e:
+        # Not an append: drop everything derived from the old file and reload it
+        logger.warning(f"{str(e)}, reloading")
+        get_live_dataset.clear()
+        get_partitioned_dataset.clear()
+        live = get_live_dataset(partitions, execution_mode)
+    df, cubes, fingerprint = live.snapshot()
+    # The whole loaded selection, for what ignores the date window (memory report)
+    dataset_df, dataset_fingerprint = df, fingerprint
+    warm_figure_cache(fingerprint, df, cubes)
+    if API_PORT:
+        # The API serves every zone whatever this session selected; after a reload
+        # it must serve the new dataset object too
+        api_live = live if partitions is None else get_live_dataset(partition_set.select(), execution_mode)
+        start_api_server(API_PORT, api_live).live = api_live
     logger.info("Data ready")
 except Exception as e:
     logger.error(f"Failed to load data: {str(e)}")
     st.error("❌ Failed to load data")
     st.stop()
 
+# Date window every tab is computed over; its totals come straight from the
+# index's prefix sums, its rows from a binary-searched slice (see timeindex.py)
+time_index = get_time_index(fingerprint, df)
+with st.sidebar:
+    if partitions is None:
+        start_date, end_date, window_start, window_end = date_range_picker(*time_index.span())
+    window_totals = time_index.totals(window_start, window_end)
+    window_rows = int(window_totals['n'].iloc[0])
+    if window_rows:
+        st.caption(f"🗓️ {window_rows:,} hours · {total(window_totals):,} rentals · "
+                   f"{overall_mean(window_totals):.1f} per hour")
+
+if not window_rows:
+    st.warning(f"⚠️ No records between {start_date:%d %b %Y} and {end_date:%d %b %Y}; pick another date range")
+    st.stop()
+if window_rows < len(df):
+    df, cubes = get_window(fingerprint, window_start, window_end, df)
+    # Figures, tests and exports of the window are cached under their own key
+    fingerprint = f"{fingerprint}@{start_date:%Y%m%d}-{end_date:%Y%m%d}"
+# Pre-aggregated measures shared by every chart (see aggregates.py)
+cube = cubes['calendar']
+
+def make_tabs(labels, key):
+    return st.tabs(labels, key=key, on_change="rerun" if lazy_tabs else "ignore")
+
+def figure_inputs(figure_ids):
+    # The tables these figures take besides the data (see figures.INPUTS), from the
+    # caches the tabs read them from; looked up here since worker threads have no session
+    cached = {"corr": lambda: get_correlations(fingerprint, df)}
+    return {name: cached[name]() for name in inputs_of(figure_ids)}
+
+def chart(figure_id, **params):
+    # The nested figure.* span is the cache lookup or build, the rest is serialization
+    with span(f"chart.{figure_id}"):
+        st.plotly_chart(render_figure(get_figure_cache(), figure_id, fingerprint, df, cubes,
+                                      figure_inputs([figure_id]), **params),
+                        use_container_width=True)
+
+def prefetch_sections(figure_ids, **tasks):
+    # Build the figures of the sections about to render, together with their other
+    # independent computations; chart() then only reads the figure cache
+    inputs = figure_inputs(figure_ids)
+    jobs = {f"figure.{figure_id}": functools.partial(prebuild_figure, get_figure_cache(), figure_id,
+                                                     fingerprint, df, cubes, inputs)
+            for figure_id in figure_ids}
+    jobs.update(tasks)
+    return run_sections(jobs, execution_mode)
+
+# Tests return NaN when the date window lacks the groups they compare
+UNTESTABLE_MESSAGE = "ℹ️ Not enough groups in the selected date range to run this test; widen the range."
+
+def test_decision(p_value):
+    if np.isnan(p_value):
+        return 'Not enough data'
+    return 'Reject H₀' if p_value < 0.05 else 'Fail to Reject H₀'
+
+RESAMPLE_COUNTS = [1_000, 2_000, 5_000, 10_000, 50_000, 100_000]
+# 2,000 resamples of a comparison take up to ~2 s on one core: default to that per core the default mode uses
+DEFAULT_RESAMPLES = max(count for count in RESAMPLE_COUNTS
+                        if count <= 2_000 * (RESAMPLING_WORKERS if default_resampling_mode() == "processes" else 1))
+
+def resampling_section(name):
+    # Resampling check of a parametric test; opt-in, as 10k resamples of every group take seconds
+    if not st.toggle("🎲 Bootstrap CIs & permutation test", key=f"resample_{name}",
+                     help="Resample the data instead of assuming normally distributed rentals"):
+        return
+    with st.spinner(f"Drawing {resamples:,} resamples..."):
+        result = get_resampling(fingerprint, name, resamples, resampling_seed, resampling_mode, df)
+    level = f"{result['confidence']:.0%} CI"
+    st.dataframe(pd.DataFrame({
+        'Hours': result['n'],
+        'Mean Rentals': np.round(result['means'], 2),
+        level: [f"[{low:.2f}, {high:.2f}]" for low, high in zip(result['ci_low'], result['ci_high'])],
+    }, index=result['labels']), use_container_width=True)
+    p_value = result['p_value']
+    # No permutation as extreme as the data: the p-value is only bounded by the resamples drawn
+    p_text = f"≤ {p_value:.6f}" if p_value <= 1 / (result['resamples'] + 1) else f"{p_value:.6f}"
+    difference = result['difference']
+    difference_line = ""
+    if difference:
+        difference_line = (f"<p><strong>Mean Difference:</strong> {difference['value']:.2f} "
+                           f"({level} [{difference['ci_low']:.2f}, {difference['ci_high']:.2f}])</p>")
+    st.markdown(f"""
+    <div class='metric-card'>
+        <h4 style='color: #f472b6;'>Resampling Results</h4>
+        {difference_line}
+        <p><strong>Permutation P-Value:</strong> {'n/a' if np.isnan(p_value) else p_text}</p>
+        <p><strong>Decision:</strong> {test_decision(p_value)}</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.caption(f"⏱️ {result['resamples']:,} bootstrap and {result['resamples']:,} permutation resamples "
+               f"(seed {result['seed']}, {result['mode']}) in {result['seconds']:.2f} s")
+
+def zone_history():
+    # The forecast learns from the whole history of the selected zones, not only the
+    # partitions the date range loaded
+    if partitions is None:
+        return live
+    history = get_live_dataset(partition_set.select(zones), execution_mode)
+    try:
+        history.refresh()
+    except SourceRewritten as e:
+        logger.warning(f"{str(e)}, reloading")
+        get_live_dataset.clear()
+        get_partitioned_dataset.clear()
+        st.rerun()
+    return history
+
+def tab_is_open(tab):
+    # `open` is None when tabs don't track selection (eager mode), so render everything
+    return tab.open is not False
+
 # Main Tabs
-tabs = st.tabs([
+tabs = make_tabs([
     "📊 Problem Statement",
     "🔍 Interactive EDA", 
     "📈 Univariate Analysis",
@@ -403,1608 +659,1271 @@ tabs = st.tabs([
     "🔬 Hypothesis Testing",
     "💡 Insights & Recommendations",
     "📚 Complete Analysis",
+    "🔮 Demand Forecast",
     "📝 Logs"
-])
+], key="main_tabs")
 
 logger.info("Main tabs created")
 
 # TAB 1: Problem Statement
-with tabs[0]:
-    st.header("📊 About Yulu & Problem Statement")
-    logger.info("Problem Statement tab accessed")
-    
-    # Enhanced Metrics with Gradient Cards
-    st.markdown("""
-    <style>
-        .metric-container {
-            background: rgba(17, 24, 39, 0.7);
-            padding: 1.5rem;
-            border-radius: 16px;
-            border: 1px solid rgba(139, 92, 246, 0.2);
-            transition: all 0.3s ease;
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-        }
-        .metric-container:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 10px 30px rgba(139, 92, 246, 0.3);
-            border-color: rgba(139, 92, 246, 0.5);
-        }
-        .metric-value {
-            font-size: 2.5rem;
-            font-weight: 800;
-            background: linear-gradient(135deg, #fff 0%, #cbd5e1 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            margin: 0.5rem 0;
-        }
-        .metric-label {
-            color: #94a3b8;
-            font-size: 0.9rem;
-            text-transform: uppercase;
-            letter-spacing: 1.5px;
-            font-weight: 600;
-        }
-        .metric-icon {
-            font-size: 1.5rem;
-            margin-bottom: 0.5rem;
-            background: rgba(139, 92, 246, 0.1);
-            width: 50px;
-            height: 50px;
-            line-height: 50px;
-            border-radius: 50%;
-            margin: 0 auto 1rem auto;
-        }
-    </style>
-    """, unsafe_allow_html=True)
-
-    m1, m2, m3, m4 = st.columns(4)
-    
-    with m1:
-        st.markdown(f"""
-        <div class="metric-container">
-            <div class="metric-icon" style="color: #667eea;">📊</div>
-            <div class="metric-value">{len(df):,}</div>
-            <div class="metric-label">Total Records</div>
-            <div style="font-size: 0.8rem; color: #667eea; margin-top: 0.5rem;">Hourly Data Points</div>
-        </div>
-        """, unsafe_allow_html=True)
+if tab_is_open(tabs[0]):
+    with tabs[0], span("tab.problem_statement"):
+        st.header("📊 About Yulu & Problem Statement")
+        logger.info("Problem Statement tab accessed")
         
-    with m2:
-        st.markdown(f"""
-        <div class="metric-container">
-            <div class="metric-icon" style="color: #f472b6;">🧩</div>
-            <div class="metric-value">{df.shape[1]}</div>
-            <div class="metric-label">Features</div>
-            <div style="font-size: 0.8rem; color: #f472b6; margin-top: 0.5rem;">Analytical Columns</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with m3:
-        st.markdown(f"""
-        <div class="metric-container">
-            <div class="metric-icon" style="color: #38ef7d;">🚲</div>
-            <div class="metric-value">{df['count'].sum() // 1000}k+</div>
-            <div class="metric-label">Total Rentals</div>
-            <div style="font-size: 0.8rem; color: #38ef7d; margin-top: 0.5rem;">Bikes Rented</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with m4:
-        st.markdown(f"""
-        <div class="metric-container">
-            <div class="metric-icon" style="color: #fb923c;">⚡</div>
-            <div class="metric-value">{df['count'].mean():.1f}</div>
-            <div class="metric-label">Avg / Hour</div>
-            <div style="font-size: 0.8rem; color: #fb923c; margin-top: 0.5rem;">Demand Rate</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    # About Yulu & Business Challenge in a Grid
-    c1, c2 = st.columns([1.5, 1])
-    
-    with c1:
+        # Enhanced Metrics with Gradient Cards
         st.markdown("""
-        <div style='background: linear-gradient(145deg, rgba(30, 41, 59, 0.8), rgba(15, 23, 42, 0.9)); 
-                    padding: 2rem; border-radius: 20px; border: 1px solid rgba(102, 126, 234, 0.3); height: 100%;'>
-            <h3 style='color: #8b5cf6 !important; margin-top: 0; display: flex; align-items: center; gap: 10px;'>
-                <span style='font-size: 2rem;'>🚴</span> About Yulu
-            </h3>
-            <p style='color: #cbd5e1; line-height: 1.8; font-size: 1.05rem;'>
-                <strong>Yulu</strong> is India's leading micro-mobility service provider, revolutionizing daily commutes. 
-                Starting as a mission to eliminate traffic congestion, Yulu provides safe, shared, and sustainable 
-                commuting solutions through a user-friendly mobile app.
-            </p>
-            <div style='background: rgba(102, 126, 234, 0.1); padding: 1rem; border-radius: 10px; margin-top: 1.5rem;'>
-                <p style='color: #a5b4fc; margin: 0; font-size: 0.95rem;'>
-                    <strong>📍 Key Zones:</strong> Metro stations, bus stands, office spaces, residential areas, and corporate hubs.
-                </p>
-            </div>
-        </div>
+        <style>
+            .metric-container {
+                background: rgba(17, 24, 39, 0.7);
+                padding: 1.5rem;
+                border-radius: 16px;
+                border: 1px solid rgba(139, 92, 246, 0.2);
+                transition: all 0.3s ease;
+                text-align: center;
+                position: relative;
+                overflow: hidden;
+            }
+            .metric-container:hover {
+                transform: translateY(-5px);
+                box-shadow: 0 10px 30px rgba(139, 92, 246, 0.3);
+                border-color: rgba(139, 92, 246, 0.5);
+            }
+            .metric-value {
+                font-size: 2.5rem;
+                font-weight: 800;
+                background: linear-gradient(135deg, #fff 0%, #cbd5e1 100%);
+                -webkit-background-clip: text;
+                -webkit-text-fill-color: transparent;
+                margin: 0.5rem 0;
+            }
+            .metric-label {
+                color: #94a3b8;
+                font-size: 0.9rem;
+                text-transform: uppercase;
+                letter-spacing: 1.5px;
+                font-weight: 600;
+            }
+            .metric-icon {
+                font-size: 1.5rem;
+                margin-bottom: 0.5rem;
+                background: rgba(139, 92, 246, 0.1);
+                width: 50px;
+                height: 50px;
+                line-height: 50px;
+                border-radius: 50%;
+                margin: 0 auto 1rem auto;
+            }
+        </style>
         """, unsafe_allow_html=True)
 
-    with c2:
-        st.markdown("""
-        <div style='background: linear-gradient(145deg, rgba(30, 41, 59, 0.8), rgba(15, 23, 42, 0.9)); 
-                    padding: 2rem; border-radius: 20px; border: 1px solid rgba(244, 114, 182, 0.3); height: 100%;'>
-            <h3 style='color: #ec4899 !important; margin-top: 0; display: flex; align-items: center; gap: 10px;'>
-                <span style='font-size: 2rem;'>⚠️</span> The Challenge
-            </h3>
-            <p style='color: #cbd5e1; line-height: 1.6;'>
-                Yulu has experienced a recent dip in revenues. The company needs to understand:
-            </p>
-            <ul style='color: #f472b6; margin-bottom: 0;'>
-                <li style='margin-bottom: 0.5rem;'>Which variables predict demand?</li>
-            <p style='margin: 0; font-size: 0.9rem;'>All {len(df):,} records complete</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        st.markdown(f"""
-        <div class='metric-card'>
-            <p style='font-size: 2rem; margin: 0; color: #38ef7d;'>✓</p>
-            <p style='margin: 0.5rem 0;'><strong>No Duplicates</strong></p>
-            <p style='margin: 0; font-size: 0.9rem;'>Clean dataset</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Sample Data
-    st.subheader("🔍 Sample Data Preview")
-    st.dataframe(df.head(10), use_container_width=True)
-
-# TAB 2: Interactive EDA
-with tabs[1]:
-    st.header("🔍 Interactive Exploratory Data Analysis")
-    logger.info("Interactive EDA tab accessed")
-    
-    viz_tabs = st.tabs(["📊 Overview", "🌡️ Weather Patterns", "⏰ Temporal Patterns", "👥 User Analysis"])
-    
-    with viz_tabs[0]:
-        st.subheader("Dataset Overview")
-        
-        st.markdown("""
-        <div style='background: rgba(139, 92, 246, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #8b5cf6; margin-bottom: 1.5rem;'>
-            <h4 style='color: #a78bfa; margin-top: 0;'>📊 Understanding the Data</h4>
-            <p style='color: #cbd5e1; margin: 0;'>
-                This section provides a comprehensive overview of the bike-sharing dataset, including 
-                statistical summaries and distribution patterns.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("**Numerical Features Summary**")
-            numerical_cols = ['temp', 'atemp', 'humidity', 'windspeed', 'casual', 'registered', 'count']
-            st.dataframe(df[numerical_cols].describe().T, use_container_width=True)
-        
-        with col2:
-            st.markdown("**Categorical Features**")
-            cat_summary = []
-            for col in ['season', 'holiday', 'workingday', 'weather']:
-                value_counts = df[col].value_counts()
-                cat_summary.append({
-                    'Feature': col,
-                    'Unique': df[col].nunique(),
-                    'Most Common': value_counts.index[0],
-                    'Frequency': value_counts.values[0]
-                })
-            st.dataframe(pd.DataFrame(cat_summary), use_container_width=True, hide_index=True)
-        
-        st.markdown("---")
+        m1, m2, m3, m4 = st.columns(4)
         
-        # Interactive Data Explorer
-        st.markdown("**🔍 Interactive Data Explorer**")
-        
-        col_filter1, col_filter2, col_filter3 = st.columns(3)
-        with col_filter1:
-            season_filter = st.multiselect("Filter by Season", df['season'].unique(), default=df['season'].unique())
-        with col_filter2:
-            weather_filter = st.multiselect("Filter by Weather", df['weather'].unique(), default=df['weather'].unique())
-        with col_filter3:
-            workday_filter = st.multiselect("Filter by Working Day", df['workingday'].unique(), default=df['workingday'].unique())
-        
-        filtered_df = df[
-            (df['season'].isin(season_filter)) & 
-            (df['weather'].isin(weather_filter)) &
-            (df['workingday'].isin(workday_filter))
-        ]
-        
-        st.info(f"📊 Showing **{len(filtered_df):,}** of **{len(df):,}** records")
-        st.dataframe(filtered_df.head(100), use_container_width=True, height=400)
-    
-    with viz_tabs[1]:
-        st.subheader("Weather Pattern Analysis")
+        with m1:
+            st.markdown(f"""
+            <div class="metric-container">
+                <div class="metric-icon" style="color: #667eea;">📊</div>
+                <div class="metric-value">{len(df):,}</div>
+                <div class="metric-label">Total Records</div>
+                <div style="font-size: 0.8rem; color: #667eea; margin-top: 0.5rem;">Hourly Data Points</div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+        with m2:
+            st.markdown(f"""
+            <div class="metric-container">
+                <div class="metric-icon" style="color: #f472b6;">🧩</div>
+                <div class="metric-value">{df.shape[1]}</div>
+                <div class="metric-label">Features</div>
+                <div style="font-size: 0.8rem; color: #f472b6; margin-top: 0.5rem;">Analytical Columns</div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+        with m3:
+            st.markdown(f"""
+            <div class="metric-container">
+                <div class="metric-icon" style="color: #38ef7d;">🚲</div>
+                <div class="metric-value">{total(cube) // 1000}k+</div>
+                <div class="metric-label">Total Rentals</div>
+                <div style="font-size: 0.8rem; color: #38ef7d; margin-top: 0.5rem;">Bikes Rented</div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+        with m4:
+            st.markdown(f"""
+            <div class="metric-container">
+                <div class="metric-icon" style="color: #fb923c;">⚡</div>
+                <div class="metric-value">{overall_mean(cube):.1f}</div>
+                <div class="metric-label">Avg / Hour</div>
+                <div style="font-size: 0.8rem; color: #fb923c; margin-top: 0.5rem;">Demand Rate</div>
+            </div>
+            """, unsafe_allow_html=True)
         
-        st.markdown("""
-        <div style='background: rgba(244, 114, 182, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #f472b6; margin-bottom: 1.5rem;'>
-            <h4 style='color: #f472b6; margin-top: 0;'>🌤️ Weather Impact on Rentals</h4>
-            <p style='color: #cbd5e1; margin: 0;'>
-                Weather conditions play a crucial role in bike rental demand. This analysis examines how seasonal 
-                changes and daily weather patterns influence customer behavior and rental volumes. Understanding 
-                these patterns helps optimize fleet distribution and pricing strategies.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown("<br>", unsafe_allow_html=True)
         
-        col1, col2 = st.columns(2)
+        # About Yulu & Business Challenge in a Grid
+        c1, c2 = st.columns([1.5, 1])
         
-        with col1:
-            st.markdown("**🌸 Season Distribution**")
-            st.caption("📌 Distribution of data points across four seasons")
+        with c1:
             st.markdown("""
-            <div style='background: rgba(102, 126, 234, 0.05); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem;'>
-                <p style='color: #cbd5e1; margin: 0; font-size: 0.85rem;'>
-                    This chart shows how our dataset is distributed across seasons. Each season represents 
-                    approximately 3 months of data, helping us understand seasonal variations in bike usage.
-                    <br><br>
-                    <strong>Key Insight:</strong> Balanced seasonal distribution ensures our analysis captures 
-                    all weather patterns throughout the year.
+            <div style='background: linear-gradient(145deg, rgba(30, 41, 59, 0.8), rgba(15, 23, 42, 0.9)); 
+                        padding: 2rem; border-radius: 20px; border: 1px solid rgba(102, 126, 234, 0.3); height: 100%;'>
+                <h3 style='color: #8b5cf6 !important; margin-top: 0; display: flex; align-items: center; gap: 10px;'>
+                    <span style='font-size: 2rem;'>🚴</span> About Yulu
+                </h3>
+                <p style='color: #cbd5e1; line-height: 1.8; font-size: 1.05rem;'>
+                    <strong>Yulu</strong> is India's leading micro-mobility service provider, revolutionizing daily commutes. 
+                    Starting as a mission to eliminate traffic congestion, Yulu provides safe, shared, and sustainable 
+                    commuting solutions through a user-friendly mobile app.
                 </p>
+                <div style='background: rgba(102, 126, 234, 0.1); padding: 1rem; border-radius: 10px; margin-top: 1.5rem;'>
+                    <p style='color: #a5b4fc; margin: 0; font-size: 0.95rem;'>
+                        <strong>📍 Key Zones:</strong> Metro stations, bus stands, office spaces, residential areas, and corporate hubs.
+                    </p>
+                </div>
             </div>
             """, unsafe_allow_html=True)
-            
-            season_counts = df['season'].value_counts()
-            fig = go.Figure(data=[go.Bar(
-                x=season_counts.index,
-                y=season_counts.values,
-                marker=dict(
-                    color=['#667eea', '#f093fb', '#11998e', '#fa709a'],
-                    line=dict(color='rgba(255,255,255,0.3)', width=2)
-                ),
-                text=season_counts.values,
-                textposition='outside',
-                hovertemplate='<b>%{x}</b><br>Records: %{y}<br>Percentage: %{y:.1%}<extra></extra>'
-            )])
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False, title='Season'),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Number of Records'),
-                height=350
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.markdown("**🌤️ Weather Condition Distribution**")
-            st.caption("📌 Proportion of different weather conditions in the dataset")
+
+        with c2:
             st.markdown("""
-            <div style='background: rgba(240, 147, 251, 0.05); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem;'>
-                <p style='color: #cbd5e1; margin: 0; font-size: 0.85rem;'>
-                    Weather conditions are categorized into Clear, Cloudy, Light Rain, and Heavy Rain. 
-                    This donut chart reveals the frequency of each weather type during the observation period.
-                    <br><br>
-                    <strong>Key Insight:</strong> Clear weather dominates, but understanding rental patterns 
-                    during adverse weather is crucial for operational planning.
+            <div style='background: linear-gradient(145deg, rgba(30, 41, 59, 0.8), rgba(15, 23, 42, 0.9)); 
+                        padding: 2rem; border-radius: 20px; border: 1px solid rgba(244, 114, 182, 0.3); height: 100%;'>
+                <h3 style='color: #ec4899 !important; margin-top: 0; display: flex; align-items: center; gap: 10px;'>
+                    <span style='font-size: 2rem;'>⚠️</span> The Challenge
+                </h3>
+                <p style='color: #cbd5e1; line-height: 1.6;'>
+                    Yulu has experienced a recent dip in revenues. The company needs to understand:
                 </p>
+                <ul style='color: #f472b6; margin-bottom: 0;'>
+                    <li style='margin-bottom: 0.5rem;'>Which variables predict demand?</li>
+                <p style='margin: 0; font-size: 0.9rem;'>All {len(df):,} records complete</p>
             </div>
             """, unsafe_allow_html=True)
             
-            weather_counts = df['weather'].value_counts()
-            fig = go.Figure(data=[go.Pie(
-                labels=weather_counts.index,
-                values=weather_counts.values,
-                hole=0.4,
-                marker=dict(colors=['#667eea', '#f093fb', '#11998e', '#fa709a']),
-                textinfo='label+percent',
-                hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
-            )])
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                height=350,
-                showlegend=True
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            st.markdown(f"""
+            <div class='metric-card'>
+                <p style='font-size: 2rem; margin: 0; color: #38ef7d;'>✓</p>
+                <p style='margin: 0.5rem 0;'><strong>No Duplicates</strong></p>
+                <p style='margin: 0; font-size: 0.9rem;'>Clean dataset</p>
+            </div>
+            """, unsafe_allow_html=True)
         
         st.markdown("---")
         
-        # Average rentals by season and weather
-        st.markdown("**📊 Impact Analysis: Rentals vs Environmental Conditions**")
+        # Sample Data
+        st.subheader("🔍 Sample Data Preview")
+        st.dataframe(df.head(10), use_container_width=True)
+
+# TAB 2: Interactive EDA
+if tab_is_open(tabs[1]):
+    with tabs[1], span("tab.eda"):
+        st.header("🔍 Interactive Exploratory Data Analysis")
+        logger.info("Interactive EDA tab accessed")
+        
+        viz_tabs = make_tabs(["📊 Overview", "🌡️ Weather Patterns", "⏰ Temporal Patterns", "👥 User Analysis"], key="viz_tabs")
+        
+        if tab_is_open(viz_tabs[0]):
+            with viz_tabs[0], span("tab.eda.overview"):
+                st.subheader("Dataset Overview")
+                
+                st.markdown("""
+                <div style='background: rgba(139, 92, 246, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #8b5cf6; margin-bottom: 1.5rem;'>
+                    <h4 style='color: #a78bfa; margin-top: 0;'>📊 Understanding the Data</h4>
+                    <p style='color: #cbd5e1; margin: 0;'>
+                        This section provides a comprehensive overview of the bike-sharing dataset, including 
+                        statistical summaries and distribution patterns.
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**Numerical Features Summary**")
+                    st.dataframe(describe_columns(cubes['stats']).T, use_container_width=True)
+                
+                with col2:
+                    st.markdown("**Categorical Features**")
+                    cat_summary = []
+                    for col in ['season', 'holiday', 'workingday', 'weather']:
+                        value_counts = group_size(cube, col).sort_values(ascending=False)
+                        cat_summary.append({
+                            'Feature': col,
+                            'Unique': len(value_counts),
+                            'Most Common': value_counts.index[0],
+                            'Frequency': value_counts.values[0]
+                        })
+                    st.dataframe(pd.DataFrame(cat_summary), use_container_width=True, hide_index=True)
+                
+                # Memory saved by the compact schema
+                with st.expander("🧮 Memory Footprint by Column", expanded=False):
+                    memory_df = get_memory_report(dataset_fingerprint, dataset_df)
+                    legacy_mb = memory_df['Legacy (KB)'].sum() / 1024
+                    compact_mb = memory_df['Compact (KB)'].sum() / 1024
+                    st.info(f"📦 Compact schema: **{compact_mb:.2f} MB** vs **{legacy_mb:.2f} MB** untyped "
+                            f"(**{legacy_mb / compact_mb:.1f}x** smaller)")
+                    st.dataframe(memory_df.round(2), use_container_width=True, hide_index=True)
+                
+                st.markdown("---")
+                
+                # Interactive Data Explorer
+                st.markdown("**🔍 Interactive Data Explorer**")
+                
+                filter_index = get_filter_index(fingerprint, df)
+                col_filter1, col_filter2, col_filter3 = st.columns(3)
+                with col_filter1:
+                    season_filter = st.multiselect("Filter by Season", filter_index.options('season'), default=filter_index.options('season'))
+                with col_filter2:
+                    weather_filter = st.multiselect("Filter by Weather", filter_index.options('weather'), default=filter_index.options('weather'))
+                with col_filter3:
+                    workday_filter = st.multiselect("Filter by Working Day", filter_index.options('workingday'), default=filter_index.options('workingday'))
+                
+                selection = {'season': season_filter, 'weather': weather_filter, 'workingday': workday_filter}
+                filtered_count = filter_index.count(selection)
+                
+                # Page through matching rows straight off the filter bitmap
+                page_size = 100
+                page_count = max(1, -(-filtered_count // page_size))
+                page = st.number_input(f"Page (of {page_count:,})", min_value=1, max_value=page_count, value=1, step=1)
+                
+                st.info(f"📊 Showing **{filtered_count:,}** of **{len(df):,}** records")
+                st.dataframe(df.iloc[filter_index.page(selection, page - 1, page_size)], use_container_width=True, height=400)
+        
+        if tab_is_open(viz_tabs[1]):
+            with viz_tabs[1], span("tab.eda.weather_patterns"):
+                st.subheader("Weather Pattern Analysis")
+                
+                st.markdown("""
+                <div style='background: rgba(244, 114, 182, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #f472b6; margin-bottom: 1.5rem;'>
+                    <h4 style='color: #f472b6; margin-top: 0;'>🌤️ Weather Impact on Rentals</h4>
+                    <p style='color: #cbd5e1; margin: 0;'>
+                        Weather conditions play a crucial role in bike rental demand. This analysis examines how seasonal 
+                        changes and daily weather patterns influence customer behavior and rental volumes. Understanding 
+                        these patterns helps optimize fleet distribution and pricing strategies.
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**🌸 Season Distribution**")
+                    st.caption("📌 Distribution of data points across four seasons")
+                    st.markdown("""
+                    <div style='background: rgba(102, 126, 234, 0.05); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem;'>
+                        <p style='color: #cbd5e1; margin: 0; font-size: 0.85rem;'>
+                            This chart shows how our dataset is distributed across seasons. Each season represents 
+                            approximately 3 months of data, helping us understand seasonal variations in bike usage.
+                            <br><br>
+                            <strong>Key Insight:</strong> Balanced seasonal distribution ensures our analysis captures 
+                            all weather patterns throughout the year.
+                        </p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    chart("season_counts")
+                
+                with col2:
+                    st.markdown("**🌤️ Weather Condition Distribution**")
+                    st.caption("📌 Proportion of different weather conditions in the dataset")
+                    st.markdown("""
+                    <div style='background: rgba(240, 147, 251, 0.05); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem;'>
+                        <p style='color: #cbd5e1; margin: 0; font-size: 0.85rem;'>
+                            Weather conditions are categorized into Clear, Cloudy, Light Rain, and Heavy Rain. 
+                            This donut chart reveals the frequency of each weather type during the observation period.
+                            <br><br>
+                            <strong>Key Insight:</strong> Clear weather dominates, but understanding rental patterns 
+                            during adverse weather is crucial for operational planning.
+                        </p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    chart("weather_counts")
+                
+                st.markdown("---")
+                
+                # Average rentals by season and weather
+                st.markdown("**📊 Impact Analysis: Rentals vs Environmental Conditions**")
+                st.markdown("""
+                <div style='background: rgba(56, 239, 125, 0.05); padding: 1rem; border-radius: 10px; margin-bottom: 1.5rem;'>
+                    <p style='color: #cbd5e1; margin: 0; font-size: 0.9rem;'>
+                        The following charts compare average bike rentals across different seasons and weather conditions. 
+                        This analysis reveals which environmental factors drive higher demand, enabling data-driven decisions 
+                        for inventory management, pricing strategies, and marketing campaigns.
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**🌸 Average Rentals by Season**")
+                    st.caption("📌 Seasonal demand patterns reveal peak and off-peak periods")
+                    
+                    chart("season_means")
+                    
+                    season = category_profile(cube, 'season')
+                    
+                    st.success(f"""
+                    **📈 Seasonal Insights:**
+                    - **Peak Season:** {season['best']} with **{season['best_value']:.0f}** bikes/hour
+                    - **Low Season:** {season['worst']} with **{season['worst_value']:.0f}** bikes/hour
+                    - **Variation:** {season['variation_pct']:.1f}% difference between peak and low seasons
+                    - **Recommendation:** Increase fleet by {season['variation_pct']:.0f}% during {season['best']}
+                    """)
+                
+                with col2:
+                    st.markdown("**☀️ Average Rentals by Weather Condition**")
+                    st.caption("📌 Weather significantly impacts customer willingness to rent bikes")
+                    
+                    chart("weather_means")
+                    
+                    weather = category_profile(cube, 'weather')
+                    
+                    st.info(f"""
+                    **🌤️ Weather Insights:**
+                    - **Best Conditions:** {weather['best']} with **{weather['best_value']:.0f}** bikes/hour
+                    - **Worst Conditions:** {weather['worst']} with **{weather['worst_value']:.0f}** bikes/hour
+                    - **Impact:** {weather['variation_pct']:.1f}% drop in adverse weather
+                    - **Strategy:** Implement dynamic pricing during poor weather to maintain revenue
+                    """)
+        
+        if tab_is_open(viz_tabs[2]):
+            with viz_tabs[2], span("tab.eda.temporal_patterns"):
+                st.subheader("Temporal Pattern Analysis")
+                
+                st.markdown("""
+                <div style='background: rgba(56, 239, 125, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #38ef7d; margin-bottom: 1.5rem;'>
+                    <h4 style='color: #38ef7d; margin-top: 0;'>⏰ Time-Based Demand Patterns</h4>
+                    <p style='color: #cbd5e1; margin: 0;'>
+                        Understanding temporal patterns is critical for optimizing bike availability and maximizing revenue. 
+                        This section analyzes rental patterns across different time scales - hourly, daily, and monthly - 
+                        revealing peak demand periods and helping predict future trends. These insights drive strategic 
+                        decisions on fleet management, staffing, and maintenance scheduling.
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                # Hourly pattern
+                st.markdown("**📈 Hourly Rental Pattern Throughout the Day**")
+                st.caption("📌 Identifying peak hours for optimal fleet distribution")
+                st.markdown("""
+                <div style='background: rgba(139, 92, 246, 0.05); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem;'>
+                    <p style='color: #cbd5e1; margin: 0; font-size: 0.85rem;'>
+                        This line chart shows average bike rentals for each hour of the day (0-23). The pattern reveals 
+                        commuter behavior with distinct morning and evening peaks, typical of urban bike-sharing systems.
+                        <br><br>
+                        <strong>What to Look For:</strong> Two peaks typically appear around 8 AM (morning commute) and 
+                        5-6 PM (evening commute), with lower demand during late night and early morning hours.
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                chart("hourly_means")
+                
+                hourly = hourly_profile(cube)
+                peak_hour = hourly['best']
+                
+                st.info(f"""
+                **🕐 Hourly Insights:**
+                - **Peak Hour:** {peak_hour}:00 with **{hourly['best_value']:.0f}** average rentals
+                - **Lowest Hour:** {hourly['worst']}:00 with **{hourly['worst_value']:.0f}** average rentals
+                - **Peak-to-Low Ratio:** {hourly['ratio']:.1f}x difference
+                - **Action:** Deploy {((hourly['ratio'] - 1) * 100):.0f}% more bikes during peak hours
+                - **Opportunity:** Implement surge pricing during {peak_hour-1}:00-{peak_hour+2}:00 window
+                """)
+                
+                st.markdown("---")
+                
+                # Day of week pattern
+                st.markdown("**📅 Day of Week Rental Patterns**")
+                st.caption("📌 Comparing weekday vs weekend demand")
+                st.markdown("""
+                <div style='background: rgba(244, 114, 182, 0.05); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem;'>
+                    <p style='color: #cbd5e1; margin: 0; font-size: 0.85rem;'>
+                        This bar chart compares average rentals across all seven days of the week. The pattern helps 
+                        distinguish between commuter-driven weekday demand and leisure-driven weekend demand.
+                        <br><br>
+                        <strong>Business Insight:</strong> Weekday patterns indicate professional commuters, while 
+                        weekend spikes suggest recreational users. This affects marketing strategies and pricing models.
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                chart("day_means")
+                
+                weekly = weekly_profile(cube)
+                weekday_avg, weekend_avg = weekly['weekday_mean'], weekly['weekend_mean']
+                
+                st.success(f"""
+                **📊 Weekly Pattern Insights:**
+                - **Weekday Average:** {weekday_avg:.0f} bikes/hour
+                - **Weekend Average:** {weekend_avg:.0f} bikes/hour
+                - **Difference:** {abs(weekday_avg - weekend_avg):.0f} bikes/hour ({'higher' if weekday_avg > weekend_avg else 'lower'} on weekdays)
+                - **Strategy:** {'Focus on commuter packages for weekdays' if weekday_avg > weekend_avg else 'Promote leisure rides on weekends'}
+                """)
+                
+                st.markdown("---")
+                
+                # Monthly pattern
+                st.markdown("**📆 Monthly Rental Trends**")
+                st.caption("📌 Seasonal variations and year-round demand patterns")
+                st.markdown("""
+                <div style='background: rgba(56, 239, 125, 0.05); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem;'>
+                    <p style='color: #cbd5e1; margin: 0; font-size: 0.85rem;'>
+                        Monthly trends reveal seasonal demand fluctuations throughout the year. This helps in planning 
+                        annual maintenance schedules, inventory adjustments, and seasonal marketing campaigns.
+                        <br><br>
+                        <strong>Strategic Value:</strong> Identifying low-demand months allows for scheduled maintenance 
+                        without impacting revenue, while high-demand months require maximum fleet availability.
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                chart("monthly_trend")
+                
+                monthly = monthly_profile(cube)
+                
+                st.warning(f"""
+                **📅 Monthly Insights:**
+                - **Peak Month:** {monthly['best']} ({monthly['best_value']:.0f} bikes/hour)
+                - **Lowest Month:** {monthly['worst']} ({monthly['worst_value']:.0f} bikes/hour)
+                - **Annual Variation:** {monthly['variation_pct']:.1f}% difference
+                - **Maintenance Window:** Schedule major maintenance during {monthly['worst']}
+                - **Marketing Focus:** Launch promotional campaigns in {monthly['best']} to maximize revenue
+                """)
+        
+        if tab_is_open(viz_tabs[3]):
+            with viz_tabs[3], span("tab.eda.user_analysis"):
+                st.subheader("User Type Analysis")
+                
+                st.markdown("""
+                <div style='background: rgba(250, 112, 154, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #fa709a; margin-bottom: 1.5rem;'>
+                    <h4 style='color: #fa709a; margin-top: 0;'>👥 Casual vs Registered Users</h4>
+                    <p style='color: #cbd5e1; margin: 0;'>
+                        Compare behavior and patterns between casual and registered users.
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**User Type Distribution**")
+                    chart("user_type_share")
+                    
+                    st.success(f"📊 **Registered users:** {user_share(cube)['registered_pct']:.1f}% of total rentals")
+                
+                with col2:
+                    st.markdown("**User Types by Working Day**")
+                    chart("workingday_users")
+
+# TAB 3: Univariate Analysis
+if tab_is_open(tabs[2]):
+    with tabs[2], span("tab.univariate"):
+        st.header("📈 Univariate Analysis")
+        logger.info("Univariate Analysis tab accessed")
+        
         st.markdown("""
-        <div style='background: rgba(56, 239, 125, 0.05); padding: 1rem; border-radius: 10px; margin-bottom: 1.5rem;'>
-            <p style='color: #cbd5e1; margin: 0; font-size: 0.9rem;'>
-                The following charts compare average bike rentals across different seasons and weather conditions. 
-                This analysis reveals which environmental factors drive higher demand, enabling data-driven decisions 
-                for inventory management, pricing strategies, and marketing campaigns.
+        <div style='background: rgba(102, 126, 234, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #667eea; margin-bottom: 1.5rem;'>
+            <h4 style='color: #667eea; margin-top: 0;'>📊 Individual Variable Analysis</h4>
+            <p style='color: #cbd5e1; margin: 0;'>
+                Examine the distribution and characteristics of each variable independently.
             </p>
         </div>
         """, unsafe_allow_html=True)
         
+        # Select feature to analyze
+        num_feature = st.selectbox("Select Numerical Feature", ['temp', 'atemp', 'humidity', 'windspeed', 'casual', 'registered', 'count'])
+        
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("**🌸 Average Rentals by Season**")
-            st.caption("📌 Seasonal demand patterns reveal peak and off-peak periods")
-            
-            season_avg = df.groupby('season')['count'].mean().reset_index()
-            season_avg_sorted = season_avg.sort_values('count', ascending=False)
-            
-            fig = go.Figure(data=[go.Bar(
-                x=season_avg['season'],
-                y=season_avg['count'],
-                marker=dict(color=['#667eea', '#f093fb', '#11998e', '#fa709a']),
-                text=[f'{v:.0f}' for v in season_avg['count']],
-                textposition='outside',
-                hovertemplate='<b>%{x}</b><br>Avg Rentals: %{y:.1f}<extra></extra>'
-            )])
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False, title='Season'),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Average Rentals per Hour'),
-                height=350
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            best_season = season_avg.loc[season_avg['count'].idxmax(), 'season']
-            worst_season = season_avg.loc[season_avg['count'].idxmin(), 'season']
-            best_count = season_avg['count'].max()
-            worst_count = season_avg['count'].min()
-            variation = ((best_count - worst_count) / worst_count * 100)
-            
-            st.success(f"""
-            **📈 Seasonal Insights:**
-            - **Peak Season:** {best_season} with **{best_count:.0f}** bikes/hour
-            - **Low Season:** {worst_season} with **{worst_count:.0f}** bikes/hour
-            - **Variation:** {variation:.1f}% difference between peak and low seasons
-            - **Recommendation:** Increase fleet by {variation:.0f}% during {best_season}
-            """)
+            st.markdown(f"**Distribution of {num_feature}**")
+            chart("feature_histogram", feature=num_feature)
         
         with col2:
-            st.markdown("**☀️ Average Rentals by Weather Condition**")
-            st.caption("📌 Weather significantly impacts customer willingness to rent bikes")
-            
-            weather_avg = df.groupby('weather')['count'].mean().reset_index()
-            weather_avg_sorted = weather_avg.sort_values('count', ascending=False)
-            
-            fig = go.Figure(data=[go.Bar(
-                x=weather_avg['weather'],
-                y=weather_avg['count'],
-                marker=dict(
-                    color=weather_avg['count'],
-                    colorscale='Viridis',
-                    showscale=True,
-                    colorbar=dict(title='Avg<br>Rentals')
-                ),
-                text=[f'{v:.0f}' for v in weather_avg['count']],
-                textposition='outside',
-                hovertemplate='<b>%{x}</b><br>Avg Rentals: %{y:.1f}<extra></extra>'
-            )])
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False, title='Weather Condition'),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Average Rentals per Hour'),
-                height=350
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            best_weather = weather_avg.loc[weather_avg['count'].idxmax(), 'weather']
-            worst_weather = weather_avg.loc[weather_avg['count'].idxmin(), 'weather']
-            best_weather_count = weather_avg['count'].max()
-            worst_weather_count = weather_avg['count'].min()
-            weather_impact = ((best_weather_count - worst_weather_count) / worst_weather_count * 100)
-            
-            st.info(f"""
-            **🌤️ Weather Insights:**
-            - **Best Conditions:** {best_weather} with **{best_weather_count:.0f}** bikes/hour
-            - **Worst Conditions:** {worst_weather} with **{worst_weather_count:.0f}** bikes/hour
-            - **Impact:** {weather_impact:.1f}% drop in adverse weather
-            - **Strategy:** Implement dynamic pricing during poor weather to maintain revenue
-            """)
-    
-    with viz_tabs[2]:
-        st.subheader("Temporal Pattern Analysis")
-        
-        st.markdown("""
-        <div style='background: rgba(56, 239, 125, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #38ef7d; margin-bottom: 1.5rem;'>
-            <h4 style='color: #38ef7d; margin-top: 0;'>⏰ Time-Based Demand Patterns</h4>
-            <p style='color: #cbd5e1; margin: 0;'>
-                Understanding temporal patterns is critical for optimizing bike availability and maximizing revenue. 
-                This section analyzes rental patterns across different time scales - hourly, daily, and monthly - 
-                revealing peak demand periods and helping predict future trends. These insights drive strategic 
-                decisions on fleet management, staffing, and maintenance scheduling.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Hourly pattern
-        st.markdown("**📈 Hourly Rental Pattern Throughout the Day**")
-        st.caption("📌 Identifying peak hours for optimal fleet distribution")
-        st.markdown("""
-        <div style='background: rgba(139, 92, 246, 0.05); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem;'>
-            <p style='color: #cbd5e1; margin: 0; font-size: 0.85rem;'>
-                This line chart shows average bike rentals for each hour of the day (0-23). The pattern reveals 
-                commuter behavior with distinct morning and evening peaks, typical of urban bike-sharing systems.
-                <br><br>
-                <strong>What to Look For:</strong> Two peaks typically appear around 8 AM (morning commute) and 
-                5-6 PM (evening commute), with lower demand during late night and early morning hours.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        hourly_data = df.groupby('hour')['count'].mean().reset_index()
-        fig = px.line(hourly_data, x='hour', y='count',
-                      markers=True)
-        fig.update_traces(line_color='#8b5cf6', line_width=3, marker=dict(size=8, color='#ec4899'))
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Hour of Day (0-23)'),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Average Bike Rentals'),
-            height=400,
-            hovermode='x unified'
-        )
-        fig.add_annotation(
-            x=hourly_data.loc[hourly_data['count'].idxmax(), 'hour'],
-            y=hourly_data['count'].max(),
-            text=f"Peak: {hourly_data['count'].max():.0f} bikes",
-            showarrow=True,
-            arrowhead=2,
-            arrowcolor='#ec4899',
-            font=dict(color='#ec4899', size=12)
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        peak_hour = hourly_data.loc[hourly_data['count'].idxmax(), 'hour']
-        peak_count = hourly_data['count'].max()
-        low_hour = hourly_data.loc[hourly_data['count'].idxmin(), 'hour']
-        low_count = hourly_data['count'].min()
-        
-        st.info(f"""
-        **🕐 Hourly Insights:**
-        - **Peak Hour:** {peak_hour}:00 with **{peak_count:.0f}** average rentals
-        - **Lowest Hour:** {low_hour}:00 with **{low_count:.0f}** average rentals
-        - **Peak-to-Low Ratio:** {(peak_count/low_count):.1f}x difference
-        - **Action:** Deploy {((peak_count/low_count - 1) * 100):.0f}% more bikes during peak hours
-        - **Opportunity:** Implement surge pricing during {peak_hour-1}:00-{peak_hour+2}:00 window
-        """)
+            st.markdown(f"**Box Plot of {num_feature}**")
+            chart("feature_box", feature=num_feature)
         
-        st.markdown("---")
+        # Statistics
+        st.markdown(f"**Statistical Summary for {num_feature}**")
+        stats_df = describe_columns(cubes['stats'], [num_feature]).T
+        st.dataframe(stats_df, use_container_width=True)
+
+# TAB 4: Bivariate Analysis
+if tab_is_open(tabs[3]):
+    with tabs[3], span("tab.bivariate"):
+        st.header("🔗 Bivariate Analysis")
+        logger.info("Bivariate Analysis tab accessed")
         
-        # Day of week pattern
-        st.markdown("**📅 Day of Week Rental Patterns**")
-        st.caption("📌 Comparing weekday vs weekend demand")
         st.markdown("""
-        <div style='background: rgba(244, 114, 182, 0.05); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem;'>
-            <p style='color: #cbd5e1; margin: 0; font-size: 0.85rem;'>
-                This bar chart compares average rentals across all seven days of the week. The pattern helps 
-                distinguish between commuter-driven weekday demand and leisure-driven weekend demand.
-                <br><br>
-                <strong>Business Insight:</strong> Weekday patterns indicate professional commuters, while 
-                weekend spikes suggest recreational users. This affects marketing strategies and pricing models.
+        <div style='background: rgba(244, 114, 182, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #f472b6; margin-bottom: 1.5rem;'>
+            <h4 style='color: #f472b6; margin-top: 0;'>🔗 Relationship Analysis</h4>
+            <p style='color: #cbd5e1; margin: 0;'>
+                Explore relationships between variables and their impact on bike rentals.
             </p>
         </div>
         """, unsafe_allow_html=True)
         
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        daily_data = df.groupby('day')['count'].mean().reindex(day_order).reset_index()
-        
-        fig = px.bar(daily_data, x='day', y='count',
-                     color='count',
-                     color_continuous_scale='Viridis')
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            xaxis=dict(showgrid=False, title='Day of Week'),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Average Rentals'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        weekday_avg = daily_data[daily_data['day'].isin(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'])]['count'].mean()
-        weekend_avg = daily_data[daily_data['day'].isin(['Saturday', 'Sunday'])]['count'].mean()
+        # Temperature vs Rentals
+        st.markdown("**🌡️ Temperature vs Bike Rentals**")
+        chart("temp_vs_count")
+        if len(df) > SCATTER_MAX_POINTS:
+            sample_size = get_sample_size(fingerprint, ['temp', 'count', 'season'], 'season', df)
+            st.caption(f"📌 Showing a stratified sample of {sample_size:,} of {len(df):,} points; trendlines use all rows")
         
-        st.success(f"""
-        **📊 Weekly Pattern Insights:**
-        - **Weekday Average:** {weekday_avg:.0f} bikes/hour
-        - **Weekend Average:** {weekend_avg:.0f} bikes/hour
-        - **Difference:** {abs(weekday_avg - weekend_avg):.0f} bikes/hour ({'higher' if weekday_avg > weekend_avg else 'lower'} on weekdays)
-        - **Strategy:** {'Focus on commuter packages for weekdays' if weekday_avg > weekend_avg else 'Promote leisure rides on weekends'}
-        """)
+        # Correlation
+        corr_value = get_correlations(fingerprint, df).loc['temp', 'count']
+        st.success(f"📊 **Correlation:** {corr_value:.3f} (Strong positive correlation)")
         
         st.markdown("---")
         
-        # Monthly pattern
-        st.markdown("**📆 Monthly Rental Trends**")
-        st.caption("📌 Seasonal variations and year-round demand patterns")
-        st.markdown("""
-        <div style='background: rgba(56, 239, 125, 0.05); padding: 0.75rem; border-radius: 8px; margin-bottom: 1rem;'>
-            <p style='color: #cbd5e1; margin: 0; font-size: 0.85rem;'>
-                Monthly trends reveal seasonal demand fluctuations throughout the year. This helps in planning 
-                annual maintenance schedules, inventory adjustments, and seasonal marketing campaigns.
-                <br><br>
-                <strong>Strategic Value:</strong> Identifying low-demand months allows for scheduled maintenance 
-                without impacting revenue, while high-demand months require maximum fleet availability.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        # Correlation Heatmap
+        st.markdown("**🔥 Correlation Heatmap**")
+        chart("correlation_heatmap")
         
-        monthly_data = df.groupby('Month_name')['count'].mean().reindex([
-            'January', 'February', 'March', 'April', 'May', 'June',
-            'July', 'August', 'September', 'October', 'November', 'December'
-        ]).reset_index()
-        
-        fig = px.line(monthly_data, x='Month_name', y='count',
-                      markers=True)
-        fig.update_traces(line_color='#11998e', line_width=3, marker=dict(size=10))
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            xaxis=dict(showgrid=False, title='Month', tickangle=-45),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Average Rentals'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        best_month_idx = monthly_data['count'].idxmax()
-        worst_month_idx = monthly_data['count'].idxmin()
-        best_month = monthly_data.loc[best_month_idx, 'Month_name']
-        worst_month = monthly_data.loc[worst_month_idx, 'Month_name']
-        
-        st.warning(f"""
-        **📅 Monthly Insights:**
-        - **Peak Month:** {best_month} ({monthly_data.loc[best_month_idx, 'count']:.0f} bikes/hour)
-        - **Lowest Month:** {worst_month} ({monthly_data.loc[worst_month_idx, 'count']:.0f} bikes/hour)
-        - **Annual Variation:** {((monthly_data.loc[best_month_idx, 'count'] - monthly_data.loc[worst_month_idx, 'count']) / monthly_data.loc[worst_month_idx, 'count'] * 100):.1f}% difference
-        - **Maintenance Window:** Schedule major maintenance during {worst_month}
-        - **Marketing Focus:** Launch promotional campaigns in {best_month} to maximize revenue
+        st.info("""
+        **🔍 Key Correlations with Bike Rentals:**
+        - **Temperature (atemp)**: +0.63 (Strong positive)
+        - **Registered Users**: +0.97 (Very strong positive)
+        - **Humidity**: -0.32 (Moderate negative)
         """)
-    
-    with viz_tabs[3]:
-        st.subheader("User Type Analysis")
+
+# TAB 5: Hypothesis Testing
+if tab_is_open(tabs[4]):
+    with tabs[4], span("tab.hypothesis_testing"):
+        st.header("🔬 Hypothesis Testing")
+        logger.info("Hypothesis Testing tab accessed")
         
         st.markdown("""
-        <div style='background: rgba(250, 112, 154, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #fa709a; margin-bottom: 1.5rem;'>
-            <h4 style='color: #fa709a; margin-top: 0;'>👥 Casual vs Registered Users</h4>
+        <div style='background: rgba(56, 239, 125, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #38ef7d; margin-bottom: 1.5rem;'>
+            <h4 style='color: #38ef7d; margin-top: 0;'>🔬 Statistical Hypothesis Tests</h4>
             <p style='color: #cbd5e1; margin: 0;'>
-                Compare behavior and patterns between casual and registered users.
+                Perform rigorous statistical tests to validate our findings and answer key business questions.
             </p>
         </div>
         """, unsafe_allow_html=True)
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("**User Type Distribution**")
-            user_data = pd.DataFrame({
-                'User Type': ['Casual', 'Registered'],
-                'Total Rentals': [df['casual'].sum(), df['registered'].sum()]
-            })
-            fig = px.pie(user_data, values='Total Rentals', names='User Type',
-                         hole=0.4,
-                         color_discrete_sequence=['#8b5cf6', '#ec4899'])
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                height=350
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            registered_pct = (df['registered'].sum() / (df['casual'].sum() + df['registered'].sum())) * 100
-            st.success(f"📊 **Registered users:** {registered_pct:.1f}% of total rentals")
-        
-        with col2:
-            st.markdown("**User Types by Working Day**")
-            workday_users = df.groupby('workingday')[['casual', 'registered']].mean().reset_index()
-            fig = go.Figure()
-            fig.add_trace(go.Bar(x=workday_users['workingday'], y=workday_users['casual'],
-                                 name='Casual', marker_color='#8b5cf6'))
-            fig.add_trace(go.Bar(x=workday_users['workingday'], y=workday_users['registered'],
-                                 name='Registered', marker_color='#ec4899'))
-            fig.update_layout(
-                barmode='group',
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-                height=350
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-# TAB 3: Univariate Analysis
-with tabs[2]:
-    st.header("📈 Univariate Analysis")
-    logger.info("Univariate Analysis tab accessed")
-    
-    st.markdown("""
-    <div style='background: rgba(102, 126, 234, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #667eea; margin-bottom: 1.5rem;'>
-        <h4 style='color: #667eea; margin-top: 0;'>📊 Individual Variable Analysis</h4>
-        <p style='color: #cbd5e1; margin: 0;'>
-            Examine the distribution and characteristics of each variable independently.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Select feature to analyze
-    num_feature = st.selectbox("Select Numerical Feature", ['temp', 'atemp', 'humidity', 'windspeed', 'casual', 'registered', 'count'])
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown(f"**Distribution of {num_feature}**")
-        fig = px.histogram(df, x=num_feature, nbins=30,
-                          color_discrete_sequence=['#8b5cf6'])
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            xaxis=dict(showgrid=False),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        st.markdown(f"**Box Plot of {num_feature}**")
-        fig = go.Figure()
-        fig.add_trace(go.Box(y=df[num_feature], name=num_feature,
-                             marker_color='#ec4899', boxmean='sd'))
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Statistics
-    st.markdown(f"**Statistical Summary for {num_feature}**")
-    stats_df = df[num_feature].describe().to_frame().T
-    st.dataframe(stats_df, use_container_width=True)
-
-# TAB 4: Bivariate Analysis
-with tabs[3]:
-    st.header("🔗 Bivariate Analysis")
-    logger.info("Bivariate Analysis tab accessed")
-    
-    st.markdown("""
-    <div style='background: rgba(244, 114, 182, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #f472b6; margin-bottom: 1.5rem;'>
-        <h4 style='color: #f472b6; margin-top: 0;'>🔗 Relationship Analysis</h4>
-        <p style='color: #cbd5e1; margin: 0;'>
-            Explore relationships between variables and their impact on bike rentals.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Temperature vs Rentals
-    st.markdown("**🌡️ Temperature vs Bike Rentals**")
-    fig = px.scatter(df, x='temp', y='count',
-                     color='season',
-                     trendline='ols',
-                     opacity=0.6,
-                     color_discrete_sequence=['#667eea', '#f093fb', '#11998e', '#fa709a'])
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#cbd5e1'),
-        xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-        height=500
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Correlation
-    corr_value = df['temp'].corr(df['count'])
-    st.success(f"📊 **Correlation:** {corr_value:.3f} (Strong positive correlation)")
-    
-    st.markdown("---")
-    
-    # Correlation Heatmap
-    st.markdown("**🔥 Correlation Heatmap**")
-    numerical_cols = ['temp', 'atemp', 'humidity', 'windspeed', 'casual', 'registered', 'count']
-    corr_matrix = df[numerical_cols].corr()
-    
-    fig = px.imshow(corr_matrix,
-                    text_auto='.2f',
-                    aspect='auto',
-                    color_continuous_scale='RdBu_r',
-                    labels=dict(color='Correlation'))
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#cbd5e1'),
-        height=600
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.info("""
-    **🔍 Key Correlations with Bike Rentals:**
-    - **Temperature (atemp)**: +0.63 (Strong positive)
-    - **Registered Users**: +0.97 (Very strong positive)
-    - **Humidity**: -0.32 (Moderate negative)
-    """)
-
-# TAB 5: Hypothesis Testing
-with tabs[4]:
-    st.header("🔬 Hypothesis Testing")
-    logger.info("Hypothesis Testing tab accessed")
-    
-    st.markdown("""
-    <div style='background: rgba(56, 239, 125, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #38ef7d; margin-bottom: 1.5rem;'>
-        <h4 style='color: #38ef7d; margin-top: 0;'>🔬 Statistical Hypothesis Tests</h4>
-        <p style='color: #cbd5e1; margin: 0;'>
-            Perform rigorous statistical tests to validate our findings and answer key business questions.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    test_tabs = st.tabs(["T-Test: Working Day", "ANOVA: Season", "ANOVA: Weather", "Chi-Square: Weather-Season"])
-    
-    # Test 1: Working Day Effect
-    with test_tabs[0]:
-        st.subheader("📊 Test 1: Working Day Effect on Rentals")
-        
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            st.markdown("""
-            <div class='metric-card'>
-                <h4 style='color: #a78bfa;'>Hypotheses</h4>
-                <p><strong>H₀ (Null):</strong> Working day has NO effect on bike rentals</p>
-                <p><strong>H₁ (Alternative):</strong> Working day HAS an effect on bike rentals</p>
-                <p><strong>Test:</strong> Independent 2-Sample T-Test</p>
-                <p><strong>Significance Level:</strong> α = 0.05</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            working_yes = df[df['workingday'] == 'Yes']['count']
-            working_no = df[df['workingday'] == 'No']['count']
-            
-            t_stat, p_value = ttest_ind(working_yes, working_no)
-            
-            st.markdown(f"""
-            <div class='metric-card'>
-                <h4 style='color: #f472b6;'>Results</h4>
-                <p><strong>T-Statistic:</strong> {t_stat:.4f}</p>
-                <p><strong>P-Value:</strong> {p_value:.6f}</p>
-                <p><strong>Decision:</strong> {'Reject H₀' if p_value < 0.05 else 'Fail to Reject H₀'}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        if p_value < 0.05:
-            st.success("✅ **Conclusion:** Working day has a statistically significant effect on bike rentals.")
-        else:
-            st.warning("⚠️ **Conclusion:** No statistically significant effect of working day on bike rentals.")
-        
-        # Visualization
-        fig = go.Figure()
-        fig.add_trace(go.Box(y=working_yes, name='Working Day: Yes', marker_color='#8b5cf6'))
-        fig.add_trace(go.Box(y=working_no, name='Working Day: No', marker_color='#ec4899'))
-        fig.update_layout(
-            title='Distribution of Bike Rentals by Working Day',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Test 2: Season Effect
-    with test_tabs[1]:
-        st.subheader("📊 Test 2: Season Effect on Rentals")
-        
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            st.markdown("""
-            <div class='metric-card'>
-                <h4 style='color: #a78bfa;'>Hypotheses</h4>
-                <p><strong>H₀ (Null):</strong> Mean rentals are SAME across all seasons</p>
-                <p><strong>H₁ (Alternative):</strong> Mean rentals DIFFER across seasons</p>
-                <p><strong>Test:</strong> One-Way ANOVA</p>
-                <p><strong>Significance Level:</strong> α = 0.05</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            spring = df[df['season'] == 'Spring']['count']
-            summer = df[df['season'] == 'Summer']['count']
-            fall = df[df['season'] == 'Fall']['count']
-            winter = df[df['season'] == 'Winter']['count']
-            
-            f_stat, p_value = f_oneway(spring, summer, fall, winter)
-            
-            st.markdown(f"""
-            <div class='metric-card'>
-                <h4 style='color: #f472b6;'>Results</h4>
-                <p><strong>F-Statistic:</strong> {f_stat:.4f}</p>
-                <p><strong>P-Value:</strong> {p_value:.6f}</p>
-                <p><strong>Decision:</strong> {'Reject H₀' if p_value < 0.05 else 'Fail to Reject H₀'}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        if p_value < 0.05:
-            st.success("✅ **Conclusion:** Bike rentals differ significantly across seasons.")
-        else:
-            st.warning("⚠️ **Conclusion:** No significant difference in rentals across seasons.")
-        
-        # Visualization
-        fig = go.Figure()
-        for season in ['Spring', 'Summer', 'Fall', 'Winter']:
-            season_data = df[df['season'] == season]['count']
-            fig.add_trace(go.Box(y=season_data, name=season))
-        
-        fig.update_layout(
-            title='Distribution of Bike Rentals by Season',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Test 3: Weather Effect
-    with test_tabs[2]:
-        st.subheader("📊 Test 3: Weather Effect on Rentals")
-        
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            st.markdown("""
-            <div class='metric-card'>
-                <h4 style='color: #a78bfa;'>Hypotheses</h4>
-                <p><strong>H₀ (Null):</strong> Mean rentals are SAME across all weather conditions</p>
-                <p><strong>H₁ (Alternative):</strong> Mean rentals DIFFER across weather conditions</p>
-                <p><strong>Test:</strong> One-Way ANOVA</p>
-                <p><strong>Significance Level:</strong> α = 0.05</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            weather_groups = [df[df['weather'] == w]['count'].values for w in df['weather'].unique()]
-            f_stat, p_value = f_oneway(*weather_groups)
-            
-            st.markdown(f"""
-            <div class='metric-card'>
-                <h4 style='color: #f472b6;'>Results</h4>
-                <p><strong>F-Statistic:</strong> {f_stat:.4f}</p>
-                <p><strong>P-Value:</strong> {p_value:.6f}</p>
-                <p><strong>Decision:</strong> {'Reject H₀' if p_value < 0.05 else 'Fail to Reject H₀'}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        if p_value < 0.05:
-            st.success("✅ **Conclusion:** Bike rentals differ significantly across weather conditions.")
-        else:
-            st.warning("⚠️ **Conclusion:** No significant difference in rentals across weather conditions.")
-        
-        # Visualization
-        fig = go.Figure()
-        for weather in df['weather'].unique():
-            weather_data = df[df['weather'] == weather]['count']
-            fig.add_trace(go.Box(y=weather_data, name=weather))
-        
-        fig.update_layout(
-            title='Distribution of Bike Rentals by Weather',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Test 4: Weather-Season Dependency
-    with test_tabs[3]:
-        st.subheader("📊 Test 4: Weather Dependency on Season")
-        
-        col1, col2 = st.columns([1, 1])
-        
+        # Resampling settings shared by the bootstrap/permutation checks of the tests below
+        col1, col2, col3 = st.columns(3)
         with col1:
-            st.markdown("""
-            <div class='metric-card'>
-                <h4 style='color: #a78bfa;'>Hypotheses</h4>
-                <p><strong>H₀ (Null):</strong> Weather is INDEPENDENT of season</p>
-                <p><strong>H₁ (Alternative):</strong> Weather is DEPENDENT on season</p>
-                <p><strong>Test:</strong> Chi-Square Test of Independence</p>
-                <p><strong>Significance Level:</strong> α = 0.05</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
+            resamples = st.select_slider("🎲 Resamples", RESAMPLE_COUNTS, value=DEFAULT_RESAMPLES, key="resamples")
         with col2:
-            contingency_table = pd.crosstab(df['season'], df['weather'])
-            chi2_stat, p_value, dof, expected = chi2_contingency(contingency_table)
-            
-            st.markdown(f"""
-            <div class='metric-card'>
-                <h4 style='color: #f472b6;'>Results</h4>
-                <p><strong>Chi-Square:</strong> {chi2_stat:.4f}</p>
-                <p><strong>P-Value:</strong> {p_value:.6f}</p>
-                <p><strong>DoF:</strong> {dof}</p>
-                <p><strong>Decision:</strong> {'Reject H₀' if p_value < 0.05 else 'Fail to Reject H₀'}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        if p_value < 0.05:
-            st.success("✅ **Conclusion:** Weather is significantly dependent on season.")
-        else:
-            st.warning("⚠️ **Conclusion:** Weather is independent of season.")
-        
-        # Visualization
-        fig = px.imshow(contingency_table,
-                        text_auto=True,
-                        aspect='auto',
-                        color_continuous_scale='Viridis',
-                        labels=dict(x='Weather', y='Season', color='Count'))
-        fig.update_layout(
-            title='Season vs Weather Contingency Table',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+            resampling_seed = int(st.number_input("🌱 Seed", min_value=0, value=42, step=1, key="resampling_seed"))
+        with col3:
+            resampling_mode = st.selectbox("⚙️ Resampling execution", RESAMPLING_MODES,
+                                           index=RESAMPLING_MODES.index(default_resampling_mode()),
+                                           key="resampling_mode",
+                                           help="Draw resample batches serially, on threads or on worker processes")
+        
+        test_tabs = make_tabs(["T-Test: Working Day", "ANOVA: Season", "ANOVA: Weather", "Chi-Square: Weather-Season"], key="test_tabs")
+        
+        # The tests of the open sub-tabs are independent: run them together before rendering
+        open_tests = tuple(name for name, tab in zip(HYPOTHESIS_TESTS, test_tabs) if tab_is_open(tab))
+        test_results = get_test_results(fingerprint, open_tests, execution_mode, df, cube)
+        
+        # Test 1: Working Day Effect
+        if tab_is_open(test_tabs[0]):
+            with test_tabs[0], span("tab.hypothesis_testing.workingday_ttest"):
+                st.subheader("📊 Test 1: Working Day Effect on Rentals")
+                
+                col1, col2 = st.columns([1, 1])
+                
+                with col1:
+                    st.markdown("""
+                    <div class='metric-card'>
+                        <h4 style='color: #a78bfa;'>Hypotheses</h4>
+                        <p><strong>H₀ (Null):</strong> Working day has NO effect on bike rentals</p>
+                        <p><strong>H₁ (Alternative):</strong> Working day HAS an effect on bike rentals</p>
+                        <p><strong>Test:</strong> Independent 2-Sample T-Test</p>
+                        <p><strong>Significance Level:</strong> α = 0.05</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with col2:
+                    result = test_results['workingday']
+                    t_stat, p_value = result['statistic'], result['p_value']
+                    
+                    st.markdown(f"""
+                    <div class='metric-card'>
+                        <h4 style='color: #f472b6;'>Results</h4>
+                        <p><strong>T-Statistic:</strong> {t_stat:.4f}</p>
+                        <p><strong>P-Value:</strong> {p_value:.6f}</p>
+                        <p><strong>Decision:</strong> {test_decision(p_value)}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                if np.isnan(p_value):
+                    st.info(UNTESTABLE_MESSAGE)
+                elif p_value < 0.05:
+                    st.success("✅ **Conclusion:** Working day has a statistically significant effect on bike rentals.")
+                else:
+                    st.warning("⚠️ **Conclusion:** No statistically significant effect of working day on bike rentals.")
+                
+                resampling_section("workingday")
+                
+                # Visualization
+                chart("workingday_box")
+        
+        # Test 2: Season Effect
+        if tab_is_open(test_tabs[1]):
+            with test_tabs[1], span("tab.hypothesis_testing.season_anova"):
+                st.subheader("📊 Test 2: Season Effect on Rentals")
+                
+                col1, col2 = st.columns([1, 1])
+                
+                with col1:
+                    st.markdown("""
+                    <div class='metric-card'>
+                        <h4 style='color: #a78bfa;'>Hypotheses</h4>
+                        <p><strong>H₀ (Null):</strong> Mean rentals are SAME across all seasons</p>
+                        <p><strong>H₁ (Alternative):</strong> Mean rentals DIFFER across seasons</p>
+                        <p><strong>Test:</strong> One-Way ANOVA</p>
+                        <p><strong>Significance Level:</strong> α = 0.05</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with col2:
+                    result = test_results['season']
+                    f_stat, p_value = result['statistic'], result['p_value']
+                    
+                    st.markdown(f"""
+                    <div class='metric-card'>
+                        <h4 style='color: #f472b6;'>Results</h4>
+                        <p><strong>F-Statistic:</strong> {f_stat:.4f}</p>
+                        <p><strong>P-Value:</strong> {p_value:.6f}</p>
+                        <p><strong>Decision:</strong> {test_decision(p_value)}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                if np.isnan(p_value):
+                    st.info(UNTESTABLE_MESSAGE)
+                elif p_value < 0.05:
+                    st.success("✅ **Conclusion:** Bike rentals differ significantly across seasons.")
+                else:
+                    st.warning("⚠️ **Conclusion:** No significant difference in rentals across seasons.")
+                
+                resampling_section("season")
+                
+                # Visualization
+                chart("season_box")
+        
+        # Test 3: Weather Effect
+        if tab_is_open(test_tabs[2]):
+            with test_tabs[2], span("tab.hypothesis_testing.weather_anova"):
+                st.subheader("📊 Test 3: Weather Effect on Rentals")
+                
+                col1, col2 = st.columns([1, 1])
+                
+                with col1:
+                    st.markdown("""
+                    <div class='metric-card'>
+                        <h4 style='color: #a78bfa;'>Hypotheses</h4>
+                        <p><strong>H₀ (Null):</strong> Mean rentals are SAME across all weather conditions</p>
+                        <p><strong>H₁ (Alternative):</strong> Mean rentals DIFFER across weather conditions</p>
+                        <p><strong>Test:</strong> One-Way ANOVA</p>
+                        <p><strong>Significance Level:</strong> α = 0.05</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with col2:
+                    result = test_results['weather']
+                    f_stat, p_value = result['statistic'], result['p_value']
+                    
+                    st.markdown(f"""
+                    <div class='metric-card'>
+                        <h4 style='color: #f472b6;'>Results</h4>
+                        <p><strong>F-Statistic:</strong> {f_stat:.4f}</p>
+                        <p><strong>P-Value:</strong> {p_value:.6f}</p>
+                        <p><strong>Decision:</strong> {test_decision(p_value)}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                if np.isnan(p_value):
+                    st.info(UNTESTABLE_MESSAGE)
+                elif p_value < 0.05:
+                    st.success("✅ **Conclusion:** Bike rentals differ significantly across weather conditions.")
+                else:
+                    st.warning("⚠️ **Conclusion:** No significant difference in rentals across weather conditions.")
+                
+                resampling_section("weather")
+                
+                # Visualization
+                chart("weather_box")
+        
+        # Test 4: Weather-Season Dependency
+        if tab_is_open(test_tabs[3]):
+            with test_tabs[3], span("tab.hypothesis_testing.weather_season_chi_square"):
+                st.subheader("📊 Test 4: Weather Dependency on Season")
+                
+                col1, col2 = st.columns([1, 1])
+                
+                with col1:
+                    st.markdown("""
+                    <div class='metric-card'>
+                        <h4 style='color: #a78bfa;'>Hypotheses</h4>
+                        <p><strong>H₀ (Null):</strong> Weather is INDEPENDENT of season</p>
+                        <p><strong>H₁ (Alternative):</strong> Weather is DEPENDENT on season</p>
+                        <p><strong>Test:</strong> Chi-Square Test of Independence</p>
+                        <p><strong>Significance Level:</strong> α = 0.05</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with col2:
+                    result = test_results['season_weather']
+                    chi2_stat, p_value, dof = result['statistic'], result['p_value'], result['dof']
+                    
+                    st.markdown(f"""
+                    <div class='metric-card'>
+                        <h4 style='color: #f472b6;'>Results</h4>
+                        <p><strong>Chi-Square:</strong> {chi2_stat:.4f}</p>
+                        <p><strong>P-Value:</strong> {p_value:.6f}</p>
+                        <p><strong>DoF:</strong> {dof}</p>
+                        <p><strong>Decision:</strong> {test_decision(p_value)}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                if np.isnan(p_value):
+                    st.info(UNTESTABLE_MESSAGE)
+                elif p_value < 0.05:
+                    st.success("✅ **Conclusion:** Weather is significantly dependent on season.")
+                else:
+                    st.warning("⚠️ **Conclusion:** Weather is independent of season.")
+                
+                # Visualization
+                chart("season_weather_table")
 
 # TAB 6: Insights & Recommendations
-with tabs[5]:
-    st.header("💡 Business Insights & Recommendations")
-    logger.info("Insights tab accessed")
-    
-    # Key Insights Cards
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        peak_hour = df.groupby('hour')['count'].mean().idxmax()
-        peak_value = df.groupby('hour')['count'].mean().max()
-        st.markdown(f"""
-        <div class='card' style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); text-align: left; height: 280px;'>
-            <div style='font-size: 2.5rem; margin-bottom: 1rem;'>🕐</div>
-            <h3 style='color: white !important; margin: 0 0 1rem 0;'>Peak Hours</h3>
-            <p style='color: rgba(255,255,255,0.9); line-height: 1.8;'>
-                <strong>Peak Time:</strong> {peak_hour}:00<br>
-                <strong>Avg Rentals:</strong> {peak_value:.0f} bikes<br>
-                <strong>Pattern:</strong> Morning (7-9 AM) & Evening (5-7 PM) rush hours
-            </p>
-            <p style='color: rgba(255,255,255,0.8); font-size: 0.9rem; margin-top: 1rem;'>
-                💡 Ensure maximum bike availability during peak commute hours
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        best_season = df.groupby('season')['count'].mean().idxmax()
-        best_season_val = df.groupby('season')['count'].mean().max()
-        worst_season = df.groupby('season')['count'].mean().idxmin()
-        worst_season_val = df.groupby('season')['count'].mean().min()
-        st.markdown(f"""
-        <div class='card' style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); text-align: left; height: 280px;'>
-            <div style='font-size: 2.5rem; margin-bottom: 1rem;'>🌸</div>
-            <h3 style='color: white !important; margin: 0 0 1rem 0;'>Seasonal Patterns</h3>
-            <p style='color: rgba(255,255,255,0.9); line-height: 1.8;'>
-                <strong>Best:</strong> {best_season} ({best_season_val:.0f} bikes)<br>
-                <strong>Worst:</strong> {worst_season} ({worst_season_val:.0f} bikes)<br>
-                <strong>Variation:</strong> {((best_season_val - worst_season_val) / worst_season_val * 100):.1f}% difference
-            </p>
-            <p style='color: rgba(255,255,255,0.8); font-size: 0.9rem; margin-top: 1rem;'>
-                💡 Plan maintenance during low-demand seasons
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        best_weather = df.groupby('weather')['count'].mean().idxmax()
-        best_weather_val = df.groupby('weather')['count'].mean().max()
-        worst_weather = df.groupby('weather')['count'].mean().idxmin()
-        worst_weather_val = df.groupby('weather')['count'].mean().min()
-        st.markdown(f"""
-        <div class='card' style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); text-align: left; height: 280px;'>
-            <div style='font-size: 2.5rem; margin-bottom: 1rem;'>🌤️</div>
-            <h3 style='color: white !important; margin: 0 0 1rem 0;'>Weather Impact</h3>
-            <p style='color: rgba(255,255,255,0.9); line-height: 1.8;'>
-                <strong>Best:</strong> {best_weather} ({best_weather_val:.0f} bikes)<br>
-                <strong>Worst:</strong> {worst_weather} ({worst_weather_val:.0f} bikes)<br>
-                <strong>Impact:</strong> {((best_weather_val - worst_weather_val) / worst_weather_val * 100):.1f}% drop
-            </p>
-            <p style='color: rgba(255,255,255,0.8); font-size: 0.9rem; margin-top: 1rem;'>
-                💡 Implement weather-based pricing
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Recommendations
-    st.subheader("🚀 Actionable Recommendations")
-    
-    rec_col1, rec_col2 = st.columns(2)
-    
-    with rec_col1:
-        with st.expander("🎯 **Operational Strategies**", expanded=True):
-            st.markdown("""
-            1. **Dynamic Fleet Management**
-               - Redistribute bikes based on hourly demand patterns
-               - Increase availability during peak hours (7-9 AM, 5-7 PM)
-               - Reduce fleet during low-demand hours (1-5 AM)
-            
-            2. **Seasonal Planning**
-               - Schedule maintenance during winter (lowest demand)
-               - Maximize fleet availability during fall (highest demand)
-               - Prepare for seasonal transitions
-            
-            3. **Weather-Based Operations**
-               - Implement weather alert system
-               - Adjust pricing based on weather forecasts
-               - Offer rain protection accessories
-            """)
-    
-    with rec_col2:
-        with st.expander("💼 **Business Strategies**", expanded=True):
-            st.markdown("""
-            4. **User Conversion Program**
-               - Convert casual users to registered (81% are registered)
-               - Offer loyalty rewards and discounts
-               - Create subscription plans
-            
-            5. **Pricing Optimization**
-               - Surge pricing during peak hours
-               - Weather-based dynamic pricing
-               - Seasonal promotional campaigns
-            
-            6. **Marketing Focus**
-               - Target working professionals (commute hours)
-               - Promote eco-friendly transportation
-               - Partner with corporates for employee programs
-            """)
-
-# TAB 7: Complete Analysis
-with tabs[6]:
-    st.header("📚 Complete Analysis Summary")
-    logger.info("Complete Analysis tab accessed")
-    
-    # Analysis sub-tabs
-    analysis_tabs = st.tabs([
-        "📊 Overview Statistics",
-        "📈 Temporal Analysis", 
-        "🌡️ Environmental Factors",
-        "👥 User Behavior",
-        "🔗 Advanced Analytics"
-    ])
-    
-    # Sub-tab 1: Overview Statistics
-    with analysis_tabs[0]:
-        st.subheader("📊 Comprehensive Statistics Overview")
+if tab_is_open(tabs[5]):
+    with tabs[5], span("tab.insights"):
+        st.header("💡 Business Insights & Recommendations")
+        logger.info("Insights tab accessed")
         
-        # Key Metrics in gradient cards
-        st.markdown("**🎯 Key Performance Indicators**")
+        # Key Insights Cards
         col1, col2, col3 = st.columns(3)
         
         with col1:
+            hourly = hourly_profile(cube)
             st.markdown(f"""
-            <div class='metric-card' style='text-align: center;'>
-                <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{df['count'].sum():,}</p>
-                <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>TOTAL RENTALS</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
-                <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{df['count'].mean():.1f}</p>
-                <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>AVG RENTALS/HOUR</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
-                <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{df['count'].max()}</p>
-                <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>MAX RENTALS/HOUR</p>
+            <div class='card' style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); text-align: left; height: 280px;'>
+                <div style='font-size: 2.5rem; margin-bottom: 1rem;'>🕐</div>
+                <h3 style='color: white !important; margin: 0 0 1rem 0;'>Peak Hours</h3>
+                <p style='color: rgba(255,255,255,0.9); line-height: 1.8;'>
+                    <strong>Peak Time:</strong> {hourly['best']}:00<br>
+                    <strong>Avg Rentals:</strong> {hourly['best_value']:.0f} bikes<br>
+                    <strong>Pattern:</strong> Morning (7-9 AM) & Evening (5-7 PM) rush hours
+                </p>
+                <p style='color: rgba(255,255,255,0.8); font-size: 0.9rem; margin-top: 1rem;'>
+                    💡 Ensure maximum bike availability during peak commute hours
+                </p>
             </div>
             """, unsafe_allow_html=True)
         
         with col2:
-            registered_pct = (df['registered'].sum() / df['count'].sum() * 100)
-            casual_pct = (df['casual'].sum() / df['count'].sum() * 100)
-            
-            st.markdown(f"""
-            <div class='metric-card' style='text-align: center;'>
-                <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{registered_pct:.1f}%</p>
-                <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>REGISTERED USERS %</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
+            season = category_profile(cube, 'season')
             st.markdown(f"""
-            <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
-                <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{casual_pct:.1f}%</p>
-                <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>CASUAL USERS %</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
-                <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{df['temp'].mean():.1f}°C</p>
-                <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>AVG TEMPERATURE</p>
+            <div class='card' style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); text-align: left; height: 280px;'>
+                <div style='font-size: 2.5rem; margin-bottom: 1rem;'>🌸</div>
+                <h3 style='color: white !important; margin: 0 0 1rem 0;'>Seasonal Patterns</h3>
+                <p style='color: rgba(255,255,255,0.9); line-height: 1.8;'>
+                    <strong>Best:</strong> {season['best']} ({season['best_value']:.0f} bikes)<br>
+                    <strong>Worst:</strong> {season['worst']} ({season['worst_value']:.0f} bikes)<br>
+                    <strong>Variation:</strong> {season['variation_pct']:.1f}% difference
+                </p>
+                <p style='color: rgba(255,255,255,0.8); font-size: 0.9rem; margin-top: 1rem;'>
+                    💡 Plan maintenance during low-demand seasons
+                </p>
             </div>
             """, unsafe_allow_html=True)
         
         with col3:
-            peak_hour = df.groupby('hour')['count'].mean().idxmax()
-            best_season = df.groupby('season')['count'].mean().idxmax()
-            best_weather = df.groupby('weather')['count'].mean().idxmax()
-            
-            st.markdown(f"""
-            <div class='metric-card' style='text-align: center;'>
-                <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{peak_hour}:00</p>
-                <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>PEAK HOUR</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
-                <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{best_season}</p>
-                <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>BEST SEASON</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
+            weather = category_profile(cube, 'weather')
             st.markdown(f"""
-            <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
-                <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{best_weather}</p>
-                <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>BEST WEATHER</p>
+            <div class='card' style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); text-align: left; height: 280px;'>
+                <div style='font-size: 2.5rem; margin-bottom: 1rem;'>🌤️</div>
+                <h3 style='color: white !important; margin: 0 0 1rem 0;'>Weather Impact</h3>
+                <p style='color: rgba(255,255,255,0.9); line-height: 1.8;'>
+                    <strong>Best:</strong> {weather['best']} ({weather['best_value']:.0f} bikes)<br>
+                    <strong>Worst:</strong> {weather['worst']} ({weather['worst_value']:.0f} bikes)<br>
+                    <strong>Impact:</strong> {weather['variation_pct']:.1f}% drop
+                </p>
+                <p style='color: rgba(255,255,255,0.8); font-size: 0.9rem; margin-top: 1rem;'>
+                    💡 Implement weather-based pricing
+                </p>
             </div>
             """, unsafe_allow_html=True)
         
         st.markdown("---")
         
-        # Detailed Statistics
-        st.markdown("**📊 Detailed Descriptive Statistics**")
-        with st.expander("View Full Statistics Table", expanded=False):
-            st.dataframe(df.describe(include='all').T, use_container_width=True)
-        
-        # Distribution Overview
-        st.markdown("**📈 Distribution Overview**")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Rental distribution
-            fig = px.histogram(df, x='count', nbins=50,
-                              title='Distribution of Bike Rentals',
-                              color_discrete_sequence=['#8b5cf6'])
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False, title='Number of Rentals'),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Frequency'),
-                height=350
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Temperature distribution
-            fig = px.histogram(df, x='temp', nbins=30,
-                              title='Temperature Distribution',
-                              color_discrete_sequence=['#ec4899'])
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False, title='Temperature (°C)'),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Frequency'),
-                height=350
-            )
-            st.plotly_chart(fig, use_container_width=True)
-    
-    # Sub-tab 2: Temporal Analysis
-    with analysis_tabs[1]:
-        st.subheader("📈 Comprehensive Temporal Analysis")
-        
-        # Time series plot
-        st.markdown("**📅 Daily Rental Trends Over Time**")
-        daily_rentals = df.groupby('date')['count'].sum().reset_index()
-        daily_rentals['date'] = pd.to_datetime(daily_rentals['date'])
-        
-        fig = px.line(daily_rentals, x='date', y='count',
-                      title='Total Daily Rentals Over Time')
-        fig.update_traces(line_color='#8b5cf6', line_width=2)
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Date'),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Total Rentals'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        # Recommendations
+        st.subheader("🚀 Actionable Recommendations")
+        
+        rec_col1, rec_col2 = st.columns(2)
+        
+        with rec_col1:
+            with st.expander("🎯 **Operational Strategies**", expanded=True):
+                st.markdown("""
+                1. **Dynamic Fleet Management**
+                   - Redistribute bikes based on hourly demand patterns
+                   - Increase availability during peak hours (7-9 AM, 5-7 PM)
+                   - Reduce fleet during low-demand hours (1-5 AM)
+                
+                2. **Seasonal Planning**
+                   - Schedule maintenance during winter (lowest demand)
+                   - Maximize fleet availability during fall (highest demand)
+                   - Prepare for seasonal transitions
+                
+                3. **Weather-Based Operations**
+                   - Implement weather alert system
+                   - Adjust pricing based on weather forecasts
+                   - Offer rain protection accessories
+                """)
+        
+        with rec_col2:
+            with st.expander("💼 **Business Strategies**", expanded=True):
+                st.markdown("""
+                4. **User Conversion Program**
+                   - Convert casual users to registered (81% are registered)
+                   - Offer loyalty rewards and discounts
+                   - Create subscription plans
+                
+                5. **Pricing Optimization**
+                   - Surge pricing during peak hours
+                   - Weather-based dynamic pricing
+                   - Seasonal promotional campaigns
+                
+                6. **Marketing Focus**
+                   - Target working professionals (commute hours)
+                   - Promote eco-friendly transportation
+                   - Partner with corporates for employee programs
+                """)
+
+# TAB 7: Complete Analysis
+# Figures of each Complete Analysis sub-tab, in tab order
+ANALYSIS_FIGURES = [
+    ["count_histogram", "temp_histogram"],
+    ["daily_rentals", "day_hour_heatmap", "monthly_bars", "yearly_bars"],
+    ["temp_vs_humidity", "windspeed_ranges", "humidity_ranges", "environment_correlations"],
+    ["daily_users", "weather_users", "season_users", "hourly_user_share"],
+    ["correlation_matrix"],
+]
+
+if tab_is_open(tabs[6]):
+    with tabs[6], span("tab.complete_analysis"):
+        st.header("📚 Complete Analysis Summary")
+        logger.info("Complete Analysis tab accessed")
+        
+        # Analysis sub-tabs
+        analysis_tabs = make_tabs([
+            "📊 Overview Statistics",
+            "📈 Temporal Analysis", 
+            "🌡️ Environmental Factors",
+            "👥 User Behavior",
+            "🔗 Advanced Analytics"
+        ], key="analysis_tabs")
+        
+        # Compute the open sub-tabs' figures and tables together, then render them
+        open_sections = [i for i, tab in enumerate(analysis_tabs) if tab_is_open(tab)]
+        section_tasks = {}
+        if 0 in open_sections:
+            section_tasks['kpis'] = functools.partial(kpis, df, cube, cubes['stats'])
+        section_results = prefetch_sections([figure_id for i in open_sections for figure_id in ANALYSIS_FIGURES[i]],
+                                            **section_tasks)
+        
+        # Sub-tab 1: Overview Statistics
+        if tab_is_open(analysis_tabs[0]):
+            with analysis_tabs[0], span("tab.complete_analysis.overview"):
+                st.subheader("📊 Comprehensive Statistics Overview")
+                
+                # Key Metrics in gradient cards
+                st.markdown("**🎯 Key Performance Indicators**")
+                overview = section_results['kpis']
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.markdown(f"""
+                    <div class='metric-card' style='text-align: center;'>
+                        <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{overview['total_rentals']:,}</p>
+                        <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>TOTAL RENTALS</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    st.markdown(f"""
+                    <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
+                        <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{overview['mean_rentals']:.1f}</p>
+                        <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>AVG RENTALS/HOUR</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    st.markdown(f"""
+                    <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
+                        <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{overview['max_rentals']}</p>
+                        <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>MAX RENTALS/HOUR</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with col2:
+                    st.markdown(f"""
+                    <div class='metric-card' style='text-align: center;'>
+                        <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{overview['registered_pct']:.1f}%</p>
+                        <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>REGISTERED USERS %</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    st.markdown(f"""
+                    <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
+                        <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{overview['casual_pct']:.1f}%</p>
+                        <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>CASUAL USERS %</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    st.markdown(f"""
+                    <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
+                        <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{overview['mean_temp']:.1f}°C</p>
+                        <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>AVG TEMPERATURE</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with col3:
+                    st.markdown(f"""
+                    <div class='metric-card' style='text-align: center;'>
+                        <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{overview['peak_hour']}:00</p>
+                        <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>PEAK HOUR</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    st.markdown(f"""
+                    <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
+                        <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{overview['best_season']}</p>
+                        <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>BEST SEASON</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    st.markdown(f"""
+                    <div class='metric-card' style='text-align: center; margin-top: 1rem;'>
+                        <p style='font-size: 2.5rem; margin: 0; background: linear-gradient(135deg, #a78bfa 0%, #f472b6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 800;'>{overview['best_weather']}</p>
+                        <p style='margin: 0.5rem 0; color: #9ca3af; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;'>BEST WEATHER</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                st.markdown("---")
+                
+                # Detailed Statistics
+                st.markdown("**📊 Detailed Descriptive Statistics**")
+                with st.expander("View Full Statistics Table", expanded=False):
+                    st.dataframe(get_statistics_table(fingerprint, cubes).T, use_container_width=True)
+                
+                # Distribution Overview
+                st.markdown("**📈 Distribution Overview**")
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    # Rental distribution
+                    chart("count_histogram")
+                
+                with col2:
+                    # Temperature distribution
+                    chart("temp_histogram")
+        
+        # Sub-tab 2: Temporal Analysis
+        if tab_is_open(analysis_tabs[1]):
+            with analysis_tabs[1], span("tab.complete_analysis.temporal"):
+                st.subheader("📈 Comprehensive Temporal Analysis")
+                
+                # Time series plot
+                st.markdown("**📅 Daily Rental Trends Over Time**")
+                chart("daily_rentals")
+                
+                st.markdown("---")
+                
+                # Hourly heatmap
+                st.markdown("**🔥 Hourly Rental Heatmap by Day of Week**")
+                
+                chart("day_hour_heatmap")
+                
+                st.markdown("---")
+                
+                # Monthly comparison
+                st.markdown("**📊 Monthly Rental Comparison**")
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    chart("monthly_bars")
+                
+                with col2:
+                    # Year comparison
+                    chart("yearly_bars")
+        
+        # Sub-tab 3: Environmental Factors
+        if tab_is_open(analysis_tabs[2]):
+            with analysis_tabs[2], span("tab.complete_analysis.environmental"):
+                st.subheader("🌡️ Environmental Factors Analysis")
+                
+                # Temperature vs Humidity scatter
+                st.markdown("**🌡️ Temperature vs Humidity Impact**")
+                chart("temp_vs_humidity")
+                
+                st.markdown("---")
+                
+                # Environmental factors comparison
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**💨 Windspeed Impact**")
+                    chart("windspeed_ranges")
+                
+                with col2:
+                    st.markdown("**💧 Humidity Impact**")
+                    chart("humidity_ranges")
+                
+                st.markdown("---")
+                
+                # Correlation with environmental factors
+                st.markdown("**🔗 Environmental Correlations with Rentals**")
+                chart("environment_correlations")
+        
+        # Sub-tab 4: User Behavior
+        if tab_is_open(analysis_tabs[3]):
+            with analysis_tabs[3], span("tab.complete_analysis.user_behavior"):
+                st.subheader("👥 User Behavior Analysis")
+                
+                # User type trends over time
+                st.markdown("**📈 User Type Trends Over Time**")
+                
+                chart("daily_users")
+                
+                st.markdown("---")
+                
+                # User behavior by conditions
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**🌤️ User Types by Weather**")
+                    chart("weather_users")
+                
+                with col2:
+                    st.markdown("**🌸 User Types by Season**")
+                    chart("season_users")
+                
+                st.markdown("---")
+                
+                # User type ratio analysis
+                st.markdown("**📊 User Type Ratio by Hour**")
+                chart("hourly_user_share")
+        
+        # Sub-tab 5: Advanced Analytics
+        if tab_is_open(analysis_tabs[4]):
+            with analysis_tabs[4], span("tab.complete_analysis.advanced"):
+                st.subheader("🔗 Advanced Analytics")
+                
+                # Correlation matrix
+                st.markdown("**🔥 Complete Correlation Matrix**")
+                corr_matrix = get_correlations(fingerprint, df)
+                
+                chart("correlation_matrix")
+                
+                st.markdown("---")
+                
+                # Top correlations
+                st.markdown("**📊 Top Correlations with Bike Rentals**")
+                
+                count_corr = count_correlations(corr_matrix)
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**Positive Correlations**")
+                    positive_corr = count_corr[count_corr > 0]
+                    for feature, corr in positive_corr.items():
+                        st.markdown(f"""
+                        <div class='metric-card' style='margin-bottom: 0.5rem;'>
+                            <p style='margin: 0; color: #cbd5e1;'><strong>{feature}:</strong> <span style='color: #38ef7d;'>{corr:.3f}</span></p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                
+                with col2:
+                    st.markdown("**Negative Correlations**")
+                    negative_corr = count_corr[count_corr < 0]
+                    for feature, corr in negative_corr.items():
+                        st.markdown(f"""
+                        <div class='metric-card' style='margin-bottom: 0.5rem;'>
+                            <p style='margin: 0; color: #cbd5e1;'><strong>{feature}:</strong> <span style='color: #f472b6;'>{corr:.3f}</span></p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                
+                st.markdown("---")
+                
+                # Statistical summary table
+                st.markdown("**📋 Complete Statistical Summary**")
+                with st.expander("View Detailed Statistics", expanded=False):
+                    st.dataframe(describe_columns(cubes['stats']).T, use_container_width=True)
         
         st.markdown("---")
         
-        # Hourly heatmap
-        st.markdown("**🔥 Hourly Rental Heatmap by Day of Week**")
-        
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        hourly_day_data = df.groupby(['day', 'hour'])['count'].mean().reset_index()
-        hourly_pivot = hourly_day_data.pivot(index='day', columns='hour', values='count')
-        hourly_pivot = hourly_pivot.reindex(day_order)
-        
-        fig = px.imshow(hourly_pivot,
-                        labels=dict(x='Hour of Day', y='Day of Week', color='Avg Rentals'),
-                        aspect='auto',
-                        color_continuous_scale='Viridis')
-        fig.update_layout(
-            title='Average Rentals Heatmap: Day vs Hour',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("---")
+        # Download options
+        st.subheader("💾 Export Data & Reports")
         
-        # Monthly comparison
-        st.markdown("**📊 Monthly Rental Comparison**")
+        # Exports are generated only when a button is clicked, written in chunks and
+        # cached on disk per dataset version (see yulu_analytics/exports.py)
+        export_format = st.radio("Export format", available_formats(), horizontal=True, key="export_format",
+                                 format_func=lambda fmt: EXPORT_FORMATS[fmt][0])
+        _, extension, mime = EXPORT_FORMATS[export_format]
         
-        col1, col2 = st.columns(2)
+        col1, col2, col3 = st.columns(3)
         
         with col1:
-            monthly_avg = df.groupby('Month_name')['count'].mean().reindex([
-                'January', 'February', 'March', 'April', 'May', 'June',
-                'July', 'August', 'September', 'October', 'November', 'December'
-            ]).reset_index()
-            
-            fig = px.bar(monthly_avg, x='Month_name', y='count',
-                        title='Average Rentals by Month',
-                        color='count',
-                        color_continuous_scale='Plasma')
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-                height=350
+            st.download_button(
+                label="📥 Download Processed Data",
+                data=lambda: export_bytes(df, fingerprint, "yulu_processed_data", export_format),
+                file_name=f"yulu_processed_data{extension}",
+                mime=mime,
+                on_click="ignore"
             )
-            st.plotly_chart(fig, use_container_width=True)
         
         with col2:
-            # Year comparison
-            yearly_avg = df.groupby('year')['count'].mean().reset_index()
-            
-            fig = px.bar(yearly_avg, x='year', y='count',
-                        title='Average Rentals by Year',
-                        color='count',
-                        color_continuous_scale='Turbo')
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-                height=350
-            )
-            st.plotly_chart(fig, use_container_width=True)
-    
-    # Sub-tab 3: Environmental Factors
-    with analysis_tabs[2]:
-        st.subheader("🌡️ Environmental Factors Analysis")
-        
-        # Temperature vs Humidity scatter
-        st.markdown("**🌡️ Temperature vs Humidity Impact**")
-        fig = px.scatter(df, x='temp', y='humidity',
-                        color='count',
-                        size='count',
-                        title='Temperature vs Humidity (colored by rentals)',
-                        color_continuous_scale='Viridis',
-                        opacity=0.6)
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-            height=450
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Environmental factors comparison
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("**💨 Windspeed Impact**")
-            windspeed_bins = pd.cut(df['windspeed'], bins=5)
-            windspeed_avg = df.groupby(windspeed_bins)['count'].mean().reset_index()
-            windspeed_avg['windspeed'] = windspeed_avg['windspeed'].astype(str)
-            
-            fig = px.bar(windspeed_avg, x='windspeed', y='count',
-                        title='Average Rentals by Windspeed Range',
-                        color='count',
-                        color_continuous_scale='Blues')
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False, title='Windspeed Range'),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-                height=350
+            st.download_button(
+                label="📥 Download Statistics",
+                data=lambda: export_bytes(lambda: get_statistics_table(fingerprint, cubes), fingerprint, "yulu_statistics",
+                                          export_format, index=True),
+                file_name=f"yulu_statistics{extension}",
+                mime=mime,
+                on_click="ignore"
             )
-            st.plotly_chart(fig, use_container_width=True)
         
-        with col2:
-            st.markdown("**💧 Humidity Impact**")
-            humidity_bins = pd.cut(df['humidity'], bins=5)
-            humidity_avg = df.groupby(humidity_bins)['count'].mean().reset_index()
-            humidity_avg['humidity'] = humidity_avg['humidity'].astype(str)
-            
-            fig = px.bar(humidity_avg, x='humidity', y='count',
-                        title='Average Rentals by Humidity Range',
-                        color='count',
-                        color_continuous_scale='Greens')
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False, title='Humidity Range'),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-                height=350
+        with col3:
+            st.download_button(
+                label="📥 Download Correlations",
+                data=lambda: export_bytes(lambda: get_correlations(fingerprint, df), fingerprint, "yulu_correlations",
+                                          export_format, index=True),
+                file_name=f"yulu_correlations{extension}",
+                mime=mime,
+                on_click="ignore"
             )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Correlation with environmental factors
-        st.markdown("**🔗 Environmental Correlations with Rentals**")
-        env_corr = df[['temp', 'atemp', 'humidity', 'windspeed', 'count']].corr()['count'].drop('count').sort_values(ascending=False)
-        
-        fig = px.bar(x=env_corr.index, y=env_corr.values,
-                    title='Correlation of Environmental Factors with Rentals',
-                    color=env_corr.values,
-                    color_continuous_scale='RdBu_r',
-                    color_continuous_midpoint=0)
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            xaxis=dict(showgrid=False, title='Environmental Factor'),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Correlation'),
-            height=350
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Sub-tab 4: User Behavior
-    with analysis_tabs[3]:
-        st.subheader("👥 User Behavior Analysis")
-        
-        # User type trends over time
-        st.markdown("**📈 User Type Trends Over Time**")
-        
-        daily_users = df.groupby('date')[['casual', 'registered']].sum().reset_index()
-        daily_users['date'] = pd.to_datetime(daily_users['date'])
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=daily_users['date'], y=daily_users['casual'],
-                                name='Casual Users',
-                                line=dict(color='#8b5cf6', width=2),
-                                fill='tozeroy'))
-        fig.add_trace(go.Scatter(x=daily_users['date'], y=daily_users['registered'],
-                                name='Registered Users',
-                                line=dict(color='#ec4899', width=2),
-                                fill='tozeroy'))
-        
-        fig.update_layout(
-            title='Daily User Type Trends',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Date'),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Number of Users'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+
+# TAB 8: Demand Forecast
+if tab_is_open(tabs[7]):
+    with tabs[7], span("tab.forecast"):
+        st.header("🔮 Hourly Demand Forecast")
+        logger.info("Demand Forecast tab accessed")
         
-        st.markdown("---")
+        st.markdown(f"""
+        <div style='background: rgba(102, 126, 234, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #667eea; margin-bottom: 1.5rem;'>
+            <h4 style='color: #667eea; margin-top: 0;'>🔮 Rentals for the Coming Hours</h4>
+            <p style='color: #cbd5e1; margin: 0;'>
+                A ridge regression on hour, working day, season, weather, weekday, month, temperature, humidity
+                and windspeed predicts total, registered and casual rentals after the last recorded hour.
+                Unless a weather situation is chosen, the weather repeats the hourly pattern of the last
+                {PROFILE_DAYS} days. The model always learns from the full history of the selected zones, whatever the date range.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
         
-        # User behavior by conditions
         col1, col2 = st.columns(2)
-        
         with col1:
-            st.markdown("**🌤️ User Types by Weather**")
-            weather_users = df.groupby('weather')[['casual', 'registered']].mean().reset_index()
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(x=weather_users['weather'], y=weather_users['casual'],
-                                name='Casual', marker_color='#8b5cf6'))
-            fig.add_trace(go.Bar(x=weather_users['weather'], y=weather_users['registered'],
-                                name='Registered', marker_color='#ec4899'))
-            
-            fig.update_layout(
-                barmode='group',
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-                height=350
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
+            horizon = st.slider("Forecast horizon (hours)", MIN_HOURS, MAX_HOURS, 72, step=24, key="forecast_hours")
         with col2:
-            st.markdown("**🌸 User Types by Season**")
-            season_users = df.groupby('season')[['casual', 'registered']].mean().reset_index()
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(x=season_users['season'], y=season_users['casual'],
-                                name='Casual', marker_color='#8b5cf6'))
-            fig.add_trace(go.Bar(x=season_users['season'], y=season_users['registered'],
-                                name='Registered', marker_color='#ec4899'))
-            
-            fig.update_layout(
-                barmode='group',
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#cbd5e1'),
-                xaxis=dict(showgrid=False),
-                yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
-                height=350
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # User type ratio analysis
-        st.markdown("**📊 User Type Ratio by Hour**")
-        hourly_users = df.groupby('hour')[['casual', 'registered']].mean().reset_index()
-        hourly_users['casual_pct'] = (hourly_users['casual'] / (hourly_users['casual'] + hourly_users['registered'])) * 100
-        hourly_users['registered_pct'] = (hourly_users['registered'] / (hourly_users['casual'] + hourly_users['registered'])) * 100
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=hourly_users['hour'], y=hourly_users['casual_pct'],
-                                name='Casual %',
-                                line=dict(color='#8b5cf6', width=3),
-                                mode='lines+markers'))
-        fig.add_trace(go.Scatter(x=hourly_users['hour'], y=hourly_users['registered_pct'],
-                                name='Registered %',
-                                line=dict(color='#ec4899', width=3),
-                                mode='lines+markers'))
-        
-        fig.update_layout(
-            title='User Type Percentage by Hour of Day',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Hour'),
-            yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Percentage'),
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Sub-tab 5: Advanced Analytics
-    with analysis_tabs[4]:
-        st.subheader("🔗 Advanced Analytics")
-        
-        # Correlation matrix
-        st.markdown("**🔥 Complete Correlation Matrix**")
-        numerical_cols = ['temp', 'atemp', 'humidity', 'windspeed', 'casual', 'registered', 'count']
-        corr_matrix = df[numerical_cols].corr()
-        
-        fig = px.imshow(corr_matrix,
-                        text_auto='.2f',
-                        aspect='auto',
-                        color_continuous_scale='RdBu_r',
-                        labels=dict(color='Correlation'),
-                        zmin=-1, zmax=1)
-        fig.update_layout(
-            title='Feature Correlation Heatmap',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#cbd5e1'),
-            height=500
-        )
-        st.plotly_chart(fig, use_container_width=True)
+            scenario = st.selectbox("Weather", ["Recent pattern"] + LEVEL_GROUPS["weather"], key="forecast_weather")
         
-        st.markdown("---")
+        history = zone_history()
+        history_df, _, history_fingerprint = history.snapshot()
+        forecast, trained_rows = get_forecast(history_fingerprint, horizon, None if scenario == "Recent pattern" else scenario,
+                                              history, history_df)
         
-        # Top correlations
-        st.markdown("**📊 Top Correlations with Bike Rentals**")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Forecast Rentals", f"{forecast['count'].sum():,.0f}")
+        with col2:
+            peak = forecast.loc[forecast['count'].idxmax()]
+            st.metric("Peak Hour", peak['datetime'].strftime('%a %H:00'), f"{peak['count']:.0f} rentals",
+                      delta_color="off")
+        with col3:
+            st.metric("Registered Share", f"{forecast['registered'].sum() / forecast['count'].sum() * 100:.1f}%")
+        with col4:
+            st.metric("Training Rows", f"{trained_rows:,}")
+        
+        last = forecast['datetime'].min() - pd.Timedelta(hours=1)
+        recent = history_df.loc[history_df['datetime'] > last - pd.Timedelta(days=PROFILE_DAYS), ['datetime', 'count']]
+        st.plotly_chart(plot_forecast(recent, forecast), use_container_width=True)
+        
+        st.markdown("**📅 Daily Forecast**")
+        daily = forecast.groupby(forecast['datetime'].dt.normalize())[['count', 'registered', 'casual']].sum()
+        daily.index = daily.index.strftime('%a %d %b %Y')
+        st.dataframe(daily.round(0), use_container_width=True)
+
+# TAB 9: Logs
+if tab_is_open(tabs[8]):
+    with tabs[8], span("tab.logs"):
+        st.header("📝 Application Logs")
+        logger.info("Logs tab accessed")
         
-        count_corr = corr_matrix['count'].drop('count').sort_values(ascending=False)
+        st.markdown("""
+        <div style='background: rgba(139, 92, 246, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #8b5cf6;'>
+            <p style='color: #cbd5e1; margin: 0;'>
+                This section shows all actions performed in the current session.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
         
-        col1, col2 = st.columns(2)
+        st.markdown("<br>", unsafe_allow_html=True)
         
-        with col1:
-            st.markdown("**Positive Correlations**")
-            positive_corr = count_corr[count_corr > 0]
-            for feature, corr in positive_corr.items():
-                st.markdown(f"""
-                <div class='metric-card' style='margin-bottom: 0.5rem;'>
-                    <p style='margin: 0; color: #cbd5e1;'><strong>{feature}:</strong> <span style='color: #38ef7d;'>{corr:.3f}</span></p>
-                </div>
-                """, unsafe_allow_html=True)
+        figure_stats = get_figure_cache().stats()
+        st.caption(f"🖼️ Figure cache: {figure_stats['entries']} figures ({figure_stats['bytes'] / 1024:.0f} KB), "
+                   f"{figure_stats['hits']} hits / {figure_stats['misses']} misses")
+        
+        # Timing spans of this rerun (still in progress, so the Logs tab's own span is missing)
+        # and of the session's previous reruns
+        st.subheader("⏱️ Rerun Profile")
+        run_spans = profiler.completed()
+        previous = [run for run in profile_runs if run is not profiler and run.seconds is not None]
+        st.caption(f"This rerun so far: {profiler.elapsed() * 1000:.0f} ms in {len(run_spans)} spans"
+                   + (f" · previous rerun: {previous[-1].seconds * 1000:.0f} ms" if previous else ""))
+        
+        if run_spans:
+            profile_df = pd.DataFrame({
+                'Span': ['· ' * record['depth'] + record['name'] for record in run_spans],
+                'Start (ms)': [record['start'] * 1000 for record in run_spans],
+                'Wall (ms)': [record['seconds'] * 1000 for record in run_spans],
+                'Rows': [record['rows'] for record in run_spans],
+                'Memory Δ (MB)': [record['mem_delta'] / 1024 ** 2 if record['mem_delta'] is not None else None
+                                  for record in run_spans],
+                'Cached': [record.get('cached') for record in run_spans],
+            })
+            st.dataframe(profile_df.round(2), use_container_width=True, hide_index=True)
+            st.plotly_chart(plot_profile_flame(run_spans), use_container_width=True)
+        
+        st.markdown(f"**Slowest sections over the last {len(profile_runs)} reruns**")
+        summary_df = pd.DataFrame(summarize(profile_runs))
+        if not summary_df.empty:
+            summary_df = pd.DataFrame({
+                'Span': summary_df['name'],
+                'Calls': summary_df['calls'],
+                'Total (ms)': summary_df['total_s'] * 1000,
+                'Mean (ms)': summary_df['mean_s'] * 1000,
+                'Max (ms)': summary_df['max_s'] * 1000,
+                'Rows': summary_df['rows'],
+                'Memory Δ (MB)': summary_df['mem_delta'] / 1024 ** 2,
+            })
+            st.dataframe(summary_df.round(2), use_container_width=True, hide_index=True)
         
-        with col2:
-            st.markdown("**Negative Correlations**")
-            negative_corr = count_corr[count_corr < 0]
-            for feature, corr in negative_corr.items():
-                st.markdown(f"""
-                <div class='metric-card' style='margin-bottom: 0.5rem;'>
-                    <p style='margin: 0; color: #cbd5e1;'><strong>{feature}:</strong> <span style='color: #f472b6;'>{corr:.3f}</span></p>
-                </div>
-                """, unsafe_allow_html=True)
+        st.download_button(
+            label="📥 Download Profile (JSON lines)",
+            data="".join(run.to_jsonl() for run in profile_runs),
+            file_name="yulu_profile.jsonl",
+            mime="application/jsonl"
+        )
         
         st.markdown("---")
         
-        # Statistical summary table
-        st.markdown("**📋 Complete Statistical Summary**")
-        with st.expander("View Detailed Statistics", expanded=False):
-            st.dataframe(df[numerical_cols].describe().T, use_container_width=True)
-    
-    st.markdown("---")
-    
-    # Download options
-    st.subheader("💾 Export Data & Reports")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        csv = df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download Processed Data",
-            data=csv,
-            file_name="yulu_processed_data.csv",
-            mime="text/csv"
-        )
-    
-    with col2:
-        summary = df.describe(include='all').to_csv()
-        st.download_button(
-            label="📥 Download Statistics",
-            data=summary,
-            file_name="yulu_statistics.csv",
-            mime="text/csv"
-        )
-    
-    with col3:
-        corr_csv = df[numerical_cols].corr().to_csv()
-        st.download_button(
-            label="📥 Download Correlations",
-            data=corr_csv,
-            file_name="yulu_correlations.csv",
-            mime="text/csv"
-        )
-
-# TAB 8: Logs
-with tabs[7]:
-    st.header("📝 Application Logs")
-    logger.info("Logs tab accessed")
-    
-    st.markdown("""
-    <div style='background: rgba(139, 92, 246, 0.1); padding: 1rem; border-radius: 10px; border-left: 4px solid #8b5cf6;'>
-        <p style='color: #cbd5e1; margin: 0;'>
-            This section shows all actions performed in the current session.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    try:
-        with open('yulu_app.log', 'r') as f:
-            logs = f.readlines()
-            for log in logs[-50:]:  # Show last 50 logs
+        logs = tail_lines(LOG_FILE, 50)  # Show last 50 logs
+        if logs:
+            for log in logs:
                 st.text(log.strip())
-    except:
-        st.info("No logs available yet.")
+        else:
+            st.info("No logs available yet.")
 
 if __name__ == "__main__":
     logger.info("Yulu App running successfully")
@@ -2014,3 +1933,11 @@ if __name__ == "__main__":
         <p style='font-size: 0.9rem;'>© 2025 Yulu Bike Sharing Ratnesh Analytics</p>
     </div>
     """, unsafe_allow_html=True)
+
+profiler.finish()
+if PROFILE_LOG:
+    try:
+        with open(PROFILE_LOG, 'a') as f:
+            f.write(profiler.to_jsonl())
+    except OSError as e:
+        logger.warning(f"Could not write profile to {PROFILE_LOG}: {str(e)}")
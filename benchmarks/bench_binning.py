@@ -0,0 +1,94 @@
+"""Compare the row-wise level functions with the vectorized binning layer.
+
+Usage: python benchmarks/bench_binning.py [--sizes 10000 1000000 10000000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from yulu_analytics.binning import apply_bins  # noqa: E402
+
+
+# Row-wise functions previously used by load_data(), kept as the reference.
+def get_temp(temp):
+    if temp <= 12: return "Very Low"
+    elif temp > 12 and temp < 24: return "Low"
+    elif temp >= 24 and temp < 35: return "Moderate"
+    elif temp >= 35: return "High"
+
+
+def get_humidity(H):
+    if 0 <= H <= 10: return "10%"
+    elif 11 <= H <= 20: return "20%"
+    elif 21 <= H <= 30: return "30%"
+    elif 31 <= H <= 40: return "40%"
+    elif 41 <= H <= 50: return "50%"
+    elif 51 <= H <= 60: return "60%"
+    elif 61 <= H <= 70: return "70%"
+    elif 71 <= H <= 80: return "80%"
+    elif 81 <= H <= 90: return "90%"
+    elif 91 <= H <= 100: return "100%"
+
+
+def get_windspeed(W):
+    if 0 <= W <= 10: return "Low"
+    elif 11 <= W <= 20: return "Moderate"
+    elif 21 <= W <= 30: return "High"
+    elif W > 30: return "Very High"
+
+
+def make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "atemp": np.round(rng.uniform(0.7, 45.5, rows), 3),
+        "humidity": rng.integers(0, 101, rows),
+        "windspeed": np.round(rng.choice([0, 6.0032, 8.9981, 11.0014, 16.9979, 22.0028, 31.0009, 56.9969], rows), 4),
+    })
+
+
+def run_legacy(frame):
+    out = pd.DataFrame(index=frame.index)
+    out["temperature"] = frame["atemp"].apply(get_temp)
+    out["humidity_level"] = frame["humidity"].apply(get_humidity)
+    out["windspeed_level"] = frame["windspeed"].apply(get_windspeed)
+    return out
+
+
+def run_vectorized(frame):
+    return apply_bins(frame.copy())
+
+
+def timed(func, frame):
+    start = time.perf_counter()
+    result = func(frame)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'apply (s)':>12} {'binning (s)':>12} {'speedup':>9}  mismatches")
+    for rows in args.sizes:
+        frame = make_frame(rows)
+        legacy_time, legacy = timed(run_legacy, frame)
+        fast_time, fast = timed(run_vectorized, frame)
+
+        # Only compare rows the old ladders actually labelled (they return None in the gaps)
+        mismatches = 0
+        for column in legacy.columns:
+            labelled = legacy[column].notna()
+            mismatches += int((fast[column].astype(object)[labelled] != legacy[column][labelled]).sum())
+
+        print(f"{rows:>12,} {legacy_time:>12.3f} {fast_time:>12.3f} {legacy_time / fast_time:>8.1f}x  {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare the inferred-format calendar derivation with calendar_features.
+
+Usage: python benchmarks/bench_calendar.py [--sizes 10000 1000000 10000000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from yulu_analytics.calendar_features import add_calendar_columns  # noqa: E402
+
+COLUMNS = ["datetime", "day", "date", "hour", "Month", "Month_name", "year"]
+
+
+# Derivation previously used by load_data(), kept as the reference.
+def run_legacy(frame):
+    frame["datetime"] = pd.to_datetime(frame["datetime"])
+    frame["day"] = frame["datetime"].dt.day_name()
+    frame["date"] = frame["datetime"].dt.normalize()
+    frame["hour"] = frame["datetime"].dt.hour
+    frame["Month"] = frame["datetime"].dt.month
+    frame["Month_name"] = frame["datetime"].dt.month_name()
+    frame["year"] = frame["datetime"].dt.year
+    return frame
+
+
+def run_fast(frame):
+    return add_calendar_columns(frame)
+
+
+def make_frame(rows, seed=0):
+    # Hourly timestamps from 2011 on, in random order, as strings like the raw CSV
+    rng = np.random.default_rng(seed)
+    hours = rng.integers(0, 24 * 365 * 20, rows)
+    stamps = np.datetime64("2011-01-01T00:00:00") + hours.astype("timedelta64[h]")
+    text = np.char.replace(np.datetime_as_string(stamps, unit="s"), "T", " ")
+    return pd.DataFrame({"datetime": text.astype(object)})
+
+
+def timed(func, frame):
+    start = time.perf_counter()
+    result = func(frame)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'legacy (s)':>12} {'calendar (s)':>13} {'speedup':>9}  mismatches")
+    for rows in args.sizes:
+        frame = make_frame(rows)
+        legacy_time, legacy = timed(run_legacy, frame.copy())
+        fast_time, fast = timed(run_fast, frame)
+
+        mismatches = 0
+        for column in COLUMNS:
+            expected = legacy[column].to_numpy()
+            actual = fast[column].astype(object if column in ("day", "Month_name") else legacy[column].dtype)
+            mismatches += int((actual.to_numpy() != expected).sum())
+
+        print(f"{rows:>12,} {legacy_time:>12.3f} {fast_time:>13.3f} {legacy_time / fast_time:>8.1f}x  {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
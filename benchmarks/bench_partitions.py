@@ -0,0 +1,73 @@
+"""Time opening a partitioned dataset: serial vs parallel loads, cold vs warm caches, pruned selections.
+
+Each zone is two years of synthetic hourly rows split into monthly partitions.
+Disk caches go to a temporary directory and are cleared before each cold run.
+
+Usage: python benchmarks/bench_partitions.py [--zones 8] [--data-dir /tmp/yulu_bench]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+CACHE_DIR = tempfile.mkdtemp(prefix="yulu_bench_cache_")
+os.environ["YULU_CACHE_DIR"] = CACHE_DIR
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import SPAN_HOURS, synthetic_csv  # noqa: E402
+from yulu_analytics.dataset import open_partitioned  # noqa: E402
+from yulu_analytics.partitions import is_partitioned, split_csv  # noqa: E402
+
+
+def build_partitions(directory, zones, data_dir):
+    if is_partitioned(directory) and len(os.listdir(directory)) == zones + 1:
+        return
+    shutil.rmtree(directory, ignore_errors=True)
+    source = synthetic_csv(SPAN_HOURS, data_dir)
+    for zone in range(zones):
+        split_csv(source, directory, f"zone{zone:02d}")
+
+
+def timed_view(directory, mode, zones=None, start=None, end=None, cold=True):
+    if cold:
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    began = time.perf_counter()
+    dataset = open_partitioned(directory)
+    view = dataset.view(dataset.select(zones, start, end), mode)
+    return time.perf_counter() - began, len(view.paths), len(view.snapshot()[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zones", type=int, default=8)
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "yulu_bench"))
+    args = parser.parse_args()
+
+    directory = os.path.join(args.data_dir, f"partitions_{args.zones}")
+    build_partitions(directory, args.zones, args.data_dir)
+
+    one_month = (pd.Timestamp("2012-03-01"), pd.Timestamp("2012-04-01"))
+    runs = [
+        ("all zones, serial, cold", dict(mode="serial")),
+        ("all zones, threads, cold", dict(mode="threads")),
+        ("all zones, threads, warm", dict(mode="threads", cold=False)),
+        ("one zone, threads, cold", dict(mode="threads", zones=["zone00"])),
+        ("one zone + month, cold", dict(mode="threads", zones=["zone00"], start=one_month[0], end=one_month[1])),
+    ]
+    try:
+        print(f"{'selection':<28} {'partitions':>10} {'rows':>12} {'time (s)':>10}")
+        for label, options in runs:
+            seconds, partitions, rows = timed_view(directory, **options)
+            print(f"{label:<28} {partitions:>10,} {rows:>12,} {seconds:>10.3f}")
+    finally:
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compare row-level bootstrap resampling with the value-count resampling engine.
+
+The row-level bootstrap draws n row indices per resample, so its cost grows
+with the rows; it is timed on a few hundred resamples and scaled up to
+``--resamples``. The engine draws per-group value counts, so its cost depends
+on the distinct values, not the rows.
+
+Usage: python benchmarks/bench_resampling.py [--sizes 10k 1M 5M] [--resamples 10000] [--mode serial]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import make_raw_frame, parse_size  # noqa: E402
+from yulu_analytics.hypothesis import split_groups  # noqa: E402
+from yulu_analytics.ingest import preprocess  # noqa: E402
+from yulu_analytics.resampling import COMPARISONS, RESAMPLING_MODES, comparison_test  # noqa: E402
+
+ROW_LEVEL_RESAMPLES = 200
+ROW_LEVEL_BATCH_CELLS = 20_000_000
+
+
+def row_level_bootstrap(groups, resamples, seed=0):
+    """Bootstrap means of each group by drawing row indices (the textbook way), batched to bound memory."""
+    rng = np.random.default_rng(seed)
+    means = np.empty((resamples, len(groups)))
+    for g, values in enumerate(groups):
+        batch = max(1, ROW_LEVEL_BATCH_CELLS // len(values))
+        for start in range(0, resamples, batch):
+            size = min(batch, resamples - start)
+            means[start:start + size, g] = values[rng.integers(0, len(values), (size, len(values)))].mean(axis=1)
+    return means
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=["10k", "1M", "5M"])
+    parser.add_argument("--resamples", type=int, default=10_000)
+    parser.add_argument("--mode", choices=RESAMPLING_MODES, default="serial")
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'comparison':>11} {'row-level (s, est.)':>20} {'engine (s)':>11} "
+          f"{'speedup':>9} {'p-value':>9}  CI width (row-level / engine)")
+    for rows in map(parse_size, args.sizes):
+        data = preprocess(make_raw_frame(rows))
+        for name in ("workingday", "season"):
+            result = comparison_test(data, name, resamples=args.resamples, mode=args.mode)
+
+            by, order = COMPARISONS[name]
+            split = split_groups(data, by)
+            groups = [split[label] for label in (order or split) if len(split.get(label, ()))]
+            started = time.perf_counter()
+            means = row_level_bootstrap(groups, ROW_LEVEL_RESAMPLES)
+            # Row-level permutations cost about as much again as the bootstrap
+            row_level = 2 * (time.perf_counter() - started) * args.resamples / ROW_LEVEL_RESAMPLES
+
+            low, high = np.percentile(means[:, 0], [2.5, 97.5])
+            width = result["ci_high"][0] - result["ci_low"][0]
+            print(f"{rows:>12,} {name:>11} {row_level:>20.1f} {result['seconds']:>11.2f} "
+                  f"{row_level / result['seconds']:>8.1f}x {result['p_value']:>9.5f}  {high - low:.3f} / {width:.3f}")
+
+
+if __name__ == "__main__":
+    main()
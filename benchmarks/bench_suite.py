@@ -0,0 +1,224 @@
+"""Time every dashboard computation on synthetic datasets of increasing size.
+
+Each stage (CSV parse, preprocessing, cube build, the groupbys behind each
+tab, correlations, the scipy tests, the OLS trendline, forecast training and
+prediction, date-window totals and slices, and every figure's build and JSON
+serialization) is timed best-of-``--repeat`` at each size. Results
+are written as JSON; with ``--baseline`` the run is compared against an
+earlier result file and exits non-zero if any stage got slower than the
+tolerance allows.
+
+Usage: python benchmarks/bench_suite.py [--sizes 10k 100k 1M] [--output results.json]
+                                        [--baseline previous.json] [--tolerance 1.25]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import plotly
+import plotly.io as pio
+import scipy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import parse_size, synthetic_csv  # noqa: E402
+from yulu_analytics.aggregates import MEASURES, build_cubes, group_size  # noqa: E402
+from yulu_analytics.figures import FIGURES, WARM_PARAMS  # noqa: E402
+from yulu_analytics.filters import FilterIndex  # noqa: E402
+from yulu_analytics.forecast import DemandForecaster  # noqa: E402
+from yulu_analytics.hypothesis import chi_square_independence, one_way_anova, split_groups, two_sample_ttest  # noqa: E402
+from yulu_analytics.ingest import preprocess  # noqa: E402
+from yulu_analytics.insights import (category_profile, contingency_table, correlation_matrix,  # noqa: E402
+                                     count_correlations, hourly_profile, hypothesis_tests, kpis, monthly_profile,
+                                     user_share, weekly_profile)
+from yulu_analytics.online_stats import describe_columns  # noqa: E402
+from yulu_analytics.sampling import ols_trendlines  # noqa: E402
+from yulu_analytics.schema import NUMERICAL_COLUMNS, RAW_DTYPES  # noqa: E402
+from yulu_analytics.sections import EXECUTION_MODES  # noqa: E402
+from yulu_analytics.timeindex import TimeIndex  # noqa: E402
+
+DEFAULT_SIZES = ["10k", "100k", "1M"]
+# Date windows are timed over the most recent four weeks of data
+WINDOW = pd.Timedelta(days=28)
+DATA_DIR = os.path.join(tempfile.gettempdir(), "yulu_bench")
+
+# Stages faster than this are too noisy to flag as regressions
+MIN_DELTA_SECONDS = 0.005
+
+
+def best_of(repeat, func, setup=None):
+    """Fastest of ``repeat`` runs of ``func(setup())`` (setup is not timed) and the last result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        arg = setup() if setup is not None else None
+        start = time.perf_counter()
+        result = func(arg) if setup is not None else func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def tab_groupbys(data, cube, stats):
+    """The cube rollups each tab runs, keyed like the app's tabs."""
+    return {
+        "eda": lambda: [group_size(cube, column) for column in ["season", "holiday", "workingday", "weather"]],
+        "visualizations": lambda: (category_profile(cube, "season"), category_profile(cube, "weather"),
+                                   hourly_profile(cube), weekly_profile(cube), monthly_profile(cube),
+                                   user_share(cube)),
+        "insights": lambda: (hourly_profile(cube), category_profile(cube, "season"),
+                             category_profile(cube, "weather")),
+        "complete_analysis": lambda: kpis(data, cube, stats),
+    }
+
+
+def run_size(path, repeat, figures=True):
+    """Time every stage on the CSV at ``path``; returns stage -> seconds and figure id -> JSON bytes."""
+    stages = {}
+    stages["csv_parse"], raw = best_of(repeat, lambda: pd.read_csv(path, dtype=RAW_DTYPES))
+    stages["preprocess"], data = best_of(repeat, preprocess, setup=raw.copy)
+    del raw
+    stages["build_cubes"], cubes = best_of(repeat, lambda: build_cubes(data))
+    cube = cubes["calendar"]
+
+    for tab, func in tab_groupbys(data, cube, cubes["stats"]).items():
+        stages[f"groupby.{tab}"], _ = best_of(repeat, func)
+    stages["filter_index"], _ = best_of(repeat, lambda: FilterIndex(data, ["season", "weather", "workingday"]))
+    stages["describe"], _ = best_of(repeat, lambda: data[NUMERICAL_COLUMNS].describe())
+    stages["describe_stats"], _ = best_of(repeat, lambda: describe_columns(cubes["stats"]))
+    stages["corr"], _ = best_of(repeat, lambda: count_correlations(correlation_matrix(data)))
+
+    stages["split_groups"], _ = best_of(repeat, lambda: split_groups(data, "workingday"))
+    workingday = split_groups(data, "workingday")
+    stages["test.ttest_workingday"], _ = best_of(repeat, lambda: two_sample_ttest(workingday["Yes"], workingday["No"]))
+    for by in ("season", "weather"):
+        groups = split_groups(data, by)
+        stages[f"test.anova_{by}"], _ = best_of(repeat, lambda: one_way_anova(groups))
+    stages["test.chi_square"], _ = best_of(
+        repeat, lambda: chi_square_independence(contingency_table(cube, "season", "weather")))
+    for mode in EXECUTION_MODES:
+        stages[f"tests.{mode}"], _ = best_of(repeat, lambda: hypothesis_tests(data, cube, mode=mode))
+    stages["ols_trendline"], _ = best_of(repeat, lambda: ols_trendlines(data, "temp", "count", "season"))
+
+    # Forecasting: training over every row, batch prediction of every row, and a week-ahead forecast
+    stages["forecast.train"], model = best_of(repeat, lambda: DemandForecaster().partial_fit(data))
+    model.coefficients()
+    stages["forecast.predict"], _ = best_of(repeat, lambda: model.predict(data))
+    stages["forecast.168h"], _ = best_of(repeat, lambda: model.forecast(data, 168))
+
+    # Date windows: totals re-filtered from the frame vs from the index's prefix sums,
+    # and the window's rows and cubes for its charts
+    stages["window.index"], index = best_of(repeat, lambda: TimeIndex(data))
+    end = index.span()[1] + pd.Timedelta(hours=1)
+    start = end - WINDOW
+    stages["window.totals_filter"], _ = best_of(
+        repeat, lambda: data.loc[data["datetime"].between(start, end, inclusive="left"), MEASURES].sum())
+    stages["window.totals_index"], _ = best_of(repeat, lambda: index.totals(start, end))
+    stages["window.cubes"], _ = best_of(repeat, lambda: build_cubes(index.slice(data, start, end)))
+
+    payload_bytes = {}
+    if figures:
+        for figure_id, builder in FIGURES.items():
+            params = WARM_PARAMS[figure_id][0]
+            stages[f"figure_build.{figure_id}"], fig = best_of(repeat, lambda: builder(data, cubes, **params))
+            stages[f"figure_json.{figure_id}"], payload = best_of(repeat, lambda: pio.to_json(fig, validate=False))
+            payload_bytes[figure_id] = len(payload)
+    return stages, payload_bytes
+
+
+def environment():
+    # Library versions, so results from before and after an upgrade can be told apart
+    try:
+        import pyarrow
+        arrow_version = pyarrow.__version__
+    except ImportError:
+        arrow_version = None
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "scipy": scipy.__version__,
+        "plotly": plotly.__version__,
+        "pyarrow": arrow_version,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def find_regressions(results, baseline, tolerance, min_delta=MIN_DELTA_SECONDS):
+    """Stages slower than ``tolerance`` x their baseline time (and by more than ``min_delta`` s)."""
+    regressions = []
+    for size, current in results["sizes"].items():
+        previous = baseline.get("sizes", {}).get(size, {}).get("stages", {})
+        for stage, seconds in current["stages"].items():
+            before = previous.get(stage)
+            if before is None:
+                continue
+            if seconds > before * tolerance and seconds - before > min_delta:
+                regressions.append({"rows": int(size), "stage": stage, "baseline": before,
+                                    "current": seconds, "ratio": round(seconds / before, 2)})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="row counts, e.g. 10k 1M 50M")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, the fastest is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-dir", default=DATA_DIR, help="where generated CSVs are kept between runs")
+    parser.add_argument("--skip-figures", action="store_true", help="skip figure build and serialization")
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    parser.add_argument("--baseline", help="earlier results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="a stage regresses if it is slower than tolerance x its baseline time")
+    args = parser.parse_args()
+
+    results = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "sizes": {},
+    }
+    for rows in map(parse_size, args.sizes):
+        path = synthetic_csv(rows, args.data_dir, args.seed)
+        start = time.perf_counter()
+        stages, payload_bytes = run_size(path, args.repeat, figures=not args.skip_figures)
+        throughput = {stage: round(rows / stages[f"forecast.{stage}"]) for stage in ("train", "predict")}
+        results["sizes"][str(rows)] = {
+            "stages": {stage: round(seconds, 6) for stage, seconds in stages.items()},
+            "figure_bytes": payload_bytes,
+            "forecast_rows_per_second": throughput,
+        }
+        slowest = max(stages, key=stages.get)
+        print(f"{rows:>12,} rows: {time.perf_counter() - start:8.2f}s total, "
+              f"slowest stage {slowest} ({stages[slowest]:.3f}s), forecast train {throughput['train']:,} rows/s, "
+              f"predict {throughput['predict']:,} rows/s", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        results["tolerance"] = args.tolerance
+        results["regressions"] = find_regressions(results, baseline, args.tolerance)
+        for regression in results["regressions"]:
+            print(f"REGRESSION {regression['rows']:,} rows {regression['stage']}: "
+                  f"{regression['baseline']:.4f}s -> {regression['current']:.4f}s ({regression['ratio']}x)",
+                  file=sys.stderr)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if results.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Load-test the JSON API: concurrent keep-alive clients over a mix of endpoints.
+
+Each connection sends requests back to back for ``--duration`` seconds, cycling
+through ``--paths``; with ``--revalidate`` it sends the last ETag it saw for a
+path as ``If-None-Match`` (so cached responses come back as empty 304s).
+Reports requests per second, latency percentiles and status counts as JSON.
+Start the API first (``python -m yulu_analytics.api`` or the app with
+``YULU_API_PORT`` set).
+
+Usage: python benchmarks/load_test.py [--host 127.0.0.1] [--port 8502] [--connections 64]
+                                      [--duration 10] [--revalidate] [--paths /v1/hourly ...]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+DEFAULT_PATHS = ["/v1/hourly", "/v1/means?by=season", "/v1/means?by=weather", "/v1/kpis",
+                 "/v1/tests", "/v1/correlations"]
+
+
+async def read_response(reader):
+    # (status, headers, body) of one HTTP/1.1 response with a Content-Length
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name:
+            headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0)) if status != 304 else 0
+    body = await reader.readexactly(length) if length else b""
+    return status, headers, body
+
+
+async def client(host, port, paths, deadline, revalidate, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    etags = {}
+    try:
+        for path in itertools.cycle(paths):
+            if time.perf_counter() >= deadline:
+                break
+            request = f"GET {path} HTTP/1.1\r\nHost: {host}\r\n"
+            if revalidate and path in etags:
+                request += f"If-None-Match: {etags[path]}\r\n"
+            start = time.perf_counter()
+            writer.write((request + "\r\n").encode("latin-1"))
+            status, headers, _ = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+            if "etag" in headers:
+                etags[path] = headers["etag"]
+    finally:
+        writer.close()
+
+
+async def run(host, port, paths, connections, duration, revalidate):
+    latencies, statuses = [], Counter()
+    start = time.perf_counter()
+    deadline = start + duration
+    # Stagger the starting path so the connections don't all hit the same endpoint in step
+    await asyncio.gather(*(client(host, port, paths[i % len(paths):] + paths[:i % len(paths)], deadline,
+                                  revalidate, latencies, statuses) for i in range(connections)))
+    elapsed = time.perf_counter() - start
+    latency_ms = np.asarray(latencies) * 1000
+    return {
+        "connections": connections,
+        "revalidate": revalidate,
+        "seconds": round(elapsed, 3),
+        "requests": len(latencies),
+        "requests_per_second": round(len(latencies) / elapsed),
+        "latency_ms": {f"p{p}": round(float(np.percentile(latency_ms, p)), 3) for p in (50, 90, 99)}
+        if len(latency_ms) else {},
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to keep sending requests")
+    parser.add_argument("--revalidate", action="store_true", help="send If-None-Match with the last ETag seen")
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.host, args.port, args.paths, args.connections, args.duration, args.revalidate))
+    print(json.dumps(results, indent=2))
+    if set(results["statuses"]) - {"200", "304"}:
+        print("Some requests failed", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Synthetic Yulu CSVs of any size, following the ``yulu_data.csv`` schema.
+
+Rows are hourly readings from 2011-01-01 over two years, repeated for as many
+zones as needed to reach the requested size (so timestamps stay within the
+datetime64[ns] range even at 50M rows). Season, working day, weather,
+temperatures and demand follow the real data's seasonal and hourly shape
+closely enough for groupbys, tests and figures to do representative work.
+
+Usage: python benchmarks/synthetic.py 1M --output /tmp/yulu_1M.csv
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+COLUMNS = ["datetime", "season", "holiday", "workingday", "weather", "temp", "atemp",
+           "humidity", "windspeed", "casual", "registered", "count"]
+
+START = np.datetime64("2011-01-01T00:00:00")
+SPAN_HOURS = 2 * 365 * 24
+WINDSPEEDS = np.array([0, 6.0032, 7.0015, 8.9981, 11.0014, 12.998, 15.0013, 16.9979,
+                       19.0012, 22.0028, 26.0027, 31.0009, 39.0007, 56.9969])
+WEATHER_P = [0.66, 0.26, 0.0799, 0.0001]
+# mean registered / casual rentals per hour of day, roughly the real profile
+REGISTERED_BY_HOUR = np.array([44, 27, 18, 9, 5, 20, 76, 244, 362, 165, 107, 128,
+                               154, 150, 139, 152, 226, 387, 360, 256, 185, 141, 109, 72])
+CASUAL_BY_HOUR = np.array([10, 7, 5, 3, 2, 2, 5, 14, 27, 30, 45, 58,
+                           66, 72, 76, 74, 72, 74, 62, 50, 38, 31, 24, 17])
+CHUNK_ROWS = 1_000_000
+
+
+def parse_size(text):
+    """``"10k"``, ``"1.5M"`` or ``"50000"`` -> number of rows."""
+    text = str(text).strip().lower().replace("_", "").replace(",", "")
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text[:-1] if scale > 1 else text) * scale)
+
+
+def make_raw_frame(rows, seed=0, offset=0):
+    """Raw frame of ``rows`` rows (the ``offset``-th row onwards), as ``pd.read_csv`` would return it."""
+    frame = _make_frame(rows, seed, offset)
+    text = np.char.replace(np.datetime_as_string(frame["datetime"].to_numpy(), unit="s"), "T", " ")
+    frame["datetime"] = text.astype(object)
+    return frame
+
+
+def _make_frame(rows, seed, offset):
+    # Like make_raw_frame, but with datetime64[s] timestamps instead of strings
+    rng = np.random.default_rng([seed, offset])
+    index = np.arange(offset, offset + rows)
+    hours = index % SPAN_HOURS
+    stamps = START + hours.astype("timedelta64[h]")
+
+    days = hours // 24
+    hour = hours % 24
+    month = (stamps.astype("datetime64[M]").astype("int64") % 12) + 1
+    weekday = (days + 5) % 7  # 2011-01-01 was a Saturday
+    holiday = (days % 33 == 16).astype("int8")  # about 3% of days, whole days at a time
+    workingday = ((weekday < 5) & (holiday == 0)).astype("int8")
+    season = ((month - 1) // 3 + 1).astype("int8")
+    weather = rng.choice(np.arange(1, 5, dtype="int8"), rows, p=WEATHER_P)
+
+    # warm summers, cold winters; year two slightly busier like the real data
+    seasonal = np.sin((month - 4) / 12 * 2 * np.pi)
+    temp = np.clip(20 + 10 * seasonal + rng.normal(0, 4, rows), 0.82, 41).round(2)
+    atemp = np.clip(temp * 1.12 + rng.normal(0, 1.5, rows), 0.76, 45.5).round(3)
+    humidity = np.clip(62 + 5 * weather + rng.normal(0, 18, rows), 0, 100).astype("int8")
+    windspeed = rng.choice(WINDSPEEDS, rows)
+
+    level = (1 + 0.45 * seasonal + 0.4 * (days >= 365)) * (1.25 - 0.25 * weather) * np.clip(temp / 20, 0.3, 1.4)
+    registered = rng.poisson(REGISTERED_BY_HOUR[hour] * level * np.where(workingday == 1, 1.1, 0.8))
+    casual = rng.poisson(CASUAL_BY_HOUR[hour] * level * np.where(workingday == 1, 0.6, 1.9))
+
+    return pd.DataFrame({
+        "datetime": stamps.astype("datetime64[s]"),
+        "season": season,
+        "holiday": holiday,
+        "workingday": workingday,
+        "weather": weather,
+        "temp": temp,
+        "atemp": atemp,
+        "humidity": humidity,
+        "windspeed": windspeed,
+        "casual": casual,
+        "registered": registered,
+        "count": casual + registered,
+    }, columns=COLUMNS)
+
+
+def write_csv(path, rows, seed=0, chunk_rows=CHUNK_ROWS):
+    """Write a ``rows``-row synthetic CSV to ``path`` in bounded-memory chunks."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write((",".join(COLUMNS) + "\n").encode())
+        for offset in range(0, rows, chunk_rows):
+            count = min(chunk_rows, rows - offset)
+            if pa is not None:
+                # Arrow formats timestamps as "YYYY-MM-DD HH:MM:SS" and is ~7x faster than to_csv
+                table = pa.Table.from_pandas(_make_frame(count, seed, offset), preserve_index=False)
+                pa_csv.write_csv(table, f, pa_csv.WriteOptions(include_header=False, quoting_style="none"))
+            else:
+                make_raw_frame(count, seed, offset).to_csv(f, index=False, header=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def synthetic_csv(rows, data_dir, seed=0):
+    """Path of a cached synthetic CSV with ``rows`` rows, generating it on first use."""
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"yulu_synthetic_{rows}_{seed}.csv")
+    if not os.path.exists(path):
+        write_csv(path, rows, seed)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("rows", help="number of rows, e.g. 10k, 1M, 50M")
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_csv(args.output, parse_size(args.rows), args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The package is not installed; import it from the repository root like the benchmarks do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,47 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from yulu_analytics.data_cache import load_cached_frame, store_cached_frame
+from yulu_analytics.ingest import read_csv
+
+pytest.importorskip("pyarrow")
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "yulu_data.csv")
+
+
+@pytest.fixture(scope="module")
+def large_frame():
+    # More rows than pyarrow's default 65,536-row record batches
+    data = read_csv(DATA)
+    return pd.concat([data] * 7, ignore_index=True)
+
+
+def column_array(series):
+    return series.cat.codes.to_numpy() if isinstance(series.dtype, pd.CategoricalDtype) else series.to_numpy()
+
+
+def test_large_frame_maps_back_without_copies(large_frame, tmp_path):
+    assert len(large_frame) > 65_536
+    path = str(tmp_path / f"yulu_data-00000000-{'0' * 32}-v1.feather")
+    assert store_cached_frame(large_frame, path) == path
+    loaded = load_cached_frame(path)
+
+    pd.testing.assert_frame_equal(loaded, large_frame)
+    for name in loaded.columns:
+        array = column_array(loaded[name])
+        assert not array.flags.writeable, name
+        assert not array.flags.owndata, name
+
+
+def test_missing_entry_loads_as_none(tmp_path):
+    assert load_cached_frame(str(tmp_path / "missing.feather")) is None
+
+
+def test_empty_frame_round_trips(tmp_path):
+    empty = pd.DataFrame({"count": np.array([], dtype="int32")})
+    path = str(tmp_path / "empty.feather")
+    store_cached_frame(empty, path)
+    pd.testing.assert_frame_equal(load_cached_frame(path), empty)
@@ -0,0 +1,48 @@
+import os
+
+import pandas as pd
+import pytest
+
+from yulu_analytics import exports
+from yulu_analytics.exports import export_bytes, export_file
+
+FRAME = pd.DataFrame({"count": [1, 2, 3]})
+
+
+def test_other_windows_of_the_same_version_are_kept(tmp_path):
+    export_dir = str(tmp_path)
+    for fingerprint in ["abc-v3", "abc-v3@20110101-20111231", "abc-v3@20120101-20121231"]:
+        export_file(FRAME, fingerprint, "data", "csv", export_dir=export_dir)
+    export_file(FRAME, "abc-v3", "summary", "csv", export_dir=export_dir)
+
+    assert sorted(os.listdir(export_dir)) == ["data-abc-v3.csv", "data-abc-v3@20110101-20111231.csv",
+                                              "data-abc-v3@20120101-20121231.csv", "summary-abc-v3.csv"]
+
+
+def test_other_versions_are_pruned(tmp_path):
+    export_dir = str(tmp_path)
+    export_file(FRAME, "abc-v3@20110101-20111231", "data", "csv", export_dir=export_dir)
+    export_file(FRAME, "abc-v3+99@20110101-20111231", "data", "csv", export_dir=export_dir)
+
+    assert os.listdir(export_dir) == ["data-abc-v3+99@20110101-20111231.csv"]
+
+
+def test_export_bytes_writes_a_pruned_export_again(tmp_path, monkeypatch):
+    calls = []
+
+    def pruned_before_read(*args):
+        path = export_file(*args, export_dir=str(tmp_path))
+        if not calls:
+            # Another process prunes the file between export_file returning and the read
+            os.remove(path)
+        calls.append(path)
+        return path
+    monkeypatch.setattr(exports, "export_file", pruned_before_read)
+
+    assert export_bytes(FRAME, "abc-v3", "data", "csv") == b"count\n1\n2\n3\n"
+    assert len(calls) == 2
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        exports.write_export(FRAME, str(tmp_path / "data.xyz"), "xyz")
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from yulu_analytics.filters import FilterIndex
+
+COLUMNS = ["season", "weather", "workingday"]
+VALUES = {
+    "season": ["Spring", "Summer", "Fall", "Winter"],
+    "weather": ["Clear", "Cloudy", "Little Rain", "Heavy Rain"],
+    "workingday": ["Yes", "No"],
+}
+
+
+def make_frame(rows, seed):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        column: pd.Categorical(rng.choice(values, rows), categories=values)
+        for column, values in VALUES.items()
+    })
+    frame["count"] = rng.integers(0, 1000, rows)
+    return frame
+
+
+def random_selection(rng):
+    # Each column is either left out (unfiltered) or filtered to a random subset, possibly empty
+    selection = {}
+    for column, values in VALUES.items():
+        if rng.random() < 0.7:
+            selection[column] = list(rng.choice(values, rng.integers(0, len(values) + 1), replace=False))
+    return selection
+
+
+def expected_mask(frame, selection):
+    mask = np.ones(len(frame), dtype=bool)
+    for column, values in selection.items():
+        mask &= frame[column].isin(values).to_numpy()
+    return mask
+
+
+# Row counts on and off byte boundaries, including a single partial byte
+@pytest.mark.parametrize("rows", [1, 7, 8, 1003, 4096])
+def test_page_matches_boolean_indexing(rows):
+    frame = make_frame(rows, seed=rows)
+    index = FilterIndex(frame, COLUMNS)
+    rng = np.random.default_rng(rows)
+    for _ in range(30):
+        selection = random_selection(rng)
+        mask = expected_mask(frame, selection)
+        matches = len(frame[mask])
+        assert index.count(selection) == matches
+        np.testing.assert_array_equal(index.mask(selection), mask)
+
+        page_size = int(rng.choice([1, 3, 8, 10, 100]))
+        # every page, the last partial one, and one past the end
+        for page in range(matches // page_size + 2):
+            start, stop = page * page_size, (page + 1) * page_size
+            expected = frame[mask].iloc[start:stop]
+            positions = index.page(selection, page, page_size)
+            np.testing.assert_array_equal(frame.index[positions], expected.index)
+
+
+def test_empty_selection_has_no_pages():
+    frame = make_frame(1000, seed=0)
+    index = FilterIndex(frame, COLUMNS)
+    selection = {"season": []}
+    assert index.count(selection) == 0
+    assert len(index.page(selection, 0)) == 0
+    assert len(index.page(selection, 3, page_size=10)) == 0
+
+
+def test_unfiltered_pages_cover_every_row():
+    frame = make_frame(1001, seed=1)
+    index = FilterIndex(frame, COLUMNS)
+    pages = [index.page({}, page, page_size=64) for page in range(16)]
+    np.testing.assert_array_equal(np.concatenate(pages), np.arange(1001))
+    assert len(pages[-1]) == 1001 - 15 * 64
@@ -0,0 +1,55 @@
+import os
+
+import numpy as np
+import pytest
+
+from yulu_analytics.forecast import DemandForecaster
+from yulu_analytics.ingest import read_csv
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "yulu_data.csv")
+
+
+@pytest.fixture(scope="module")
+def data():
+    return read_csv(DATA)
+
+
+@pytest.fixture(scope="module")
+def single_fit(data):
+    return DemandForecaster().partial_fit(data)
+
+
+def assert_same_model(model, reference):
+    assert model.rows == reference.rows
+    np.testing.assert_allclose(model.xtx, reference.xtx, rtol=1e-9)
+    np.testing.assert_allclose(model.xty, reference.xty, rtol=1e-9)
+    np.testing.assert_array_equal(model.season_months, reference.season_months)
+    assert np.allclose(model.coefficients(), reference.coefficients())
+
+
+def test_chunked_partial_fit_matches_single_fit(data, single_fit):
+    rng = np.random.default_rng(0)
+    cuts = np.sort(rng.choice(np.arange(1, len(data)), 20, replace=False))
+    model = DemandForecaster()
+    for start, stop in zip(np.r_[0, cuts], np.r_[cuts, len(data)]):
+        model.partial_fit(data.iloc[start:stop])
+    assert_same_model(model, single_fit)
+
+
+def test_small_blocks_match_single_fit(data, single_fit):
+    assert_same_model(DemandForecaster().partial_fit(data, block_rows=997), single_fit)
+
+
+def test_merge_matches_single_fit(data, single_fit):
+    # e.g. two partitions trained separately; rows need not be contiguous
+    odd = np.arange(len(data)) % 2 == 1
+    merged = DemandForecaster().partial_fit(data[odd]).merge(DemandForecaster().partial_fit(data[~odd]))
+    assert_same_model(merged, single_fit)
+
+
+def test_update_on_appended_rows_matches_single_fit(data, single_fit):
+    model = DemandForecaster()
+    for rows in (1000, 1000, 5000, len(data) - 1, len(data), len(data)):
+        model.update(data.iloc[:rows])
+    assert_same_model(model, single_fit)
+    np.testing.assert_allclose(model.predict(data.iloc[:500]), single_fit.predict(data.iloc[:500]), rtol=1e-9)
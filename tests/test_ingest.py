@@ -0,0 +1,83 @@
+import os
+
+import pandas as pd
+import pytest
+
+from yulu_analytics.aggregates import build_cubes
+from yulu_analytics.data_cache import load_cached_frame
+from yulu_analytics.ingest import COMPACT_SHARE, LiveDataset, complete_length, read_csv, stream_csv
+
+pa = pytest.importorskip("pyarrow")
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "yulu_data.csv")
+
+
+@pytest.fixture(scope="module")
+def data():
+    return read_csv(DATA)
+
+
+def test_streamed_file_maps_back_as_one_zero_copy_frame(data, tmp_path):
+    out_path = str(tmp_path / "streamed.feather")
+    rows, cubes = stream_csv(DATA, out_path, chunk_rows=1000)
+
+    assert rows == len(data)
+    assert pa.ipc.open_file(out_path).num_record_batches == 1
+    assert os.listdir(tmp_path) == ["streamed.feather"]
+    loaded = load_cached_frame(out_path)
+    pd.testing.assert_frame_equal(loaded, data)
+    assert not loaded["count"].to_numpy().flags.writeable
+    assert not loaded["season"].cat.codes.to_numpy().flags.writeable
+    for name, cube in build_cubes(data).items():
+        pd.testing.assert_frame_equal(cubes[name], cube, check_exact=False)
+
+
+@pytest.fixture
+def growing_source(tmp_path):
+    with open(DATA, "rb") as f:
+        lines = f.readlines()
+    source = tmp_path / "growing.csv"
+    source.write_bytes(b"".join(lines[:5001]))
+    return str(source), lines[5001:]
+
+
+def append_lines(source, lines):
+    with open(source, "ab") as f:
+        f.write(b"".join(lines))
+
+
+def open_live(source):
+    data = read_csv(source)
+    return LiveDataset(source, data, build_cubes(data), complete_length(source), "base")
+
+
+def assert_matches_source(live, source):
+    data, cubes, _ = live.snapshot()
+    expected = read_csv(source)
+    pd.testing.assert_frame_equal(data, expected)
+    for name, cube in build_cubes(expected).items():
+        pd.testing.assert_frame_equal(cubes[name], cube, check_exact=False)
+
+
+def test_refresh_holds_back_a_few_rows_until_compacted(growing_source):
+    source, rest = growing_source
+    live = open_live(source)
+    before = live.snapshot()
+
+    append_lines(source, rest[:10])
+    assert live.refresh() == 0
+    assert live.snapshot() is before
+    append_lines(source, rest[10:20])
+    assert live.refresh(compact=True) == 20
+    assert live.snapshot()[2] == f"base+{live.offset}"
+    assert_matches_source(live, source)
+
+
+def test_refresh_publishes_once_the_held_rows_are_due(growing_source):
+    source, rest = growing_source
+    live = open_live(source)
+
+    append_lines(source, rest[:int(COMPACT_SHARE * 5000) + 1])
+    assert live.refresh() == int(COMPACT_SHARE * 5000) + 1
+    assert_matches_source(live, source)
+    assert live.refresh() == 0
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from yulu_analytics.online_stats import COMPRESSION, build_stats, column_summary, merge_stats
+
+PERCENTILES = ("25%", "50%", "75%")
+
+
+def chunked_stats(frame, rng, pieces):
+    # Statistics of random contiguous chunks, merged in a random order
+    cuts = np.sort(rng.choice(np.arange(1, len(frame)), pieces - 1, replace=False))
+    bounds = zip(np.r_[0, cuts], np.r_[cuts, len(frame)])
+    frames = [build_stats(frame.iloc[start:stop], list(frame.columns)) for start, stop in bounds]
+    rng.shuffle(frames)
+    return merge_stats(*frames)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_merged_moments_match_describe(seed):
+    rng = np.random.default_rng(seed)
+    rows = 20_000
+    frame = pd.DataFrame({
+        # discrete columns like the Yulu measures: quantiles stay exact
+        "count": rng.negative_binomial(2, 0.01, rows).astype("float64"),
+        "humidity": rng.integers(0, 101, rows).astype("float64"),
+        # continuous and with NaNs: compressed digest, NaNs skipped like describe()
+        "temp": np.where(rng.random(rows) < 0.05, np.nan, rng.normal(20, 8, rows)),
+    })
+    stats = chunked_stats(frame, rng, pieces=int(rng.integers(2, 40)))
+
+    for column in frame.columns:
+        expected = frame[column].describe()
+        summary = column_summary(stats, column)
+        assert summary["count"] == expected["count"]
+        for field in ("mean", "std", "min", "max"):
+            assert summary[field] == pytest.approx(expected[field], rel=1e-9, abs=1e-9)
+        if column != "temp":
+            for field in PERCENTILES:
+                assert summary[field] == expected[field]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_compressed_quantiles_within_rank_bound(seed):
+    rng = np.random.default_rng(seed)
+    rows = 100_000
+    values = np.r_[rng.normal(0, 1, rows // 2), rng.lognormal(2, 1.5, rows // 2)]
+    rng.shuffle(values)
+    stats = chunked_stats(pd.DataFrame({"value": values}), rng, pieces=int(rng.integers(2, 60)))
+
+    percentiles = np.linspace(0.001, 0.999, 999)
+    summary = column_summary(stats, "value", percentiles)
+    estimates = np.array([summary[f"{p * 100:g}%"] for p in percentiles])
+    ranks = np.searchsorted(np.sort(values), estimates) / rows
+    assert np.abs(ranks - percentiles).max() <= np.pi / COMPRESSION
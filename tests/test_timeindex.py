@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from yulu_analytics.aggregates import MEASURES
+from yulu_analytics.timeindex import TimeIndex
+
+FIRST = pd.Timestamp("2011-01-01 00:00")
+
+
+def make_frame(hours, shuffled, seed=0):
+    rng = np.random.default_rng(seed)
+    stamps = FIRST + pd.to_timedelta(np.arange(hours), unit="h")
+    frame = pd.DataFrame({"datetime": stamps})
+    for measure in MEASURES:
+        frame[measure] = rng.integers(0, 1000, hours).astype("int32")
+    return frame.sample(frac=1, random_state=seed).reset_index(drop=True) if shuffled else frame
+
+
+def expected_totals(frame, start, end):
+    mask = np.ones(len(frame), dtype=bool)
+    if start is not None:
+        mask &= (frame["datetime"] >= start).to_numpy()
+    if end is not None:
+        mask &= (frame["datetime"] < end).to_numpy()
+    rows = frame[mask]
+    totals = {"n": len(rows)}
+    for measure in MEASURES:
+        values = rows[measure].astype("int64")
+        totals[f"{measure}_sum"] = values.sum()
+        totals[f"{measure}_sumsq"] = (values ** 2).sum()
+    return totals, mask
+
+
+LAST = FIRST + pd.Timedelta(hours=499)
+WINDOWS = [
+    (None, None),
+    (FIRST, LAST + pd.Timedelta(hours=1)),               # exactly the data range
+    (FIRST, LAST),                                       # end is exclusive: drops the last row
+    (FIRST + pd.Timedelta(hours=1), LAST),               # one row in from each edge
+    (FIRST + pd.Timedelta(minutes=30), LAST - pd.Timedelta(minutes=30)),  # between rows
+    (pd.Timestamp("2011-01-05"), pd.Timestamp("2011-01-06")),           # inside
+    (FIRST - pd.Timedelta(days=30), FIRST + pd.Timedelta(hours=5)),      # overlaps the start
+    (LAST - pd.Timedelta(hours=5), LAST + pd.Timedelta(days=30)),        # overlaps the end
+    (FIRST - pd.Timedelta(days=30), FIRST),                              # before: empty
+    (LAST + pd.Timedelta(hours=1), LAST + pd.Timedelta(days=30)),        # after: empty
+    (LAST, LAST + pd.Timedelta(hours=1)),                                # the last row only
+    (pd.Timestamp("2011-01-06"), pd.Timestamp("2011-01-05")),           # reversed: empty
+    (None, FIRST + pd.Timedelta(hours=10)),
+    (FIRST + pd.Timedelta(hours=10), None),
+]
+
+
+@pytest.mark.parametrize("shuffled", [False, True])
+@pytest.mark.parametrize("start,end", WINDOWS)
+def test_totals_and_slice_match_boolean_mask(shuffled, start, end):
+    frame = make_frame(500, shuffled)
+    index = TimeIndex(frame)
+    expected, mask = expected_totals(frame, start, end)
+
+    totals = index.totals(start, end)
+    assert len(totals) == 1
+    assert totals.iloc[0].to_dict() == expected
+
+    window = index.slice(frame, start, end)
+    assert sorted(window.index) == sorted(frame.index[mask])
+    assert window["datetime"].is_monotonic_increasing
+
+
+def test_duplicate_stamps_fall_in_the_same_window():
+    # e.g. overlapping partitions: equal timestamps must not be split by the window edge
+    frame = pd.concat([make_frame(48, False, seed=1), make_frame(24, False, seed=2)], ignore_index=True)
+    index = TimeIndex(frame)
+    start, end = FIRST + pd.Timedelta(hours=12), FIRST + pd.Timedelta(hours=30)
+    expected, _ = expected_totals(frame, start, end)
+    assert index.totals(start, end).iloc[0].to_dict() == expected
+
+
+def test_span_and_empty_frame():
+    frame = make_frame(500, shuffled=True)
+    assert TimeIndex(frame).span() == (FIRST, LAST)
+    empty = TimeIndex(frame.iloc[:0])
+    assert empty.span() == (None, None)
+    assert empty.totals(FIRST, LAST).iloc[0]["n"] == 0
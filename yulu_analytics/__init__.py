@@ -0,0 +1,66 @@
+"""Headless analytics core of the Yulu app.
+
+Loading, preprocessing, aggregate cubes, hypothesis tests, insights,
+forecasts and figures as plain functions with no Streamlit dependency;
+``app.py`` is a thin renderer on top. The ``report`` module runs the same
+analysis from the command line and the ``api`` module serves it over HTTP.
+"""
+from .aggregates import build_cubes, group_mean, group_size, group_sum, overall_mean, total
+from .dataset import PREPROCESSING_VERSION, data_source, load_cubes, load_frame, open_dataset, open_partitioned
+from .forecast import DemandForecaster
+from .hypothesis import chi_square_independence, one_way_anova, split_groups, two_sample_ttest
+from .ingest import LiveDataset, SourceRewritten, preprocess, read_csv
+from .insights import (category_profile, contingency_table, correlation_matrix, count_correlations,
+                       hourly_profile, hypothesis_tests, kpis, monthly_profile, user_share, weekly_profile)
+from .online_stats import build_stats, column_summary, describe_columns, merge_stats
+from .partitions import PartitionedDataset, PartitionView, is_partitioned
+from .resampling import comparison_test, resampling_test
+from .schema import NUMERICAL_COLUMNS
+from .sections import run_sections
+from .timeindex import TimeIndex
+
+__all__ = [
+    "NUMERICAL_COLUMNS",
+    "PREPROCESSING_VERSION",
+    "DemandForecaster",
+    "LiveDataset",
+    "PartitionView",
+    "PartitionedDataset",
+    "SourceRewritten",
+    "TimeIndex",
+    "build_cubes",
+    "build_stats",
+    "category_profile",
+    "chi_square_independence",
+    "column_summary",
+    "comparison_test",
+    "contingency_table",
+    "correlation_matrix",
+    "count_correlations",
+    "data_source",
+    "describe_columns",
+    "group_mean",
+    "group_size",
+    "group_sum",
+    "hourly_profile",
+    "hypothesis_tests",
+    "is_partitioned",
+    "kpis",
+    "load_cubes",
+    "load_frame",
+    "merge_stats",
+    "monthly_profile",
+    "one_way_anova",
+    "open_dataset",
+    "open_partitioned",
+    "overall_mean",
+    "preprocess",
+    "read_csv",
+    "resampling_test",
+    "run_sections",
+    "split_groups",
+    "total",
+    "two_sample_ttest",
+    "user_share",
+    "weekly_profile",
+]
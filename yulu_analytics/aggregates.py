@@ -0,0 +1,108 @@
+"""Pre-aggregated cubes of the rental measures.
+
+Every chart in the app groups the same frame by a handful of dimensions and
+takes means or totals of ``count``/``casual``/``registered``. The cubes below
+store the additive pieces (row count, sum and sum of squares per measure) for
+each combination of dimensions once, so any mean, total or variance is a small
+rollup over the cube instead of a scan of the full frame. ``build_cubes`` also
+keeps the mergeable column statistics of ``online_stats`` under ``"stats"``.
+"""
+import numpy as np
+import pandas as pd
+
+from .online_stats import build_stats, merge_stats
+from .profiling import traced
+
+MEASURES = ["count", "casual", "registered"]
+
+# cube name -> dimensions it is grouped by
+CUBE_DIMENSIONS = {
+    "calendar": ["season", "weather", "workingday", "holiday", "year", "Month_name", "day", "hour"],
+    "daily": ["date"],
+    "humidity": ["humidity"],
+    "windspeed": ["windspeed"],
+}
+# every aggregate ``build_cubes`` returns: the cubes plus the column statistics
+AGGREGATE_NAMES = [*CUBE_DIMENSIONS, "stats"]
+
+
+def build_cube(data, dimensions, measures=MEASURES):
+    """Group ``data`` by ``dimensions`` keeping n, sum and sum of squares per measure."""
+    values = data[measures].astype("int64")
+    parts = {"n": np.ones(len(data), dtype="int64")}
+    for measure in measures:
+        parts[f"{measure}_sum"] = values[measure].to_numpy()
+        parts[f"{measure}_sumsq"] = values[measure].to_numpy() ** 2
+    frame = pd.concat([data[dimensions].reset_index(drop=True), pd.DataFrame(parts)], axis=1)
+    return frame.groupby(dimensions, observed=True).sum().reset_index()
+
+
+@traced("aggregates.build_cubes")
+def build_cubes(data, cube_dimensions=CUBE_DIMENSIONS):
+    """Build every cube in ``cube_dimensions``, and the column statistics, from the preprocessed frame."""
+    cubes = {name: build_cube(data, dimensions) for name, dimensions in cube_dimensions.items()}
+    cubes["stats"] = build_stats(data)
+    return cubes
+
+
+def _value_columns(cube):
+    return [column for column in cube.columns if column == "n" or column.endswith(("_sum", "_sumsq"))]
+
+
+def merge_cubes(*cubes):
+    """Combine cubes over the same dimensions, e.g. built from chunks of a file or from partitions."""
+    value_columns = _value_columns(cubes[0])
+    dimensions = [column for column in cubes[0].columns if column not in value_columns]
+    merged = pd.concat(cubes, ignore_index=True)
+    return merged.groupby(dimensions, observed=True)[value_columns].sum().reset_index()
+
+
+def merge_cube_sets(*cube_sets):
+    """Merge ``build_cubes`` results cube by cube, in one pass however many there are."""
+    return {name: (merge_stats if name == "stats" else merge_cubes)(*(cubes[name] for cubes in cube_sets))
+            for name in cube_sets[0]}
+
+
+def rollup(cube, by):
+    """Sum the additive cube columns over ``by`` (a dimension, list of dimensions or key array)."""
+    return cube.groupby(by, observed=True)[_value_columns(cube)].sum()
+
+
+def _per_measure(totals, measures, func):
+    if isinstance(measures, str):
+        return func(totals, measures).rename(measures)
+    return pd.DataFrame({measure: func(totals, measure) for measure in measures})
+
+
+def group_size(cube, by):
+    """Rows per group, like ``df.groupby(by).size()``."""
+    return rollup(cube, by)["n"]
+
+
+def group_sum(cube, by, measures="count"):
+    """Like ``df.groupby(by)[measures].sum()``."""
+    return _per_measure(rollup(cube, by), measures, lambda t, m: t[f"{m}_sum"])
+
+
+def group_mean(cube, by, measures="count"):
+    """Like ``df.groupby(by)[measures].mean()``."""
+    return _per_measure(rollup(cube, by), measures, lambda t, m: t[f"{m}_sum"] / t["n"])
+
+
+def group_var(cube, by, measures="count"):
+    """Sample variance per group, like ``df.groupby(by)[measures].var()``."""
+    def variance(totals, measure):
+        n = totals["n"]
+        centered = totals[f"{measure}_sumsq"] - totals[f"{measure}_sum"] ** 2 / n
+        return centered / (n - 1).where(n > 1)
+    return _per_measure(rollup(cube, by), measures, variance)
+
+
+def total(cube, measure="count"):
+    """Grand total of a measure."""
+    return int(cube[f"{measure}_sum"].sum())
+
+
+def overall_mean(cube, measure="count"):
+    """Mean of a measure over all rows."""
+    return cube[f"{measure}_sum"].sum() / cube["n"].sum()
@@ -0,0 +1,304 @@
+"""Read-only HTTP/JSON API over the loaded dataset, for services that need the numbers.
+
+The server is a small asyncio HTTP/1.1 loop (keep-alive, GET/HEAD only) with
+no dependency beyond the standard library. It serves the same numbers as the
+dashboard from the same ``LiveDataset``: started from the app it shares the
+app's frame and cubes, started with ``python -m yulu_analytics.api`` it loads
+its own.
+
+Responses are computed on a worker thread, encoded once and cached per
+dataset fingerprint. Every response carries an ETag derived from the
+fingerprint and the query, so clients can revalidate with ``If-None-Match``
+and get an empty 304 until the data changes.
+Identical queries that arrive while one is being computed wait for that
+computation instead of starting their own. The dataset is refreshed (rows
+appended to the source picked up) at most once per ``refresh_interval``, so
+repeated hits are served from memory without touching the file.
+
+Endpoints (all GET, JSON):
+
+    /health                       dataset source, rows and fingerprint
+    /v1/kpis                      overview KPIs
+    /v1/means?by=hour[,day]       mean count/casual/registered per calendar dimension(s)
+    /v1/hourly                    same as /v1/means?by=hour
+    /v1/correlations              correlation matrix of the numerical columns
+    /v1/tests                     the four hypothesis tests
+    /v1/report                    everything in ``python -m yulu_analytics.report``
+
+Usage: python -m yulu_analytics.api [source] [--host 127.0.0.1] [--port 8502]
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlsplit
+
+from .aggregates import CUBE_DIMENSIONS, MEASURES, group_mean
+from .dataset import open_dataset
+from .ingest import SourceRewritten
+from .insights import correlation_matrix, hypothesis_tests, kpis
+from .report import build_report, json_safe, strip_tables
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8502
+CACHE_ENTRIES = 256
+MAX_REQUEST_BYTES = 16 * 1024
+
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+class QueryError(Exception):
+    """A query the API cannot answer; ``status`` is the HTTP status to reply with."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _means(data, cubes, by="hour"):
+    dimensions = [dimension for dimension in by.split(",") if dimension]
+    unknown = [dimension for dimension in dimensions if dimension not in CUBE_DIMENSIONS["calendar"]]
+    if not dimensions or unknown:
+        raise QueryError(400, f"'by' must be one or more of {', '.join(CUBE_DIMENSIONS['calendar'])}")
+    return group_mean(cubes["calendar"], dimensions, MEASURES).reset_index().to_dict("records")
+
+
+def _correlations(data, cubes):
+    return correlation_matrix(data).to_dict()
+
+
+# path -> (function of data, cubes and the query parameters, allowed parameters)
+ROUTES = {
+    "/health": (None, ()),
+    "/v1/kpis": (lambda data, cubes: kpis(data, cubes["calendar"], cubes["stats"]), ()),
+    "/v1/means": (_means, ("by",)),
+    "/v1/hourly": (lambda data, cubes: _means(data, cubes, "hour"), ()),
+    "/v1/correlations": (_correlations, ()),
+    "/v1/tests": (lambda data, cubes: strip_tables(hypothesis_tests(data, cubes["calendar"])), ()),
+    "/v1/report": (lambda data, cubes: build_report(data, cubes["calendar"], cubes["stats"]), ()),
+}
+
+
+class QueryAPI:
+    """Routing, response caching and request coalescing over a ``LiveDataset``."""
+
+    def __init__(self, live, refresh_interval=1.0, cache_entries=CACHE_ENTRIES):
+        self.live = live
+        self.refresh_interval = refresh_interval
+        self.cache_entries = cache_entries
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._inflight = {}
+        self._refreshed = 0.0
+        self._refresh_lock = threading.Lock()
+
+    def refresh_due(self):
+        return time.monotonic() - self._refreshed >= self.refresh_interval
+
+    def refresh(self):
+        """Pick up appended rows, at most once per ``refresh_interval``; reload a rewritten source."""
+        now = time.monotonic()
+        if now - self._refreshed < self.refresh_interval or not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            self._refreshed = now
+            try:
+                appended = self.live.refresh()
+                if appended:
+                    logger.info(f"API: appended {appended:,} new rows from {self.live.source}")
+            except SourceRewritten as e:
+                logger.warning(f"API: {str(e)}, reloading")
+                self.live = open_dataset(self.live.source)
+        finally:
+            self._refresh_lock.release()
+
+    def compute(self, path, params, snapshot):
+        data, cubes, fingerprint = snapshot
+        if path == "/health":
+            return {"source": self.live.source, "rows": len(data), "fingerprint": fingerprint}
+        func, _ = ROUTES[path]
+        return func(data, cubes, **params)
+
+    def encode(self, path, params, snapshot):
+        """Compute and JSON-encode one response; runs on a worker thread."""
+        # allow_nan=False: a NaN that slips past json_safe fails the request instead of emitting invalid JSON
+        return json.dumps(json_safe(self.compute(path, params, snapshot)), default=str,
+                          allow_nan=False).encode("utf-8")
+
+    async def respond(self, path, params):
+        """Return (status, body bytes, ETag) for a GET of ``path`` with ``params``."""
+        if path not in ROUTES:
+            raise QueryError(404, f"Unknown endpoint {path}")
+        unknown = sorted(set(params) - set(ROUTES[path][1]))
+        if unknown:
+            raise QueryError(400, f"Unknown parameter(s) {', '.join(unknown)} for {path}")
+
+        loop = asyncio.get_running_loop()
+        if self.refresh_due():
+            # Stats the source file, so off the event loop
+            await loop.run_in_executor(None, self.refresh)
+        snapshot = self.live.snapshot()
+        fingerprint = snapshot[2]
+        query = "&".join(f"{key}={value}" for key, value in sorted(params.items()))
+        key = (fingerprint, path, query)
+        etag = '"' + hashlib.blake2b(repr(key).encode("utf-8"), digest_size=12).hexdigest() + '"'
+
+        body = self._cache.get(key)
+        if body is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return 200, body, etag
+
+        # Identical concurrent misses share one computation
+        pending = self._inflight.get(key)
+        if pending is None:
+            self.misses += 1
+            pending = loop.run_in_executor(None, self.encode, path, params, snapshot)
+            self._inflight[key] = pending
+            try:
+                body = await pending
+            finally:
+                del self._inflight[key]
+            self._store(key, body)
+        else:
+            body = await asyncio.shield(pending)
+        return 200, body, etag
+
+    def _store(self, key, body):
+        # Responses of older dataset versions can never be served again
+        fingerprint = key[0]
+        for stale in [cached for cached in self._cache if cached[0] != fingerprint]:
+            del self._cache[stale]
+        self._cache[key] = body
+        while len(self._cache) > self.cache_entries:
+            self._cache.popitem(last=False)
+
+    def stats(self):
+        return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses,
+                "inflight": len(self._inflight)}
+
+
+def _response(status, body=b"", etag=None, keep_alive=True, head=False):
+    headers = [
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+        "Content-Type: application/json",
+        f"Content-Length: {len(body)}",
+        "Cache-Control: no-cache",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if etag:
+        headers.append(f"ETag: {etag}")
+    head_bytes = ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1")
+    return head_bytes if head or status == 304 else head_bytes + body
+
+
+def _error_body(message):
+    return json.dumps({"error": message}).encode("utf-8")
+
+
+async def _read_request(reader):
+    # Request line and headers, or None when the client closed the connection
+    try:
+        raw = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise QueryError(400, "Request headers too large")
+    lines = raw.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise QueryError(400, "Malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name:
+            headers[name.strip().lower()] = value.strip()
+    return method, target, version, headers
+
+
+async def handle_connection(api, reader, writer):
+    """Serve requests on one connection until the client closes it or asks to."""
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except QueryError as e:
+                writer.write(_response(e.status, _error_body(str(e)), keep_alive=False))
+                break
+            if request is None:
+                break
+            method, target, version, headers = request
+            keep_alive = (headers.get("connection", "").lower() != "close"
+                          if version == "HTTP/1.1" else headers.get("connection", "").lower() == "keep-alive")
+            if int(headers.get("content-length", 0) or 0):
+                # GET/HEAD only: a body is not expected, so don't try to stay in sync with it
+                keep_alive = False
+
+            if method not in ("GET", "HEAD"):
+                status, body, etag = 405, _error_body(f"Method {method} not allowed"), None
+            else:
+                url = urlsplit(target)
+                try:
+                    status, body, etag = await api.respond(url.path, dict(parse_qsl(url.query)))
+                except QueryError as e:
+                    status, body, etag = e.status, _error_body(str(e)), None
+                except Exception as e:
+                    logger.error(f"API error for {target}: {str(e)}")
+                    status, body, etag = 500, _error_body("Internal server error"), None
+                if etag and etag in headers.get("if-none-match", ""):
+                    status = 304
+            writer.write(_response(status, body, etag, keep_alive, head=method == "HEAD"))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(api, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Run the API on ``host:port`` until cancelled."""
+    server = await asyncio.start_server(lambda reader, writer: handle_connection(api, reader, writer),
+                                        host, port, limit=MAX_REQUEST_BYTES)
+    logger.info(f"API listening on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def serve_in_thread(live, host=DEFAULT_HOST, port=DEFAULT_PORT, **options):
+    """Start the API for ``live`` on a daemon thread with its own event loop; returns the ``QueryAPI``."""
+    api = QueryAPI(live, **options)
+    thread = threading.Thread(target=asyncio.run, args=(serve(api, host, port),), name="yulu-api", daemon=True)
+    thread.start()
+    return api
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="?", help="CSV to serve (default: the app's data source)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--refresh-interval", type=float, default=1.0,
+                        help="seconds between checks for rows appended to the source")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    api = QueryAPI(open_dataset(args.source), refresh_interval=args.refresh_interval)
+    try:
+        asyncio.run(serve(api, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Declarative binning rules for the derived level columns of the Yulu dataset.
+
+Each rule lists the upper edges of its bins and whether the edge value itself
+still belongs to the lower bin, so every real value lands in exactly one bin
+(the old if/elif ladders left gaps such as humidity 10.5 or windspeed 10.5).
+Rules are evaluated with ``np.searchsorted`` over whole columns instead of one
+Python call per row.
+"""
+import numpy as np
+import pandas as pd
+
+# column -> source column, (edge, edge-in-lower-bin) pairs, labels, valid range
+BIN_SPECS = {
+    "temperature": {
+        "source": "atemp",
+        "edges": [(12, True), (24, False), (35, False)],
+        "labels": ["Very Low", "Low", "Moderate", "High"],
+        "bounds": (None, None),
+    },
+    "humidity_level": {
+        "source": "humidity",
+        "edges": [(edge, True) for edge in range(10, 100, 10)],
+        "labels": [f"{pct}%" for pct in range(10, 101, 10)],
+        "bounds": (0, 100),
+    },
+    "windspeed_level": {
+        "source": "windspeed",
+        "edges": [(10, True), (20, True), (30, True)],
+        "labels": ["Low", "Moderate", "High", "Very High"],
+        "bounds": (0, None),
+    },
+}
+
+
+def bin_codes(values, edges, bounds=(None, None)):
+    """Return the bin index of every value, -1 for missing or out-of-range values."""
+    values = np.asarray(values, dtype="float64")
+    closed_upper = np.array([edge for edge, in_lower in edges if in_lower], dtype="float64")
+    closed_lower = np.array([edge for edge, in_lower in edges if not in_lower], dtype="float64")
+
+    # Count the edges each value has passed: strictly for edges that close the
+    # lower bin, inclusively for edges that open the upper one.
+    codes = (np.searchsorted(closed_upper, values, side="left")
+             + np.searchsorted(closed_lower, values, side="right")).astype("int8")
+
+    invalid = np.isnan(values)
+    low, high = bounds
+    if low is not None:
+        invalid |= values < low
+    if high is not None:
+        invalid |= values > high
+    codes[invalid] = -1
+    return codes
+
+
+def apply_bins(data, specs=BIN_SPECS):
+    """Add one ordered ``Categorical`` column per spec to ``data`` in place."""
+    for column, spec in specs.items():
+        codes = bin_codes(data[spec["source"]].to_numpy(), spec["edges"], spec["bounds"])
+        data[column] = pd.Categorical.from_codes(codes, categories=spec["labels"], ordered=True)
+    return data
@@ -0,0 +1,70 @@
+"""Calendar columns derived from the ``datetime`` column with integer arithmetic.
+
+The raw timestamps all have the fixed ``YYYY-MM-DD HH:MM:SS`` layout, so they
+are parsed with an explicit format instead of per-row format inference. Hour,
+date, weekday, month and year then come from the epoch seconds with vectorized
+integer math (days-from-civil inverted, as in Howard Hinnant's date
+algorithms), and the day and month names are categoricals built straight from
+the integer codes instead of locale-aware string builders.
+"""
+import numpy as np
+import pandas as pd
+
+from .schema import DAY_NAMES, MONTH_NAMES
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+SECONDS_PER_DAY = 86_400
+NS_PER_SECOND = 1_000_000_000
+
+
+def parse_datetimes(values, format=DATETIME_FORMAT):
+    """Parse timestamps with a fixed ``format``; epoch integers (seconds) are also accepted."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return pd.to_datetime(values)
+    if pd.api.types.is_integer_dtype(values):
+        return pd.to_datetime(values, unit="s")
+    return pd.to_datetime(values, format=format)
+
+
+def civil_from_days(days):
+    """Year, month (1-12) and day of month for days since 1970-01-01 (proleptic Gregorian)."""
+    z = days + 719_468
+    era = np.floor_divide(z, 146_097)
+    doe = z - era * 146_097
+    yoe = (doe - doe // 1460 + doe // 36_524 - doe // 146_096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def calendar_columns(timestamps):
+    """Derive the calendar columns used by the app from parsed timestamps.
+
+    Returns a dict with ``day`` (weekday name), ``date`` (midnight), ``hour``,
+    ``Month``, ``Month_name`` and ``year`` in the compact schema dtypes.
+    """
+    seconds = np.asarray(timestamps, dtype="datetime64[s]").astype("int64")
+    days = np.floor_divide(seconds, SECONDS_PER_DAY)
+    year, month, _ = civil_from_days(days)
+    # 1970-01-01 was a Thursday (index 3 with Monday = 0)
+    weekday = (days + 3) % 7
+    return {
+        "day": pd.Categorical.from_codes(weekday.astype("int8"), categories=DAY_NAMES),
+        "date": (days * SECONDS_PER_DAY * NS_PER_SECOND).view("datetime64[ns]"),
+        "hour": ((seconds - days * SECONDS_PER_DAY) // 3600).astype("int8"),
+        "Month": month.astype("int8"),
+        "Month_name": pd.Categorical.from_codes((month - 1).astype("int8"), categories=MONTH_NAMES),
+        "year": year.astype("int16"),
+    }
+
+
+def add_calendar_columns(data):
+    """Parse ``data["datetime"]`` and add the derived calendar columns in place."""
+    data["datetime"] = parse_datetimes(data["datetime"])
+    for column, values in calendar_columns(data["datetime"]).items():
+        data[column] = values
+    return data
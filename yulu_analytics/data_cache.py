@@ -0,0 +1,133 @@
+"""Persistent on-disk cache for the preprocessed Yulu frame.
+
+``st.cache_data`` only lives as long as the server process, so every new
+replica used to re-parse the CSV and rerun preprocessing. This module stores
+the preprocessed frame as an uncompressed Feather (Arrow IPC) file keyed on the
+source file's content hash and the preprocessing version, and memory-maps it
+back on a warm start. If pyarrow is not installed the cache is simply skipped.
+Entries are named after the source file and its directory, so after a store
+the entries of older versions of the same source (and their cube sidecars)
+are removed instead of piling up with every append.
+
+A mapped frame's columns are read-only views of the file's pages rather than
+heap copies, so every session and every server process on the node shares one
+copy of the data through the OS page cache.
+"""
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from functools import lru_cache
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.environ.get("YULU_CACHE_DIR", ".yulu_cache")
+
+
+def file_digest(path):
+    """Return the BLAKE2b hex digest of a file's content.
+
+    Digests are memoized on (path, size, mtime) so the file is only hashed
+    again after it changes.
+    """
+    stat = os.stat(path)
+    return _file_digest(os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _file_digest(path, size, mtime_ns, chunk_size=1 << 20):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dataset_fingerprint(source, version):
+    """Identify a preprocessed dataset by source content and preprocessing version."""
+    return f"{file_digest(source)}-v{version}"
+
+
+def _source_prefix(source):
+    # File stem plus a tag of its directory: partitions of different zones share file names
+    directory = os.path.dirname(os.path.abspath(source))
+    tag = hashlib.blake2b(directory.encode("utf-8"), digest_size=4).hexdigest()
+    return f"{os.path.splitext(os.path.basename(source))[0]}-{tag}"
+
+
+def cache_path(source, version, cache_dir=CACHE_DIR):
+    """Path of the cached frame for this source content and preprocessing version."""
+    return os.path.join(cache_dir, f"{_source_prefix(source)}-{dataset_fingerprint(source, version)}.feather")
+
+
+# <prefix>-<content digest>-v<version>[.<sidecar>].feather
+_ENTRY = re.compile(r"(?P<prefix>.+)-(?P<fingerprint>[0-9a-f]{32}-v\d+)(\.\w+)?\.feather$")
+
+
+def _prune(path):
+    # Entries of the same source for other content or preprocessing versions are stale
+    entry = _ENTRY.match(os.path.basename(path))
+    if entry is None:
+        return
+    cache_dir = os.path.dirname(path) or "."
+    for filename in os.listdir(cache_dir):
+        other = _ENTRY.match(filename)
+        if other is None:
+            continue
+        if other["prefix"] == entry["prefix"] and other["fingerprint"] != entry["fingerprint"]:
+            try:
+                os.remove(os.path.join(cache_dir, filename))
+            except OSError:
+                pass
+
+
+def sidecar_path(path, name):
+    """Path of a companion file (e.g. an aggregate cube) stored next to a cached frame."""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{name}{ext}"
+
+
+def load_cached_frame(path):
+    """Memory-map a cached frame, or return None when there is no usable entry.
+
+    Single-chunk columns come back as zero-copy, read-only views of the mapping;
+    ``split_blocks`` stops pandas from consolidating them into new 2D blocks.
+    """
+    if feather is None or not os.path.exists(path):
+        return None
+    try:
+        table = feather.read_table(path, memory_map=True)
+        return table.to_pandas(split_blocks=True)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache file {path}: {str(e)}")
+        return None
+
+
+def store_cached_frame(df, path):
+    """Write the frame to the cache; failures are logged and otherwise ignored."""
+    if feather is None:
+        return None
+    cache_dir = os.path.dirname(path) or "."
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file and rename so concurrent replicas never read a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        os.close(fd)
+        # One record batch: multi-chunk columns would be concatenated into heap copies on load
+        feather.write_feather(df, tmp_path, compression="uncompressed", chunksize=max(len(df), 1))
+        os.replace(tmp_path, path)
+        logger.info(f"Cached preprocessed data to {path}")
+        _prune(path)
+        return path
+    except Exception as e:
+        logger.warning(f"Could not write cache file {path}: {str(e)}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return None
@@ -0,0 +1,97 @@
+"""Locating, loading and caching the preprocessed Yulu dataset.
+
+``load_frame`` is the whole load path the app used to run inline: the on-disk
+Feather cache first, then chunked streaming for large files, then a plain
+``read_csv``. ``open_dataset`` wraps the result in a ``LiveDataset`` so the
+app, batch jobs and benchmarks all start from the same frame and cubes. A
+partition directory (see partitions.py) is opened file by file through the
+same path.
+"""
+import functools
+import logging
+import os
+
+from .aggregates import AGGREGATE_NAMES, build_cubes
+from .data_cache import cache_path, dataset_fingerprint, load_cached_frame, sidecar_path, store_cached_frame
+from .ingest import CHUNK_ROWS, LiveDataset, can_stream, complete_length, read_csv, stream_csv
+from .partitions import PartitionedDataset, is_partitioned
+from .profiling import traced
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever preprocessing or the cube layout changes so stale disk caches are ignored
+PREPROCESSING_VERSION = 3
+
+# Source files larger than this are ingested in chunks with bounded memory
+STREAMING_THRESHOLD_BYTES = int(os.environ.get("YULU_STREAMING_THRESHOLD_BYTES", 256 * 1024 * 1024))
+
+
+def data_source():
+    """Return what the app reads: ``YULU_DATA_SOURCE`` (a CSV or a partition directory) if set,
+    else ``yulu_data.csv`` if present, else the bundled sample."""
+    if os.environ.get("YULU_DATA_SOURCE"):
+        return os.environ["YULU_DATA_SOURCE"]
+    return "yulu_data.csv" if os.path.exists("yulu_data.csv") else "bike_sharing.txt"
+
+
+@traced("dataset.load_frame")
+def load_frame(source, version=PREPROCESSING_VERSION):
+    """Load the preprocessed frame for ``source``, memory-mapped when the disk cache is available."""
+    cache_file = cache_path(source, version)
+    data = load_cached_frame(cache_file)
+    if data is not None:
+        logger.info(f"Dataset loaded from cache {cache_file}: {data.shape}")
+        return data
+
+    if can_stream() and os.path.getsize(source) > STREAMING_THRESHOLD_BYTES:
+        # Large files: preprocess chunk by chunk, spill rows to the Feather cache
+        # and keep only the aggregate cubes in memory, then memory-map the result
+        logger.info(f"Streaming ingestion of {source} in chunks of {CHUNK_ROWS:,} rows")
+        rows, cubes = stream_csv(source, cache_file)
+        for name, cube in cubes.items():
+            store_cached_frame(cube, sidecar_path(cache_file, name))
+        logger.info(f"Streamed {rows:,} rows")
+        return load_cached_frame(cache_file)
+
+    data = read_csv(source)
+    logger.info(f"Dataset loaded: {data.shape}")
+    logger.info("Preprocessing completed")
+    if store_cached_frame(data, cache_file):
+        # Serve the mapped copy so the parsed heap copy can be freed
+        mapped = load_cached_frame(cache_file)
+        if mapped is not None:
+            data = mapped
+    return data
+
+
+@traced("dataset.load_cubes")
+def load_cubes(source, data, version=PREPROCESSING_VERSION):
+    """Return the aggregate cubes and column statistics of ``data``, from the sidecar caches when they exist."""
+    cache_file = cache_path(source, version)
+    cubes = {name: load_cached_frame(sidecar_path(cache_file, name)) for name in AGGREGATE_NAMES}
+    if any(cube is None for cube in cubes.values()):
+        cubes = build_cubes(data)
+        for name, cube in cubes.items():
+            store_cached_frame(cube, sidecar_path(cache_file, name))
+    return cubes
+
+
+def open_partitioned(directory, version=PREPROCESSING_VERSION):
+    """A ``PartitionedDataset`` of ``directory`` whose partitions open like single files."""
+    return PartitionedDataset(directory, functools.partial(open_dataset, version=version))
+
+
+def open_dataset(source=None, version=PREPROCESSING_VERSION):
+    """Load ``source`` (default ``data_source()``) into a ``LiveDataset``.
+
+    The offset is taken before loading; rows appended meanwhile are picked up
+    by the first ``refresh()`` and deduplicated by datetime. A partition
+    directory is opened whole, as a ``PartitionView`` of every partition.
+    """
+    source = source or data_source()
+    if is_partitioned(source):
+        return open_partitioned(source, version).view()
+    offset = complete_length(source)
+    data = load_frame(source, version)
+    return LiveDataset(source, data, load_cubes(source, data, version), offset,
+                       dataset_fingerprint(source, version))
@@ -0,0 +1,145 @@
+"""On-demand file exports of the dataset and its summaries, cached on disk.
+
+``export_file`` writes an export only when it is requested, in row chunks so
+memory stays bounded by the chunk size rather than the size of the output,
+and keeps it under the dataset fingerprint so later requests from any session
+or server process just read the finished file. Writing an export removes the
+exports of the same name for other dataset versions, i.e. other fingerprints
+once the ``@<start>-<end>`` date window is set aside, so sessions looking at
+different windows of the same data keep each other's files. CSV and
+gzip-compressed CSV are always available; Parquet and Arrow IPC need pyarrow.
+"""
+import gzip
+import logging
+import os
+import re
+import tempfile
+
+from .data_cache import CACHE_DIR
+from .ingest import CHUNK_ROWS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+EXPORT_DIR = os.path.join(CACHE_DIR, "exports")
+
+# format -> (label, file extension, MIME type)
+EXPORT_FORMATS = {
+    "csv": ("CSV", ".csv", "text/csv"),
+    "csv.gz": ("CSV (gzip)", ".csv.gz", "application/gzip"),
+    "parquet": ("Parquet", ".parquet", "application/vnd.apache.parquet"),
+    "arrow": ("Arrow IPC", ".arrow", "application/vnd.apache.arrow.file"),
+}
+ARROW_FORMATS = {"parquet", "arrow"}
+
+
+def available_formats():
+    return [fmt for fmt in EXPORT_FORMATS if pa is not None or fmt not in ARROW_FORMATS]
+
+
+def _chunks(frame, chunk_rows):
+    # At least one (possibly empty) chunk so empty frames still get a header / schema
+    for start in range(0, max(len(frame), 1), chunk_rows):
+        yield frame.iloc[start:start + chunk_rows]
+
+
+def _to_table(chunk, index):
+    # Summary tables like describe(include='all') mix numbers and labels in one column
+    mixed = [column for column in chunk.columns if chunk[column].dtype == object]
+    if mixed:
+        chunk = chunk.astype({column: "string" for column in mixed})
+    return pa.Table.from_pandas(chunk, preserve_index=index)
+
+
+def write_export(frame, path, fmt, index=False, chunk_rows=CHUNK_ROWS):
+    """Write ``frame`` to ``path`` in ``fmt``, ``chunk_rows`` rows at a time.
+
+    The file is written to a temp file and renamed, so readers never see a partial export.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}")
+    if fmt in ARROW_FORMATS and pa is None:
+        raise RuntimeError(f"Exporting {fmt} requires pyarrow")
+    out_dir = os.path.dirname(path) or "."
+    os.makedirs(out_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+        if fmt in ("csv", "csv.gz"):
+            opener = gzip.open if fmt == "csv.gz" else open
+            with opener(tmp_path, "wt", newline="") as f:
+                for i, chunk in enumerate(_chunks(frame, chunk_rows)):
+                    chunk.to_csv(f, index=index, header=i == 0)
+        else:
+            writer = None
+            try:
+                for chunk in _chunks(frame, chunk_rows):
+                    table = _to_table(chunk, index)
+                    if writer is None:
+                        writer = (pq.ParquetWriter(tmp_path, table.schema) if fmt == "parquet"
+                                  else pa.ipc.new_file(tmp_path, table.schema))
+                    writer.write_table(table)
+            finally:
+                if writer is not None:
+                    writer.close()
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return path
+
+
+def _dataset_version(fingerprint):
+    # A date window's fingerprint is the dataset's plus "@<start>-<end>"
+    return re.split(r"[@.]", fingerprint, maxsplit=1)[0]
+
+
+def _prune(export_dir, name, fingerprint):
+    # Exports of the same name for other dataset versions are stale; other windows of this one are not
+    version = _dataset_version(fingerprint)
+    for filename in os.listdir(export_dir):
+        if filename.startswith(f"{name}-") and _dataset_version(filename[len(name) + 1:]) != version:
+            try:
+                os.remove(os.path.join(export_dir, filename))
+            except OSError:
+                pass
+
+
+def export_file(frame, fingerprint, name, fmt, index=False, export_dir=EXPORT_DIR):
+    """Path of the ``fmt`` export ``name`` of ``frame`` for ``fingerprint``, writing it on first use.
+
+    ``frame`` may be a callable returning the frame, so summaries are only
+    computed when the export is not cached yet.
+    """
+    path = os.path.join(export_dir, f"{name}-{fingerprint}{EXPORT_FORMATS[fmt][1]}")
+    if os.path.exists(path):
+        return path
+    if callable(frame):
+        frame = frame()
+    try:
+        write_export(frame, path, fmt, index)
+    except OSError as e:
+        # Unwritable cache directory: export into the temp directory instead
+        logger.warning(f"Could not write export to {export_dir}: {str(e)}")
+        export_dir = os.path.join(tempfile.gettempdir(), "yulu_exports")
+        path = os.path.join(export_dir, os.path.basename(path))
+        write_export(frame, path, fmt, index)
+    logger.info(f"Exported {name} ({fmt}) to {path}")
+    _prune(export_dir, name, fingerprint)
+    return path
+
+
+def export_bytes(frame, fingerprint, name, fmt, index=False):
+    """Contents of ``export_file(...)``, for download buttons that need the bytes."""
+    try:
+        with open(export_file(frame, fingerprint, name, fmt, index), "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        # Pruned by another process exporting a newer version in the meantime: write it again
+        with open(export_file(frame, fingerprint, name, fmt, index), "rb") as f:
+            return f.read()
@@ -0,0 +1,97 @@
+"""LRU cache of pre-rendered Plotly figures.
+
+Building a figure with ``px.*``/``go.Figure`` runs plotly's property
+validators over every trace and layout attribute, which costs far more than
+the figure's data. Figures that do not depend on user input are therefore
+built once per dataset fingerprint and kept as their serialized JSON
+(zlib-compressed by default). A hit only decompresses the JSON and wraps it in
+a ``go.Figure`` with validation skipped, since it was validated when built.
+"""
+import json
+import threading
+import zlib
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+
+class FigureCache:
+    """Serialized figures keyed by (figure id, parameters, dataset fingerprint)."""
+
+    def __init__(self, max_entries=128, compress=True, level=1):
+        self.max_entries = max_entries
+        self.compress = compress
+        self.level = level
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._building = {}
+        self._lock = threading.Lock()
+
+    def _encode(self, fig):
+        payload = pio.to_json(fig, validate=False).encode("utf-8")
+        return zlib.compress(payload, self.level) if self.compress else payload
+
+    def _decode(self, payload):
+        if self.compress:
+            payload = zlib.decompress(payload)
+        # The stored JSON came from a validated figure; `_validate` is the switch
+        # plotly itself uses to load trusted figure specs (e.g. templates)
+        return go.Figure(json.loads(payload), _validate=False)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key, build):
+        """Return the figure cached under ``key``, calling ``build()`` on a miss.
+
+        Concurrent misses on the same key (e.g. a session and the warm-up
+        thread) build the figure once; the others wait for that build.
+        """
+        return self._decode(self._payload(key, build))
+
+    def fill(self, key, build):
+        """Make sure ``key`` is cached, like ``get`` but without decoding the figure."""
+        self._payload(key, build)
+
+    def _payload(self, key, build):
+        pending = None
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                pending = self._building.get(key)
+                if pending is None:
+                    self.misses += 1
+                    self._building[key] = threading.Event()
+        if payload is not None:
+            return payload
+        if pending is not None:
+            pending.wait()
+            return self._payload(key, build)
+
+        try:
+            payload = self._encode(build())
+            with self._lock:
+                self._entries[key] = payload
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        finally:
+            with self._lock:
+                self._building.pop(key).set()
+        return payload
+
+    def stats(self):
+        """Entry count, stored bytes and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": sum(len(payload) for payload in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
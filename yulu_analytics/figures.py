@@ -0,0 +1,867 @@
+"""Plotly figures shown in the app, as pure functions of the data and cubes.
+
+Every builder takes the preprocessed frame and the aggregate cubes (plus any
+user-selected parameters) and returns a ``go.Figure``, so none of them depends
+on Streamlit state. Builders register under a figure id, which together with
+the parameters and the dataset fingerprint keys the ``FigureCache``; ``warm``
+pre-renders every registered figure for a dataset. Builders that need a table
+other views also use, like the correlation matrix, declare it among their
+``INPUTS``, so callers can pass the copy they already cached.
+"""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from .aggregates import group_mean, group_size, group_sum, total
+from .hypothesis import split_groups
+from .insights import correlation_matrix
+from .profiling import span
+from .sampling import binned_mean, ols_trendlines, stratified_sample
+from .schema import NUMERICAL_COLUMNS
+
+# Scatter plots above this many rows are sampled or binned before plotting
+SCATTER_MAX_POINTS = 20000
+
+# Tables builders can take besides the data and cubes: name -> how to compute it from the data
+INPUTS = {"corr": correlation_matrix}
+
+# figure id -> builder, the parameter sets pre-rendered by warm() and the INPUTS it takes
+FIGURES = {}
+WARM_PARAMS = {}
+FIGURE_INPUTS = {}
+
+
+def figure(figure_id, warm_params=({},), inputs=()):
+    """Register a builder under ``figure_id``; it is passed the named ``INPUTS`` as keyword arguments."""
+    def register(builder):
+        FIGURES[figure_id] = builder
+        WARM_PARAMS[figure_id] = warm_params
+        FIGURE_INPUTS[figure_id] = inputs
+        return builder
+    return register
+
+
+def inputs_of(figure_ids):
+    """Names of the ``INPUTS`` the builders of ``figure_ids`` take."""
+    return {name for figure_id in figure_ids for name in FIGURE_INPUTS[figure_id]}
+
+
+def _build(figure_id, data, cubes, inputs, params):
+    # Inputs the caller did not pass are computed from the data and kept in ``inputs`` for the next build
+    for name in FIGURE_INPUTS[figure_id]:
+        if name not in inputs:
+            inputs[name] = INPUTS[name](data)
+    return FIGURES[figure_id](data, cubes, **{name: inputs[name] for name in FIGURE_INPUTS[figure_id]}, **params)
+
+
+def figure_key(figure_id, fingerprint, **params):
+    return (figure_id, tuple(sorted(params.items())), fingerprint)
+
+
+def render(cache, figure_id, fingerprint, data, cubes, inputs=None, **params):
+    """Return a figure from ``cache``, building it on a miss.
+
+    ``inputs`` maps ``INPUTS`` names to tables already computed for this
+    data; like the data itself they are covered by the fingerprint.
+    """
+    key = figure_key(figure_id, fingerprint, **params)
+    inputs = {} if inputs is None else inputs
+    with span(f"figure.{figure_id}", len(data)) as record:
+        record["cached"] = key in cache
+        return cache.get(key, lambda: _build(figure_id, data, cubes, inputs, params))
+
+
+def prebuild(cache, figure_id, fingerprint, data, cubes, inputs=None, **params):
+    """Build a figure into ``cache`` on a miss, without decoding it like ``render`` does."""
+    key = figure_key(figure_id, fingerprint, **params)
+    inputs = {} if inputs is None else inputs
+    with span(f"figure.{figure_id}", len(data)) as record:
+        record["cached"] = key in cache
+        cache.fill(key, lambda: _build(figure_id, data, cubes, inputs, params))
+
+
+def warm(cache, fingerprint, data, cubes, inputs=None):
+    """Pre-render every registered figure (with its warm parameters) into ``cache``.
+
+    Inputs not passed in are computed at most once for all the figures.
+    """
+    inputs = dict(inputs or {})
+    for figure_id, param_sets in WARM_PARAMS.items():
+        for params in param_sets:
+            prebuild(cache, figure_id, fingerprint, data, cubes, inputs, **params)
+
+
+@figure("season_counts")
+def plot_season_counts(data, cubes):
+    cube = cubes['calendar']
+    season_counts = group_size(cube, 'season').sort_values(ascending=False)
+
+    fig = go.Figure(data=[go.Bar(
+        x=season_counts.index,
+        y=season_counts.values,
+        marker=dict(
+            color=['#667eea', '#f093fb', '#11998e', '#fa709a'],
+            line=dict(color='rgba(255,255,255,0.3)', width=2)
+        ),
+        text=season_counts.values,
+        textposition='outside',
+        hovertemplate='<b>%{x}</b><br>Records: %{y}<br>Percentage: %{y:.1%}<extra></extra>'
+    )])
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False, title='Season'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Number of Records'),
+        height=350
+    )
+    return fig
+
+
+@figure("weather_counts")
+def plot_weather_counts(data, cubes):
+    cube = cubes['calendar']
+    weather_counts = group_size(cube, 'weather').sort_values(ascending=False)
+
+    fig = go.Figure(data=[go.Pie(
+        labels=weather_counts.index,
+        values=weather_counts.values,
+        hole=0.4,
+        marker=dict(colors=['#667eea', '#f093fb', '#11998e', '#fa709a']),
+        textinfo='label+percent',
+        hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
+    )])
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        height=350,
+        showlegend=True
+    )
+    return fig
+
+
+@figure("season_means")
+def plot_season_means(data, cubes):
+    cube = cubes['calendar']
+    season_avg = group_mean(cube, 'season').reset_index()
+
+    fig = go.Figure(data=[go.Bar(
+        x=season_avg['season'],
+        y=season_avg['count'],
+        marker=dict(color=['#667eea', '#f093fb', '#11998e', '#fa709a']),
+        text=[f'{v:.0f}' for v in season_avg['count']],
+        textposition='outside',
+        hovertemplate='<b>%{x}</b><br>Avg Rentals: %{y:.1f}<extra></extra>'
+    )])
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False, title='Season'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Average Rentals per Hour'),
+        height=350
+    )
+    return fig
+
+
+@figure("weather_means")
+def plot_weather_means(data, cubes):
+    cube = cubes['calendar']
+    weather_avg = group_mean(cube, 'weather').reset_index()
+
+    fig = go.Figure(data=[go.Bar(
+        x=weather_avg['weather'],
+        y=weather_avg['count'],
+        marker=dict(
+            color=weather_avg['count'],
+            colorscale='Viridis',
+            showscale=True,
+            colorbar=dict(title='Avg<br>Rentals')
+        ),
+        text=[f'{v:.0f}' for v in weather_avg['count']],
+        textposition='outside',
+        hovertemplate='<b>%{x}</b><br>Avg Rentals: %{y:.1f}<extra></extra>'
+    )])
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False, title='Weather Condition'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Average Rentals per Hour'),
+        height=350
+    )
+    return fig
+
+
+@figure("hourly_means")
+def plot_hourly_means(data, cubes):
+    cube = cubes['calendar']
+    hourly_data = group_mean(cube, 'hour').reset_index()
+
+    fig = px.line(hourly_data, x='hour', y='count',
+                  markers=True)
+    fig.update_traces(line_color='#8b5cf6', line_width=3, marker=dict(size=8, color='#ec4899'))
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Hour of Day (0-23)'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Average Bike Rentals'),
+        height=400,
+        hovermode='x unified'
+    )
+    fig.add_annotation(
+        x=hourly_data.loc[hourly_data['count'].idxmax(), 'hour'],
+        y=hourly_data['count'].max(),
+        text=f"Peak: {hourly_data['count'].max():.0f} bikes",
+        showarrow=True,
+        arrowhead=2,
+        arrowcolor='#ec4899',
+        font=dict(color='#ec4899', size=12)
+    )
+    return fig
+
+
+@figure("day_means")
+def plot_day_means(data, cubes):
+    cube = cubes['calendar']
+    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    daily_data = group_mean(cube, 'day').reindex(day_order).reset_index()
+
+    fig = px.bar(daily_data, x='day', y='count',
+                 color='count',
+                 color_continuous_scale='Viridis')
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False, title='Day of Week'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Average Rentals'),
+        height=400
+    )
+    return fig
+
+
+@figure("monthly_trend")
+def plot_monthly_trend(data, cubes):
+    cube = cubes['calendar']
+    monthly_data = group_mean(cube, 'Month_name').reindex([
+        'January', 'February', 'March', 'April', 'May', 'June',
+        'July', 'August', 'September', 'October', 'November', 'December'
+    ]).reset_index()
+
+    fig = px.line(monthly_data, x='Month_name', y='count',
+                  markers=True)
+    fig.update_traces(line_color='#11998e', line_width=3, marker=dict(size=10))
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False, title='Month', tickangle=-45),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Average Rentals'),
+        height=400
+    )
+    return fig
+
+
+@figure("user_type_share")
+def plot_user_type_share(data, cubes):
+    cube = cubes['calendar']
+    user_data = pd.DataFrame({
+        'User Type': ['Casual', 'Registered'],
+        'Total Rentals': [total(cube, 'casual'), total(cube, 'registered')]
+    })
+
+    fig = px.pie(user_data, values='Total Rentals', names='User Type',
+                 hole=0.4,
+                 color_discrete_sequence=['#8b5cf6', '#ec4899'])
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        height=350
+    )
+    return fig
+
+
+@figure("workingday_users")
+def plot_workingday_users(data, cubes):
+    cube = cubes['calendar']
+    workday_users = group_mean(cube, 'workingday', ['casual', 'registered']).reset_index()
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=workday_users['workingday'], y=workday_users['casual'],
+                         name='Casual', marker_color='#8b5cf6'))
+    fig.add_trace(go.Bar(x=workday_users['workingday'], y=workday_users['registered'],
+                         name='Registered', marker_color='#ec4899'))
+    fig.update_layout(
+        barmode='group',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=350
+    )
+    return fig
+
+
+@figure("feature_histogram", warm_params=({"feature": "temp"},))
+def plot_feature_histogram(data, cubes, feature):
+    fig = px.histogram(data, x=feature, nbins=30,
+                      color_discrete_sequence=['#8b5cf6'])
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=400
+    )
+    return fig
+
+
+@figure("feature_box", warm_params=({"feature": "temp"},))
+def plot_feature_box(data, cubes, feature):
+    fig = go.Figure()
+    fig.add_trace(go.Box(y=data[feature], name=feature,
+                         marker_color='#ec4899', boxmean='sd'))
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=400
+    )
+    return fig
+
+
+@figure("temp_vs_count")
+def plot_temp_vs_count(data, cubes):
+    season_colors = ['#667eea', '#f093fb', '#11998e', '#fa709a']
+    trendlines = ols_trendlines(data, 'temp', 'count', 'season')
+    scatter_df = stratified_sample(data[['temp', 'count', 'season']], 'season', SCATTER_MAX_POINTS)
+
+    fig = px.scatter(scatter_df, x='temp', y='count',
+                     color='season',
+                     category_orders={'season': list(trendlines)},
+                     opacity=0.6,
+                     color_discrete_sequence=season_colors)
+    # OLS trendlines are fitted on all rows, not just the plotted sample
+    for i, (season, fit) in enumerate(trendlines.items()):
+        line_x = [fit['x_min'], fit['x_max']]
+        fig.add_trace(go.Scatter(
+            x=line_x,
+            y=[fit['intercept'] + fit['slope'] * x for x in line_x],
+            mode='lines',
+            name=season,
+            legendgroup=season,
+            showlegend=False,
+            line=dict(color=season_colors[i % len(season_colors)]),
+            hovertemplate=f"<b>OLS trendline</b><br>count = {fit['slope']:.2f} * temp + {fit['intercept']:.2f}"
+                          f"<br>R² = {fit['r2']:.3f}<extra>{season}</extra>"
+        ))
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=500
+    )
+    return fig
+
+
+@figure("correlation_heatmap", inputs=("corr",))
+def plot_correlation_heatmap(data, cubes, corr):
+    corr_matrix = corr.loc[NUMERICAL_COLUMNS, NUMERICAL_COLUMNS]
+
+    fig = px.imshow(corr_matrix,
+                    text_auto='.2f',
+                    aspect='auto',
+                    color_continuous_scale='RdBu_r',
+                    labels=dict(color='Correlation'))
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        height=600
+    )
+    return fig
+
+
+@figure("workingday_box")
+def plot_workingday_box(data, cubes):
+    working_groups = split_groups(data, 'workingday')
+    # Absent groups (in a short date window) plot as empty boxes
+    working_yes = working_groups.get('Yes', [])
+    working_no = working_groups.get('No', [])
+
+    fig = go.Figure()
+    fig.add_trace(go.Box(y=working_yes, name='Working Day: Yes', marker_color='#8b5cf6'))
+    fig.add_trace(go.Box(y=working_no, name='Working Day: No', marker_color='#ec4899'))
+    fig.update_layout(
+        title='Distribution of Bike Rentals by Working Day',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=400
+    )
+    return fig
+
+
+@figure("season_box")
+def plot_season_box(data, cubes):
+    season_groups = split_groups(data, 'season')
+
+    fig = go.Figure()
+    for season in ['Spring', 'Summer', 'Fall', 'Winter']:
+        season_data = season_groups.get(season, [])
+        fig.add_trace(go.Box(y=season_data, name=season))
+
+    fig.update_layout(
+        title='Distribution of Bike Rentals by Season',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=400
+    )
+    return fig
+
+
+@figure("weather_box")
+def plot_weather_box(data, cubes):
+    weather_groups = split_groups(data, 'weather')
+
+    fig = go.Figure()
+    for weather, weather_data in weather_groups.items():
+        fig.add_trace(go.Box(y=weather_data, name=weather))
+
+    fig.update_layout(
+        title='Distribution of Bike Rentals by Weather',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=400
+    )
+    return fig
+
+
+@figure("season_weather_table")
+def plot_season_weather_table(data, cubes):
+    cube = cubes['calendar']
+    contingency_table = group_size(cube, ['season', 'weather']).unstack(fill_value=0)
+
+    fig = px.imshow(contingency_table,
+                    text_auto=True,
+                    aspect='auto',
+                    color_continuous_scale='Viridis',
+                    labels=dict(x='Weather', y='Season', color='Count'))
+    fig.update_layout(
+        title='Season vs Weather Contingency Table',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        height=400
+    )
+    return fig
+
+
+@figure("count_histogram")
+def plot_count_histogram(data, cubes):
+    fig = px.histogram(data, x='count', nbins=50,
+                      title='Distribution of Bike Rentals',
+                      color_discrete_sequence=['#8b5cf6'])
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False, title='Number of Rentals'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Frequency'),
+        height=350
+    )
+    return fig
+
+
+@figure("temp_histogram")
+def plot_temp_histogram(data, cubes):
+    fig = px.histogram(data, x='temp', nbins=30,
+                      title='Temperature Distribution',
+                      color_discrete_sequence=['#ec4899'])
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False, title='Temperature (°C)'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Frequency'),
+        height=350
+    )
+    return fig
+
+
+@figure("daily_rentals")
+def plot_daily_rentals(data, cubes):
+    daily_rentals = group_sum(cubes['daily'], 'date').reset_index()
+    daily_rentals['date'] = pd.to_datetime(daily_rentals['date'])
+
+    fig = px.line(daily_rentals, x='date', y='count',
+                  title='Total Daily Rentals Over Time')
+    fig.update_traces(line_color='#8b5cf6', line_width=2)
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Date'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Total Rentals'),
+        height=400
+    )
+    return fig
+
+
+@figure("day_hour_heatmap")
+def plot_day_hour_heatmap(data, cubes):
+    cube = cubes['calendar']
+    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    hourly_day_data = group_mean(cube, ['day', 'hour']).reset_index()
+    hourly_pivot = hourly_day_data.pivot(index='day', columns='hour', values='count')
+    hourly_pivot = hourly_pivot.reindex(day_order)
+
+    fig = px.imshow(hourly_pivot,
+                    labels=dict(x='Hour of Day', y='Day of Week', color='Avg Rentals'),
+                    aspect='auto',
+                    color_continuous_scale='Viridis')
+    fig.update_layout(
+        title='Average Rentals Heatmap: Day vs Hour',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        height=400
+    )
+    return fig
+
+
+@figure("monthly_bars")
+def plot_monthly_bars(data, cubes):
+    cube = cubes['calendar']
+    monthly_avg = group_mean(cube, 'Month_name').reindex([
+        'January', 'February', 'March', 'April', 'May', 'June',
+        'July', 'August', 'September', 'October', 'November', 'December'
+    ]).reset_index()
+
+    fig = px.bar(monthly_avg, x='Month_name', y='count',
+                title='Average Rentals by Month',
+                color='count',
+                color_continuous_scale='Plasma')
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=350
+    )
+    return fig
+
+
+@figure("yearly_bars")
+def plot_yearly_bars(data, cubes):
+    cube = cubes['calendar']
+    yearly_avg = group_mean(cube, 'year').reset_index()
+
+    fig = px.bar(yearly_avg, x='year', y='count',
+                title='Average Rentals by Year',
+                color='count',
+                color_continuous_scale='Turbo')
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=350
+    )
+    return fig
+
+
+@figure("temp_vs_humidity")
+def plot_temp_vs_humidity(data, cubes):
+    if len(data) > SCATTER_MAX_POINTS:
+        # Too many points to ship to the browser: plot the average rentals per grid cell
+        grid = binned_mean(data, 'temp', 'humidity', 'count')
+        fig = go.Figure(data=[go.Heatmap(
+            x=grid['x'],
+            y=grid['y'],
+            z=grid['z'],
+            colorscale='Viridis',
+            colorbar=dict(title='Avg<br>Rentals'),
+            hovertemplate='Temp: %{x:.1f}<br>Humidity: %{y:.0f}<br>Avg Rentals: %{z:.0f}<extra></extra>'
+        )])
+        fig.update_layout(title='Temperature vs Humidity (average rentals per cell)',
+                          xaxis_title='temp', yaxis_title='humidity')
+    else:
+        fig = px.scatter(data, x='temp', y='humidity',
+                        color='count',
+                        size='count',
+                        title='Temperature vs Humidity (colored by rentals)',
+                        color_continuous_scale='Viridis',
+                        opacity=0.6)
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=450
+    )
+    return fig
+
+
+@figure("windspeed_ranges")
+def plot_windspeed_ranges(data, cubes):
+    windspeed_cube = cubes['windspeed']
+    windspeed_bins = pd.cut(windspeed_cube['windspeed'], bins=5)
+    windspeed_avg = group_mean(windspeed_cube, windspeed_bins).reset_index()
+    windspeed_avg['windspeed'] = windspeed_avg['windspeed'].astype(str)
+
+    fig = px.bar(windspeed_avg, x='windspeed', y='count',
+                title='Average Rentals by Windspeed Range',
+                color='count',
+                color_continuous_scale='Blues')
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False, title='Windspeed Range'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=350
+    )
+    return fig
+
+
+@figure("humidity_ranges")
+def plot_humidity_ranges(data, cubes):
+    humidity_cube = cubes['humidity']
+    humidity_bins = pd.cut(humidity_cube['humidity'], bins=5)
+    humidity_avg = group_mean(humidity_cube, humidity_bins).reset_index()
+    humidity_avg['humidity'] = humidity_avg['humidity'].astype(str)
+
+    fig = px.bar(humidity_avg, x='humidity', y='count',
+                title='Average Rentals by Humidity Range',
+                color='count',
+                color_continuous_scale='Greens')
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False, title='Humidity Range'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=350
+    )
+    return fig
+
+
+@figure("environment_correlations", inputs=("corr",))
+def plot_environment_correlations(data, cubes, corr):
+    env_corr = corr.loc[['temp', 'atemp', 'humidity', 'windspeed'], 'count'].sort_values(ascending=False)
+
+    fig = px.bar(x=env_corr.index, y=env_corr.values,
+                title='Correlation of Environmental Factors with Rentals',
+                color=env_corr.values,
+                color_continuous_scale='RdBu_r',
+                color_continuous_midpoint=0)
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False, title='Environmental Factor'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Correlation'),
+        height=350
+    )
+    return fig
+
+
+@figure("daily_users")
+def plot_daily_users(data, cubes):
+    daily_users = group_sum(cubes['daily'], 'date', ['casual', 'registered']).reset_index()
+    daily_users['date'] = pd.to_datetime(daily_users['date'])
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=daily_users['date'], y=daily_users['casual'],
+                            name='Casual Users',
+                            line=dict(color='#8b5cf6', width=2),
+                            fill='tozeroy'))
+    fig.add_trace(go.Scatter(x=daily_users['date'], y=daily_users['registered'],
+                            name='Registered Users',
+                            line=dict(color='#ec4899', width=2),
+                            fill='tozeroy'))
+
+    fig.update_layout(
+        title='Daily User Type Trends',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Date'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Number of Users'),
+        height=400
+    )
+    return fig
+
+
+@figure("weather_users")
+def plot_weather_users(data, cubes):
+    cube = cubes['calendar']
+    weather_users = group_mean(cube, 'weather', ['casual', 'registered']).reset_index()
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=weather_users['weather'], y=weather_users['casual'],
+                        name='Casual', marker_color='#8b5cf6'))
+    fig.add_trace(go.Bar(x=weather_users['weather'], y=weather_users['registered'],
+                        name='Registered', marker_color='#ec4899'))
+
+    fig.update_layout(
+        barmode='group',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=350
+    )
+    return fig
+
+
+@figure("season_users")
+def plot_season_users(data, cubes):
+    cube = cubes['calendar']
+    season_users = group_mean(cube, 'season', ['casual', 'registered']).reset_index()
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=season_users['season'], y=season_users['casual'],
+                        name='Casual', marker_color='#8b5cf6'))
+    fig.add_trace(go.Bar(x=season_users['season'], y=season_users['registered'],
+                        name='Registered', marker_color='#ec4899'))
+
+    fig.update_layout(
+        barmode='group',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)'),
+        height=350
+    )
+    return fig
+
+
+@figure("hourly_user_share")
+def plot_hourly_user_share(data, cubes):
+    cube = cubes['calendar']
+    hourly_users = group_mean(cube, 'hour', ['casual', 'registered']).reset_index()
+    hourly_users['casual_pct'] = (hourly_users['casual'] / (hourly_users['casual'] + hourly_users['registered'])) * 100
+    hourly_users['registered_pct'] = (hourly_users['registered'] / (hourly_users['casual'] + hourly_users['registered'])) * 100
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=hourly_users['hour'], y=hourly_users['casual_pct'],
+                            name='Casual %',
+                            line=dict(color='#8b5cf6', width=3),
+                            mode='lines+markers'))
+    fig.add_trace(go.Scatter(x=hourly_users['hour'], y=hourly_users['registered_pct'],
+                            name='Registered %',
+                            line=dict(color='#ec4899', width=3),
+                            mode='lines+markers'))
+
+    fig.update_layout(
+        title='User Type Percentage by Hour of Day',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Hour'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Percentage'),
+        height=400
+    )
+    return fig
+
+
+@figure("correlation_matrix", inputs=("corr",))
+def plot_correlation_matrix(data, cubes, corr):
+    corr_matrix = corr.loc[NUMERICAL_COLUMNS, NUMERICAL_COLUMNS]
+
+    fig = px.imshow(corr_matrix,
+                    text_auto='.2f',
+                    aspect='auto',
+                    color_continuous_scale='RdBu_r',
+                    labels=dict(color='Correlation'),
+                    zmin=-1, zmax=1)
+    fig.update_layout(
+        title='Feature Correlation Heatmap',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        height=500
+    )
+    return fig
+
+
+
+# Not registered: a per-session view of profiling spans, never cached
+def plot_profile_flame(spans):
+    """Flame chart of one run's spans: one bar per span, nested spans on the rows below their parent."""
+    colors = ['#8b5cf6', '#ec4899', '#38ef7d', '#f59e0b', '#667eea', '#fa709a']
+    fig = go.Figure()
+    for record in spans:
+        fig.add_trace(go.Bar(
+            x=[record['seconds'] * 1000],
+            base=[record['start'] * 1000],
+            y=[record['depth']],
+            orientation='h',
+            marker_color=colors[record['depth'] % len(colors)],
+            text=record['name'],
+            textposition='inside',
+            insidetextanchor='start',
+            hovertemplate=f"<b>{record['name']}</b><br>{record['seconds'] * 1000:.1f} ms"
+                          f"<br>starts at {record['start'] * 1000:.1f} ms<extra></extra>",
+            showlegend=False
+        ))
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        barmode='overlay',
+        bargap=0.05,
+        xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Time since rerun start (ms)'),
+        yaxis=dict(autorange='reversed', title='Depth', dtick=1),
+        height=120 + 40 * (max((record['depth'] for record in spans), default=0) + 1)
+    )
+    return fig
+
+
+# Not registered: depends on the forecast model, not only on the data and cubes
+def plot_forecast(recent, forecast):
+    """Observed hourly rentals of ``recent`` followed by the forecast of each user type."""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=recent['datetime'], y=recent['count'], name='Observed',
+        line=dict(color='#9ca3af', width=1.5),
+        hovertemplate='%{x}<br>Observed: %{y}<extra></extra>'
+    ))
+    for measure, color in [('count', '#8b5cf6'), ('registered', '#38ef7d'), ('casual', '#f472b6')]:
+        fig.add_trace(go.Scatter(
+            x=forecast['datetime'], y=forecast[measure], name=f'Forecast {measure}',
+            line=dict(color=color, width=2, dash='dot' if measure != 'count' else 'solid'),
+            hovertemplate=f'%{{x}}<br>{measure}: %{{y:.0f}}<extra></extra>'
+        ))
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#cbd5e1'),
+        xaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Time'),
+        yaxis=dict(showgrid=True, gridcolor='rgba(139, 92, 246, 0.1)', title='Rentals per Hour'),
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
+        hovermode='x unified',
+        height=450
+    )
+    return fig
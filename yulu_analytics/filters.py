@@ -0,0 +1,101 @@
+"""Bitmap filter engine for the Interactive EDA data explorer.
+
+Each filter column keeps one packed bitmap (1 bit per row) per value. A filter
+selection ORs the bitmaps of the selected values within a column and ANDs the
+columns together, and the combined bitmap is kept in a small LRU keyed by the
+selection. Row previews are paged straight off the bitmap, so a filtered
+subset is never materialized.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# number of set bits in every possible byte
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class FilterIndex:
+    """Packed per-value bitmaps for a set of categorical columns."""
+
+    def __init__(self, data, columns, cache_size=64):
+        self.n_rows = len(data)
+        self.columns = list(columns)
+        self.cache_size = cache_size
+        self.bitmaps = {}
+        for column in self.columns:
+            series = data[column]
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                series = series.astype("category")
+            codes = series.cat.codes.to_numpy()
+            self.bitmaps[column] = {
+                value: np.packbits(codes == code)
+                for code, value in enumerate(series.cat.categories)
+                if (codes == code).any()
+            }
+        # packbits pads the last byte with zeros, so padding never counts as a match
+        self._all_rows = np.packbits(np.ones(self.n_rows, dtype=bool))
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def options(self, column):
+        """Values present in ``column``, in category order."""
+        return list(self.bitmaps[column])
+
+    def _key(self, selection):
+        return tuple(frozenset(selection.get(column, self.bitmaps[column])) for column in self.columns)
+
+    def _compute(self, key):
+        mask = self._all_rows.copy()
+        for column, values in zip(self.columns, key):
+            bitmaps = self.bitmaps[column]
+            if values.issuperset(bitmaps):
+                continue
+            column_mask = np.zeros_like(mask)
+            for value in values.intersection(bitmaps):
+                np.bitwise_or(column_mask, bitmaps[value], out=column_mask)
+            np.bitwise_and(mask, column_mask, out=mask)
+        # running number of matches up to and including each byte, used for paging
+        return mask, np.cumsum(POPCOUNT[mask], dtype=np.int64)
+
+    def lookup(self, selection):
+        """Return the packed bitmap and per-byte running match count for a selection.
+
+        ``selection`` maps column -> selected values; missing columns are not filtered.
+        """
+        key = self._key(selection)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        result = self._compute(key)
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def count(self, selection):
+        """Number of rows matching the selection."""
+        _, running = self.lookup(selection)
+        return int(running[-1]) if len(running) else 0
+
+    def mask(self, selection):
+        """Boolean row mask for the selection."""
+        bitmap, _ = self.lookup(selection)
+        return np.unpackbits(bitmap, count=self.n_rows).astype(bool)
+
+    def page(self, selection, page, page_size=100):
+        """Row positions of the ``page``-th (0-based) block of matching rows.
+
+        Only the bytes that cover the requested page are unpacked.
+        """
+        bitmap, running = self.lookup(selection)
+        start = page * page_size
+        stop = start + page_size
+        first_byte = int(np.searchsorted(running, start, side="right"))
+        last_byte = int(np.searchsorted(running, stop, side="left")) + 1
+        positions = np.flatnonzero(np.unpackbits(bitmap[first_byte:last_byte])) + first_byte * 8
+        skip = start - (int(running[first_byte - 1]) if first_byte > 0 else 0)
+        return positions[skip:skip + page_size]
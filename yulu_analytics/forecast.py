@@ -0,0 +1,262 @@
+"""Hourly demand forecasts from the calendar and weather features.
+
+``DemandForecaster`` is a ridge regression of ``log1p`` of each measure
+(count, casual, registered) on one-hot calendar and weather levels (hour x
+working day, season, weather, weekday, holiday, month) plus numeric weather
+(temperature and its square, humidity, windspeed) and a linear trend.
+
+Training keeps only the normal equations, X'X and X'Y, which are additive
+like the cubes: ``partial_fit`` folds in more rows, ``update`` fits just the
+rows appended since the last call and ``merge`` combines models trained on
+different partitions. The one-hot part of X'X is not built row by row: rows
+are keyed by their combination of levels and summed per key with
+``bincount``, and the outer products are taken over the (at most ~129k)
+distinct keys. Prediction looks up each row's level combination in a table
+of summed one-hot coefficients instead of building the one-hot matrix, so
+batch prediction is one gather and a small matrix product per row block.
+
+``forecast`` extends the history by 24-168 hours: the calendar is known, the
+weather repeats the hourly profile of the last week (or a fixed weather
+situation), working days are Monday-Friday and no holidays are assumed.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .aggregates import MEASURES
+from .calendar_features import add_calendar_columns
+from .profiling import traced
+from .schema import CATEGORY_LABELS, DAY_NAMES, MONTH_NAMES
+
+TARGETS = MEASURES
+
+# one-hot level groups: name -> labels of its levels
+LEVEL_GROUPS = {
+    "hour_workingday": [f"{hour:02d}:00 {label}" for hour in range(24)
+                        for label in ("off day", "working day")],
+    "season": list(CATEGORY_LABELS["season"].values()),
+    "weather": list(CATEGORY_LABELS["weather"].values()),
+    "day": DAY_NAMES,
+    "holiday": list(CATEGORY_LABELS["holiday"].values()),
+    "month": MONTH_NAMES,
+}
+NUMERIC_FEATURES = ["temp", "temp_sq", "humidity", "windspeed", "trend"]
+
+LEVELS = tuple(len(labels) for labels in LEVEL_GROUPS.values())
+N_KEYS = int(np.prod(LEVELS))
+# column offset of each level group in the design matrix; column 0 is the intercept
+OFFSETS = np.cumsum((1,) + LEVELS[:-1])
+N_ONEHOT = 1 + sum(LEVELS)
+N_FEATURES = N_ONEHOT + len(NUMERIC_FEATURES)
+FEATURE_NAMES = (["intercept"]
+                 + [f"{group}={label}" for group, labels in LEVEL_GROUPS.items() for label in labels]
+                 + NUMERIC_FEATURES)
+
+TREND_ORIGIN = np.datetime64("2011-01-01")
+TREND_UNIT = np.timedelta64(365 * 24 * 3600, "s")
+
+BLOCK_ROWS = 1_048_576
+PROFILE_DAYS = 7
+MIN_HOURS, MAX_HOURS = 24, 168
+
+
+def _codes(column):
+    return np.asarray(column.cat.codes if isinstance(column.dtype, pd.CategoricalDtype) else column, dtype="int64")
+
+
+def _level_codes(frame):
+    # One code array per level group, and the rows where every level is known
+    codes = [
+        _codes(frame["hour"]) * 2 + _codes(frame["workingday"]),
+        _codes(frame["season"]),
+        _codes(frame["weather"]),
+        _codes(frame["day"]),
+        _codes(frame["holiday"]),
+        _codes(frame["Month"]) - 1,
+    ]
+    valid = np.logical_and.reduce([(code >= 0) & (code < levels) for code, levels in zip(codes, LEVELS)])
+    return codes, valid
+
+
+def _numeric_features(frame):
+    # Column-major, so every feature is a contiguous array for bincount
+    features = np.empty((len(frame), len(NUMERIC_FEATURES)), order="F")
+    features[:, 0] = frame["temp"].to_numpy()
+    np.square(features[:, 0], out=features[:, 1])
+    features[:, 2] = frame["humidity"].to_numpy()
+    features[:, 3] = frame["windspeed"].to_numpy()
+    features[:, 4] = (frame["datetime"].to_numpy() - TREND_ORIGIN) / TREND_UNIT
+    return features
+
+
+def _log_targets(frame):
+    targets = np.empty((len(frame), len(TARGETS)), order="F")
+    for j, column in enumerate(TARGETS):
+        np.log1p(frame[column].to_numpy(), out=targets[:, j])
+    return targets
+
+
+def _onehot_rows(keys):
+    # Design-matrix rows (intercept and one-hot levels) of level combination keys
+    rows = np.zeros((len(keys), N_ONEHOT))
+    rows[:, 0] = 1.0
+    for offset, codes in zip(OFFSETS, np.unravel_index(keys, LEVELS)):
+        rows[np.arange(len(keys)), offset + codes] = 1.0
+    return rows
+
+
+class DemandForecaster:
+    """Ridge regression of log1p(count, casual, registered) trained from running normal equations."""
+
+    def __init__(self, alpha=1.0):
+        self.alpha = alpha
+        self.rows = 0
+        self.xtx = np.zeros((N_FEATURES, N_FEATURES))
+        self.xty = np.zeros((N_FEATURES, len(TARGETS)))
+        # rows per (month, season), to assign seasons to forecast dates
+        self.season_months = np.zeros((len(MONTH_NAMES), LEVELS[1]), dtype="int64")
+        self._coef = None
+        self._lock = threading.Lock()
+        self._update_lock = threading.Lock()
+
+    @traced("forecast.partial_fit")
+    def partial_fit(self, data, block_rows=BLOCK_ROWS):
+        """Add the rows of ``data`` to the training sums; rows with unknown levels are skipped."""
+        for start in range(0, len(data), block_rows):
+            self._fit_block(data.iloc[start:start + block_rows])
+        return self
+
+    def update(self, data):
+        """Fit the rows of ``data`` beyond the ``rows`` already seen, for frames that only grow by appending."""
+        with self._update_lock:
+            return self.partial_fit(data.iloc[self.rows:])
+
+    def _fit_block(self, block):
+        codes, valid = _level_codes(block)
+        numeric = _numeric_features(block)
+        targets = _log_targets(block)
+        # A row sum is NaN/inf exactly when one of its values is
+        valid &= np.isfinite(numeric.sum(axis=1) + targets.sum(axis=1))
+        if not valid.all():
+            codes = [code[valid] for code in codes]
+            numeric, targets = numeric[valid], targets[valid]
+
+        keys = np.ravel_multi_index(codes, LEVELS)
+        counts = np.bincount(keys, minlength=N_KEYS)
+        present = np.flatnonzero(counts)
+
+        def key_sums(values):
+            return np.column_stack([np.bincount(keys, values[:, j], N_KEYS)[present] for j in range(values.shape[1])])
+
+        onehot = _onehot_rows(present)
+        n = N_ONEHOT
+        xtx = np.empty((N_FEATURES, N_FEATURES))
+        xtx[:n, :n] = (onehot * counts[present, None]).T @ onehot
+        xtx[:n, n:] = onehot.T @ key_sums(numeric)
+        xtx[n:, :n] = xtx[:n, n:].T
+        xtx[n:, n:] = numeric.T @ numeric
+        xty = np.vstack([onehot.T @ key_sums(targets), numeric.T @ targets])
+        season_months = np.bincount(codes[5] * LEVELS[1] + codes[1],
+                                    minlength=self.season_months.size).reshape(self.season_months.shape)
+
+        with self._lock:
+            self.xtx += xtx
+            self.xty += xty
+            self.season_months += season_months
+            self.rows += len(block)
+            self._coef = None
+
+    def merge(self, other):
+        """A new model trained on the rows of both ``self`` and ``other``."""
+        merged = DemandForecaster(self.alpha)
+        merged.rows = self.rows + other.rows
+        merged.xtx = self.xtx + other.xtx
+        merged.xty = self.xty + other.xty
+        merged.season_months = self.season_months + other.season_months
+        return merged
+
+    def coefficients(self):
+        """Coefficient matrix (features x targets), solved on first use after training."""
+        return self._solve()[0]
+
+    def _solve(self):
+        # Coefficients, and the summed one-hot coefficients of every level combination
+        with self._lock:
+            if self._coef is None:
+                n = self.xtx[0, 0]
+                if n == 0:
+                    raise ValueError("The forecaster has not been trained on any rows")
+                # Penalizing each coefficient by its feature's variance is ridge on standardized
+                # features; the intercept is not penalized
+                mean = self.xtx[0] / n
+                variance = np.maximum(np.diag(self.xtx) / n - mean ** 2, 0.0)
+                penalty = self.alpha * (variance + 1e-6)
+                penalty[0] = 0.0
+                coef = np.linalg.solve(self.xtx + np.diag(penalty), self.xty)
+                key_table = np.repeat(coef[:1], N_KEYS, axis=0)
+                for offset, codes in zip(OFFSETS, np.unravel_index(np.arange(N_KEYS), LEVELS)):
+                    key_table += coef[offset + codes]
+                self._coef = coef, key_table
+            return self._coef
+
+    @traced("forecast.predict")
+    def predict(self, frame, block_rows=BLOCK_ROWS):
+        """Predicted count, casual and registered rentals per row of ``frame`` (NaN for unknown levels)."""
+        coef, key_table = self._solve()
+        predictions = np.empty((len(frame), len(TARGETS)))
+        for start in range(0, len(frame), block_rows):
+            block = frame.iloc[start:start + block_rows]
+            codes, valid = _level_codes(block)
+            everything_valid = valid.all()
+            if not everything_valid:
+                codes = [np.where(valid, code, 0) for code in codes]
+            log_pred = key_table[np.ravel_multi_index(codes, LEVELS)] + _numeric_features(block) @ coef[N_ONEHOT:]
+            if not everything_valid:
+                log_pred[~valid] = np.nan
+            predictions[start:start + len(block)] = log_pred
+        return pd.DataFrame(np.clip(np.expm1(predictions), 0, None), columns=TARGETS, index=frame.index)
+
+    def future_features(self, history, hours, weather=None):
+        """Feature rows for the ``hours`` after the last ``datetime`` of ``history``.
+
+        The weather columns repeat the per-hour means (and most frequent weather)
+        of the last ``PROFILE_DAYS`` days; ``weather`` fixes the weather label instead.
+        """
+        if not MIN_HOURS <= hours <= MAX_HOURS:
+            raise ValueError(f"Forecast horizon must be {MIN_HOURS}-{MAX_HOURS} hours, got {hours}")
+        last = history["datetime"].max()
+        recent = history[history["datetime"] > last - pd.Timedelta(days=PROFILE_DAYS)]
+        profile = recent.groupby("hour")[["temp", "humidity", "windspeed"]].mean()
+        profile["weather"] = recent.groupby("hour", observed=True)["weather"].agg(lambda values: values.mode().iloc[0])
+        # Hours missing from the last week fall back to the week's overall means
+        profile = profile.reindex(range(24))
+        profile[["temp", "humidity", "windspeed"]] = profile[["temp", "humidity", "windspeed"]].fillna(
+            recent[["temp", "humidity", "windspeed"]].mean())
+        profile["weather"] = profile["weather"].fillna(recent["weather"].mode().iloc[0])
+
+        future = add_calendar_columns(pd.DataFrame({
+            "datetime": pd.date_range(last + pd.Timedelta(hours=1), periods=hours, freq="h")}))
+        hour = future["hour"].to_numpy()
+        for column in ("temp", "humidity", "windspeed"):
+            future[column] = profile[column].to_numpy()[hour]
+        weather_labels = LEVEL_GROUPS["weather"]
+        future["weather"] = pd.Categorical(profile["weather"].to_numpy()[hour] if weather is None
+                                           else np.repeat(weather, hours), categories=weather_labels)
+        future["workingday"] = pd.Categorical(np.where(future["day"].cat.codes < 5, "Yes", "No"),
+                                              categories=list(CATEGORY_LABELS["workingday"].values()))
+        future["holiday"] = pd.Categorical(np.repeat("No", hours), categories=LEVEL_GROUPS["holiday"])
+        # Each month's most frequent season in the training rows (the overall one for unseen months)
+        month_seasons = np.where(self.season_months.sum(axis=1) > 0, self.season_months.argmax(axis=1),
+                                 self.season_months.sum(axis=0).argmax())
+        future["season"] = pd.Categorical.from_codes(month_seasons[future["Month"].to_numpy() - 1],
+                                                     categories=LEVEL_GROUPS["season"])
+        return future
+
+    @traced("forecast.forecast")
+    def forecast(self, history, hours=MAX_HOURS, weather=None):
+        """Hourly predictions for the ``hours`` after ``history``, with the assumed weather."""
+        future = self.future_features(history, hours, weather)
+        predictions = self.predict(future)
+        columns = ["datetime", "day", "workingday", "season", "weather", "temp", "humidity", "windspeed"]
+        return pd.concat([future[columns], predictions], axis=1)
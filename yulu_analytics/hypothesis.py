@@ -0,0 +1,75 @@
+"""Statistical tests behind the Hypothesis Testing tab.
+
+Functions take pre-split group arrays or a contingency table and return plain
+dicts, so callers can cache the results by dataset fingerprint and parameters.
+When the data is too small for a test (e.g. a short date window with a single
+season) the statistic and p-value are NaN instead of an error.
+"""
+import numpy as np
+import pandas as pd
+from scipy.stats import chi2_contingency, f_oneway, ttest_ind
+
+from .profiling import traced
+
+
+@traced("hypothesis.split_groups")
+def split_groups(data, by, value="count"):
+    """Split ``data[value]`` into one array per ``by`` group in a single pass.
+
+    Groups are ordered like ``groupby`` (category order for categoricals) and
+    keep the original row order within each group.
+    """
+    codes, labels = pd.factorize(data[by], sort=True)
+    values = data[value].to_numpy()
+    valid = codes >= 0
+    codes, values = codes[valid], values[valid]
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes, minlength=len(labels)))[:-1]
+    return dict(zip(labels, np.split(values[order], bounds)))
+
+
+def _untestable(dof, **extra):
+    return {"statistic": float("nan"), "p_value": float("nan"), "dof": dof, **extra}
+
+
+@traced("hypothesis.two_sample_ttest")
+def two_sample_ttest(first, second):
+    """Independent two-sample t-test (equal variances, as in the original analysis)."""
+    if len(first) < 2 or len(second) < 2:
+        return _untestable(max(len(first) + len(second) - 2, 0))
+    statistic, p_value = ttest_ind(first, second)
+    return {
+        "statistic": float(statistic),
+        "p_value": float(p_value),
+        "dof": len(first) + len(second) - 2,
+    }
+
+
+@traced("hypothesis.one_way_anova")
+def one_way_anova(groups):
+    """One-way ANOVA across the arrays in ``groups`` (a dict of label -> array)."""
+    arrays = [array for array in groups.values() if len(array)]
+    n = sum(len(array) for array in arrays)
+    if len(arrays) < 2 or n <= len(arrays):
+        return _untestable((max(len(arrays) - 1, 0), max(n - len(arrays), 0)))
+    statistic, p_value = f_oneway(*arrays)
+    return {
+        "statistic": float(statistic),
+        "p_value": float(p_value),
+        "dof": (len(arrays) - 1, n - len(arrays)),
+    }
+
+
+@traced("hypothesis.chi_square_independence")
+def chi_square_independence(table):
+    """Chi-square test of independence on a contingency table (DataFrame of counts)."""
+    if min(table.shape) < 2:
+        return _untestable(0, observed=table, expected=table.astype("float64"))
+    statistic, p_value, dof, expected = chi2_contingency(table)
+    return {
+        "statistic": float(statistic),
+        "p_value": float(p_value),
+        "dof": int(dof),
+        "observed": table,
+        "expected": pd.DataFrame(expected, index=table.index, columns=table.columns),
+    }
@@ -0,0 +1,294 @@
+"""Reading and preprocessing the raw Yulu CSV.
+
+``read_csv`` preprocesses the whole file in one frame. ``stream_csv`` reads
+it in fixed-size chunks instead, preprocesses each chunk the same way, folds
+it into the aggregate cubes and appends it to an Arrow IPC (Feather) file, so
+the heap used while ingesting is bounded by the chunk size rather than the
+file size. The chunks are then copied into a single record batch through
+disk-backed scratch buffers, so the finished file memory-maps back as a
+zero-copy frame: the rows are never all on the heap, only in the page cache.
+``LiveDataset`` then keeps the result current as rows are appended to the file.
+"""
+import io
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from .aggregates import build_cubes, merge_cube_sets
+from .binning import apply_bins
+from .calendar_features import add_calendar_columns
+from .profiling import traced
+from .schema import RAW_DTYPES, apply_schema
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+CHUNK_ROWS = 250_000
+
+# Appended rows are folded into the frame (a full copy of it) once they amount to
+# this share of it, or once the oldest of them has waited this many seconds
+COMPACT_SHARE = float(os.environ.get("YULU_COMPACT_SHARE", 0.05))
+COMPACT_SECONDS = float(os.environ.get("YULU_COMPACT_SECONDS", 30))
+
+
+def preprocess(data):
+    """Derive the calendar, level and label columns of a raw frame in place."""
+    # Parsed datetime, day, date, hour, Month, Month_name and year (see calendar_features.py)
+    add_calendar_columns(data)
+
+    # Temperature, humidity and windspeed levels (see binning.BIN_SPECS)
+    apply_bins(data)
+
+    # Season/weather/workingday/holiday labels and compact dtypes (see schema.py)
+    apply_schema(data)
+    return data
+
+
+@traced("ingest.read_csv")
+def read_csv(source):
+    """Read and preprocess the whole file at once."""
+    return preprocess(pd.read_csv(source, dtype=RAW_DTYPES))
+
+
+def can_stream():
+    return pa is not None
+
+
+@traced("ingest.stream_csv")
+def stream_csv(source, out_path, chunk_rows=CHUNK_ROWS):
+    """Preprocess ``source`` chunk by chunk into a Feather file at ``out_path``.
+
+    Returns the number of rows written and the aggregate cubes of the whole file.
+    The output is written to a temp file and renamed, so readers never see a
+    partial file. It holds one record batch, like ``store_cached_frame``
+    writes, so ``load_cached_frame`` maps it back without copying.
+    """
+    out_dir = os.path.dirname(out_path) or "."
+    os.makedirs(out_dir, exist_ok=True)
+    fd, chunked_path = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+    os.close(fd)
+
+    rows = 0
+    cubes = None
+    writer = None
+    try:
+        for chunk in pd.read_csv(source, dtype=RAW_DTYPES, chunksize=chunk_rows):
+            chunk = preprocess(chunk.reset_index(drop=True))
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pa.ipc.new_file(chunked_path, table.schema)
+            writer.write_table(table)
+
+            chunk_cubes = build_cubes(chunk)
+            cubes = chunk_cubes if cubes is None else merge_cube_sets(cubes, chunk_cubes)
+            rows += len(chunk)
+        if writer is None:
+            raise ValueError(f"{source} contains no rows")
+        writer.close()
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        os.remove(chunked_path)
+        raise
+    try:
+        _write_single_batch(chunked_path, out_path)
+    finally:
+        os.remove(chunked_path)
+    return rows, cubes
+
+
+def _mapped_array(column, scratch_dir):
+    # The chunks of ``column`` as one array backed by a scratch file instead of the heap
+    if pa.types.is_dictionary(column.type):
+        dictionary = column.chunks[0].dictionary if column.num_chunks else None
+        if dictionary is not None and all(chunk.dictionary.equals(dictionary) for chunk in column.chunks):
+            indices = pa.chunked_array([chunk.indices for chunk in column.chunks], column.type.index_type)
+            return pa.DictionaryArray.from_arrays(_mapped_array(indices, scratch_dir), dictionary,
+                                                  ordered=column.type.ordered)
+    fixed_width = pa.types.is_primitive(column.type) and not pa.types.is_boolean(column.type)
+    if not fixed_width or column.null_count or not column.num_chunks:
+        return column.combine_chunks()
+
+    width = column.type.bit_width // 8
+    fd, path = tempfile.mkstemp(dir=scratch_dir)
+    os.close(fd)
+    scratch = np.memmap(path, dtype=np.uint8, mode="w+", shape=(max(len(column) * width, 1),))
+    position = 0
+    for chunk in column.chunks:
+        values = np.frombuffer(chunk.buffers()[1], dtype=np.uint8)
+        values = values[chunk.offset * width:(chunk.offset + len(chunk)) * width]
+        scratch[position:position + len(values)] = values
+        position += len(values)
+    return pa.Array.from_buffers(column.type, len(column), [None, pa.py_buffer(scratch)])
+
+
+def _write_single_batch(chunked_path, out_path):
+    # Rewrite a multi-batch IPC file as one batch, one column at a time through
+    # scratch files, so the heap never holds more than a column's chunk
+    out_dir = os.path.dirname(out_path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+        with pa.memory_map(chunked_path) as source, tempfile.TemporaryDirectory(dir=out_dir) as scratch_dir:
+            table = pa.ipc.open_file(source).read_all()
+            batch = pa.RecordBatch.from_arrays([_mapped_array(column, scratch_dir) for column in table.columns],
+                                               schema=table.schema)
+            with pa.ipc.new_file(tmp_path, table.schema) as writer:
+                writer.write_batch(batch)
+            del batch, table
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, out_path)
+
+
+class SourceRewritten(Exception):
+    """The source no longer starts with the rows that were already ingested."""
+
+
+def complete_length(path, block_size=1 << 16):
+    """Byte length of ``path`` up to and including its last newline."""
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - block_size)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b"\n")
+            if newline >= 0:
+                return start + newline + 1
+            position = start
+    return 0
+
+
+def line_ending_at(path, offset, max_line=1 << 16):
+    """The bytes of the line that ends (with its newline) at ``offset``."""
+    start = max(0, offset - max_line)
+    with open(path, "rb") as f:
+        f.seek(start)
+        block = f.read(offset - start)
+    return block[block.rfind(b"\n", 0, len(block) - 1) + 1:]
+
+
+def read_appended(source, offset, last_line, columns):
+    """Read the complete lines appended to ``source`` after byte ``offset``.
+
+    ``last_line`` is the line that ended at ``offset`` when it was recorded; if
+    it is no longer there the file was rewritten rather than appended to and
+    ``SourceRewritten`` is raised. Returns ``None`` when there is no new
+    complete line, otherwise the raw (unpreprocessed) rows, the new offset and
+    the new last line. A partially written trailing line is left for later.
+    """
+    with open(source, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size < offset:
+            raise SourceRewritten(f"{source} shrank from {offset} to {size} bytes")
+        f.seek(offset - len(last_line))
+        if f.read(len(last_line)) != last_line:
+            raise SourceRewritten(f"{source} changed before byte {offset}")
+        tail = f.read(size - offset)
+
+    end = tail.rfind(b"\n") + 1
+    if end == 0:
+        return None
+    rows = pd.read_csv(io.BytesIO(tail[:end]), header=None, names=columns, dtype=RAW_DTYPES)
+    new_last_line = tail[tail.rfind(b"\n", 0, end - 1) + 1:end]
+    return rows, offset + end, new_last_line
+
+
+class AppendBuffer:
+    """Rows appended to a frame, held back until folding them in is worth copying the frame.
+
+    ``add`` costs only the appended rows (their cubes are built then);
+    ``fold`` concatenates the frame once with everything held.
+    """
+
+    def __init__(self):
+        self.frames = []
+        self.cube_sets = []
+        self.rows = 0
+        self.since = None
+
+    def add(self, rows):
+        self.frames.append(rows)
+        self.cube_sets.append(build_cubes(rows))
+        self.rows += len(rows)
+        if self.since is None:
+            self.since = time.monotonic()
+
+    def due(self, frame_rows, compact=False):
+        """Whether to fold now: forced by ``compact``, or per ``COMPACT_SHARE`` and ``COMPACT_SECONDS``."""
+        if not self.rows:
+            return False
+        return (compact or self.rows >= COMPACT_SHARE * frame_rows
+                or time.monotonic() - self.since >= COMPACT_SECONDS)
+
+    def fold(self, data, cubes):
+        """``data`` and ``cubes`` with the held rows appended; empties the buffer."""
+        data = pd.concat([data, *self.frames], ignore_index=True)
+        cubes = merge_cube_sets(cubes, *self.cube_sets)
+        self.__init__()
+        return data, cubes
+
+
+class LiveDataset:
+    """A preprocessed frame and its cubes that follow rows appended to the source.
+
+    ``offset`` is the end of the last complete line already ingested. Each
+    ``refresh`` reads only the bytes after it and preprocesses those rows, so
+    the cost grows with the appended rows rather than the file. Rows at or
+    before the last ingested ``datetime`` are dropped, which also absorbs rows
+    appended while the initial load was running.
+
+    New rows wait in an ``AppendBuffer`` and are published together: the
+    frame, usually a mapped cache file, is only copied when they are due, not
+    on every refresh.
+    """
+
+    def __init__(self, source, data, cubes, offset, fingerprint):
+        self.source = source
+        self.columns = list(pd.read_csv(source, nrows=0).columns)
+        self.offset = offset
+        self.last_line = line_ending_at(source, offset)
+        self.last_datetime = data["datetime"].max()
+        self.base_fingerprint = fingerprint
+        self._state = (data, cubes, fingerprint)
+        self._pending = AppendBuffer()
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        """The current (frame, cubes, fingerprint); never mutated by later refreshes."""
+        return self._state
+
+    @traced("ingest.refresh")
+    def refresh(self, compact=False):
+        """Ingest rows appended since the last refresh and return how many were published.
+
+        Rows are held back until they are due (see ``AppendBuffer.due``);
+        ``compact`` publishes everything read so far. Raises
+        ``SourceRewritten`` if the file was replaced or truncated; the caller
+        should then reload it from scratch.
+        """
+        with self._lock:
+            appended = read_appended(self.source, self.offset, self.last_line, self.columns)
+            if appended is not None:
+                rows, self.offset, self.last_line = appended
+                rows = preprocess(rows)
+                rows = rows[rows["datetime"] > self.last_datetime].reset_index(drop=True)
+                if not rows.empty:
+                    self.last_datetime = rows["datetime"].max()
+                    self._pending.add(rows)
+
+            data, cubes, _ = self._state
+            if not self._pending.due(len(data), compact):
+                return 0
+            published = self._pending.rows
+            data, cubes = self._pending.fold(data, cubes)
+            self._state = (data, cubes, f"{self.base_fingerprint}+{self.offset}")
+            return published
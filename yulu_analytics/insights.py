@@ -0,0 +1,158 @@
+"""Headline numbers behind the app's insight boxes, KPI cards and test panels.
+
+Every function takes the preprocessed frame, an aggregate cube and/or the
+column statistics and returns plain Python values (dicts of floats, ints and
+labels) or small pandas objects, with no Streamlit or plotting dependency, so
+the same numbers feed the app, the JSON report and benchmarks.
+"""
+import functools
+
+import pandas as pd
+
+from .aggregates import group_mean, group_size, overall_mean, total
+from .hypothesis import chi_square_independence, one_way_anova, split_groups, two_sample_ttest
+from .online_stats import column_summary, describe_columns
+from .profiling import traced
+from .schema import DAY_NAMES, MONTH_NAMES, NUMERICAL_COLUMNS
+from .sections import run_sections
+
+WEEKDAYS = DAY_NAMES[:5]
+WEEKEND = DAY_NAMES[5:]
+
+# Categorical columns of the calendar cube shown in the statistics table
+CATEGORY_COLUMNS = ["season", "holiday", "workingday", "weather", "day", "Month_name"]
+
+
+def _plain(value):
+    # numpy scalars -> int / float, labels pass through
+    return value.item() if hasattr(value, "item") else value
+
+
+def extremes(means):
+    """Best and worst group of a Series of group means, and the spread between them in percent."""
+    best, worst = means.idxmax(), means.idxmin()
+    best_value, worst_value = float(means[best]), float(means[worst])
+    return {
+        "best": _plain(best),
+        "best_value": best_value,
+        "worst": _plain(worst),
+        "worst_value": worst_value,
+        "variation_pct": (best_value - worst_value) / worst_value * 100,
+    }
+
+
+@traced("insights.category_profile")
+def category_profile(cube, by):
+    """``extremes`` of the mean rentals per ``by`` group (season, weather, ...)."""
+    return extremes(group_mean(cube, by))
+
+
+@traced("insights.hourly_profile")
+def hourly_profile(cube):
+    """Peak and quietest hour of the day, and the peak-to-low ratio."""
+    profile = extremes(group_mean(cube, "hour"))
+    profile["ratio"] = profile["best_value"] / profile["worst_value"]
+    return profile
+
+
+@traced("insights.weekly_profile")
+def weekly_profile(cube):
+    """Mean of the Monday-Friday daily means against the Saturday-Sunday ones."""
+    means = group_mean(cube, "day")
+    return {
+        "weekday_mean": float(means.reindex(WEEKDAYS).mean()),
+        "weekend_mean": float(means.reindex(WEEKEND).mean()),
+    }
+
+
+@traced("insights.monthly_profile")
+def monthly_profile(cube):
+    """``extremes`` of the mean rentals per calendar month."""
+    return extremes(group_mean(cube, "Month_name").reindex(MONTH_NAMES))
+
+
+@traced("insights.user_share")
+def user_share(cube):
+    """Share of rentals by registered and casual users, in percent."""
+    rentals = total(cube)
+    return {
+        "registered_pct": total(cube, "registered") / rentals * 100,
+        "casual_pct": total(cube, "casual") / rentals * 100,
+    }
+
+
+@traced("insights.kpis")
+def kpis(data, cube, stats):
+    """Dataset-level figures shown in the overview cards, from the cube and the column statistics."""
+    return {
+        "rows": len(data),
+        "columns": data.shape[1],
+        "total_rentals": total(cube),
+        "mean_rentals": float(overall_mean(cube)),
+        "max_rentals": int(column_summary(stats, "count")["max"]),
+        "mean_temp": column_summary(stats, "temp")["mean"],
+        "peak_hour": _plain(group_mean(cube, "hour").idxmax()),
+        "best_season": _plain(group_mean(cube, "season").idxmax()),
+        "best_weather": _plain(group_mean(cube, "weather").idxmax()),
+        **user_share(cube),
+    }
+
+
+@traced("insights.statistics_table")
+def statistics_table(cubes, categories=CATEGORY_COLUMNS):
+    """The ``describe(include="all")`` table of the categorical and numerical columns, from the aggregates.
+
+    count/unique/top/freq of ``categories`` come from the calendar cube's row
+    counts, the numerical rows from the column statistics.
+    """
+    summaries = {}
+    for column in categories:
+        sizes = group_size(cubes["calendar"], column)
+        sizes = sizes[sizes > 0]
+        summaries[column] = {"count": int(sizes.sum()), "unique": len(sizes),
+                             "top": _plain(sizes.idxmax()), "freq": int(sizes.max())}
+    numerical = describe_columns(cubes["stats"])
+    table = pd.concat([pd.DataFrame(summaries), numerical], axis=1)
+    return table.reindex(["count", "unique", "top", "freq", *numerical.index.drop("count")])
+
+
+@traced("insights.correlation_matrix")
+def correlation_matrix(data, columns=NUMERICAL_COLUMNS):
+    """Pearson correlation matrix of the numerical columns."""
+    return data[columns].corr()
+
+
+def count_correlations(corr):
+    """Correlations of every other column with ``count``, strongest positive first."""
+    return corr["count"].drop("count").sort_values(ascending=False)
+
+
+@traced("insights.contingency_table")
+def contingency_table(cube, rows, columns):
+    """Row counts per ``rows`` x ``columns`` pair, rolled up from a cube instead of a crosstab scan."""
+    return group_size(cube, [rows, columns]).unstack(fill_value=0)
+
+
+def _workingday_ttest(data, cube):
+    groups = split_groups(data, "workingday")
+    # A short date window may have only working days or only off days
+    return two_sample_ttest(groups.get("Yes", ()), groups.get("No", ()))
+
+
+# test name -> test of the Hypothesis Testing tab, run on (data, cube)
+HYPOTHESIS_TESTS = {
+    "workingday": _workingday_ttest,
+    "season": lambda data, cube: one_way_anova(split_groups(data, "season")),
+    "weather": lambda data, cube: one_way_anova(split_groups(data, "weather")),
+    "season_weather": lambda data, cube: chi_square_independence(contingency_table(cube, "season", "weather")),
+}
+
+
+@traced("insights.hypothesis_tests")
+def hypothesis_tests(data, cube, names=None, mode="serial"):
+    """Run the ``names`` tests (default: all four) of the Hypothesis Testing tab, keyed by name.
+
+    The tests are independent; ``mode="threads"`` runs them concurrently (see sections.py).
+    """
+    names = list(HYPOTHESIS_TESTS) if names is None else names
+    return run_sections({name: functools.partial(HYPOTHESIS_TESTS[name], data, cube) for name in names}, mode)
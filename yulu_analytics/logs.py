@@ -0,0 +1,80 @@
+"""Size-bounded application logging and a tail reader for the Logs tab.
+
+``configure_logging`` replaces ``logging.basicConfig(filename=...)``: records
+go to a ``RotatingFileHandler``, so the log never grows past ``max_bytes``
+plus ``backup_count`` rotated files. With ``use_queue`` the logging thread
+only enqueues each record and a background ``QueueListener`` does the file
+I/O, so a slow disk never stalls a rerun. ``tail_lines`` reads the last lines
+by seeking backwards from the end of the file instead of reading all of it.
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_configure_lock = threading.Lock()
+
+
+def configure_logging(path, level=logging.INFO, max_bytes=5 * 1024 * 1024, backup_count=3, use_queue=False):
+    """Log the root logger's records to a rotating file at ``path``.
+
+    Like ``basicConfig`` it does nothing once the root logger has handlers,
+    so it is safe to call on every rerun and from concurrent sessions.
+    """
+    with _configure_lock:
+        root = logging.getLogger()
+        if root.handlers:
+            return
+        handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count,
+                                                       encoding="utf-8")
+        handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
+        if use_queue:
+            records = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+            listener.start()
+            # Flush whatever is still queued when the server shuts down
+            atexit.register(listener.stop)
+            handler = logging.handlers.QueueHandler(records)
+        root.addHandler(handler)
+        root.setLevel(level)
+
+
+def tail_lines(path, n=50, block_size=8192):
+    """Return the last ``n`` lines of ``path`` (fewer if it is shorter, [] if it is missing).
+
+    Just after a rollover the current file may hold fewer than ``n`` lines;
+    the rest are then taken from the newest rotated file, ``path.1``.
+    """
+    lines = _tail(path, n, block_size)
+    if len(lines) < n:
+        lines = _tail(f"{path}.1", n - len(lines), block_size) + lines
+    return lines
+
+
+def _tail(path, n, block_size):
+    if n <= 0:
+        return []
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return []
+    with f:
+        position = f.seek(0, os.SEEK_END)
+        blocks, newlines = [], 0
+        # n complete lines need n + 1 newlines unless the start of the file is reached
+        while position > 0 and newlines <= n:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+    lines = b"".join(reversed(blocks)).splitlines()
+    if position > 0:
+        lines = lines[1:]  # partial line cut by the first block read
+    return [line.decode("utf-8", errors="replace") for line in lines[-n:]]
@@ -0,0 +1,159 @@
+"""Mergeable summary statistics of the numerical columns.
+
+Like the aggregate cubes, the statistics are kept as a small frame of
+additive pieces that is built once at ingest time, updated by merging when
+rows are appended and merged across partitions (chunks, months, cities). Per
+column it holds:
+
+* count, mean and sum of squared deviations, merged with Chan et al.'s
+  parallel form of Welford's update, so mean and variance stay exact;
+* min and max;
+* a merging t-digest (value centroids with weights) for quantiles. Every
+  distinct value is its own centroid up to ``MAX_CENTROIDS`` per column, so
+  the discrete Yulu columns get exact quantiles (``exact``); beyond that the
+  centroids are compressed with the k1 scale function to about
+  ``COMPRESSION / 2`` and quantiles are interpolated between them. A k1
+  unit spans at most pi / COMPRESSION of the ranks, so a compressed
+  quantile's rank is off by at most that (0.8% of the rows by default).
+
+The frame has one row per (column, centroid), with the column's moments
+repeated on each row, so it can be stored next to the cubes and memory-mapped
+like them. ``describe_columns`` turns it into the ``DataFrame.describe()``
+table without touching the rows.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .schema import NUMERICAL_COLUMNS
+
+STATS_FIELDS = ["column", "n", "mean", "m2", "min", "max", "exact", "centroid", "weight"]
+
+# t-digest compression (delta); compressed digests keep about delta / 2 centroids
+COMPRESSION = 400
+# columns with at most this many distinct values are kept exactly
+MAX_CENTROIDS = 2000
+
+ColumnState = namedtuple("ColumnState", ["n", "mean", "m2", "min", "max", "exact", "centroids", "weights"])
+
+
+def _compress(centroids, weights, compression=COMPRESSION, max_centroids=MAX_CENTROIDS):
+    # Merge sorted centroids that fall into the same unit of the k1 scale function,
+    # which keeps clusters small near the tails and larger around the median
+    if len(centroids) <= max_centroids:
+        return centroids, weights, True
+    q = (np.cumsum(weights) - weights / 2) / weights.sum()
+    k = np.floor(compression / (2 * np.pi) * np.arcsin(2 * q - 1))
+    starts = np.flatnonzero(np.r_[True, k[1:] != k[:-1]])
+    merged_weights = np.add.reduceat(weights, starts)
+    return np.add.reduceat(centroids * weights, starts) / merged_weights, merged_weights, False
+
+
+def _column_state(values):
+    values = pd.Series(np.asarray(values, dtype="float64")).dropna()
+    if values.empty:
+        return None
+    mean = values.mean()
+    # Hash-based counting: far cheaper than sorting for low-cardinality columns
+    counts = values.value_counts(sort=False).sort_index()
+    centroids, weights, exact = _compress(counts.index.to_numpy(dtype="float64"), counts.to_numpy(dtype="int64"))
+    return ColumnState(len(values), float(mean), float(((values - mean) ** 2).sum()),
+                       float(values.min()), float(values.max()), exact, centroids, weights)
+
+
+def _merge_states(left, right):
+    if left is None or right is None:
+        return left if right is None else right
+    n = left.n + right.n
+    delta = right.mean - left.mean
+    centroids = np.concatenate([left.centroids, right.centroids])
+    weights = np.concatenate([left.weights, right.weights])
+    order = np.argsort(centroids, kind="stable")
+    centroids, weights = centroids[order], weights[order]
+    # Identical values from both sides become one centroid
+    starts = np.flatnonzero(np.r_[True, centroids[1:] != centroids[:-1]])
+    centroids, weights, exact = _compress(centroids[starts], np.add.reduceat(weights, starts))
+    return ColumnState(n, left.mean + delta * right.n / n,
+                       left.m2 + right.m2 + delta ** 2 * left.n * right.n / n,
+                       min(left.min, right.min), max(left.max, right.max),
+                       left.exact and right.exact and exact, centroids, weights)
+
+
+def _to_frame(states):
+    parts = [
+        pd.DataFrame({
+            "column": column, "n": state.n, "mean": state.mean, "m2": state.m2,
+            "min": state.min, "max": state.max, "exact": state.exact,
+            "centroid": state.centroids, "weight": state.weights,
+        })
+        for column, state in states.items() if state is not None
+    ]
+    if not parts:
+        return pd.DataFrame({field: pd.Series(dtype="float64") for field in STATS_FIELDS})
+    frame = pd.concat(parts, ignore_index=True)
+    return frame.astype({"column": "object", "n": "int64", "exact": "bool", "weight": "int64"})
+
+
+def _from_frame(stats):
+    states = {}
+    for column, rows in stats.groupby("column", sort=False):
+        first = rows.iloc[0]
+        states[column] = ColumnState(int(first["n"]), float(first["mean"]), float(first["m2"]),
+                                     float(first["min"]), float(first["max"]), bool(first["exact"]),
+                                     rows["centroid"].to_numpy(dtype="float64"),
+                                     rows["weight"].to_numpy(dtype="int64"))
+    return states
+
+
+def build_stats(data, columns=NUMERICAL_COLUMNS):
+    """Summary statistics of ``columns`` of ``data`` (NaNs are skipped, like ``describe``)."""
+    return _to_frame({column: _column_state(data[column]) for column in columns})
+
+
+def merge_stats(*frames):
+    """Combine statistics built from disjoint sets of rows (chunks, appended rows, partitions)."""
+    merged = {}
+    for frame in frames:
+        for column, state in _from_frame(frame).items():
+            merged[column] = _merge_states(merged.get(column), state)
+    return _to_frame(merged)
+
+
+def _quantiles(state, qs):
+    ends = np.cumsum(state.weights) - 1
+    starts = ends - state.weights + 1
+    if state.exact:
+        # Each distinct value covers its run of ranks [start, end]; between runs the
+        # value is interpolated linearly, exactly like pandas' default
+        ranks = np.column_stack([starts, ends]).ravel()
+        values = np.repeat(state.centroids, 2)
+    else:
+        # Compressed centroids sit at the middle of their ranks, with min and max at the ends
+        ranks = np.r_[0, (starts + ends) / 2, state.n - 1]
+        values = np.r_[state.min, state.centroids, state.max]
+    return np.interp(np.asarray(qs) * (state.n - 1), ranks, values)
+
+
+def column_summary(stats, column, percentiles=(0.25, 0.5, 0.75)):
+    """count, mean, std, min, percentiles and max of one column, as a dict."""
+    state = _from_frame(stats[stats["column"] == column]).get(column)
+    if state is None:
+        return {"count": 0}
+    summary = {
+        "count": state.n,
+        "mean": state.mean,
+        "std": float(np.sqrt(state.m2 / (state.n - 1))) if state.n > 1 else float("nan"),
+        "min": state.min,
+    }
+    for p, value in zip(percentiles, _quantiles(state, percentiles)):
+        summary[f"{p * 100:g}%"] = float(value)
+    summary["max"] = state.max
+    return summary
+
+
+def describe_columns(stats, columns=None):
+    """The ``data[columns].describe()`` table, served from the statistics."""
+    if columns is None:
+        columns = list(dict.fromkeys(stats["column"]))
+    return pd.DataFrame({column: column_summary(stats, column) for column in columns})
@@ -0,0 +1,225 @@
+"""Partitioned datasets: a directory of per-zone, per-period CSVs with a manifest.
+
+Layout: ``<root>/<zone>/<period>.csv`` plus ``<root>/manifest.json``, which
+lists every partition with its zone, first and last ``datetime`` and row
+count, so a selection of zones and dates is resolved to the files it needs
+without opening any of them. The newest partition of each zone is treated as
+open-ended, since rows keep being appended to it after the manifest was
+written.
+
+``PartitionedDataset`` opens partitions on demand, each through the same
+single-file loader as ``yulu_data.csv`` (so each has its own disk cache,
+cubes and ``LiveDataset`` refresh), loading the missing ones of a selection in
+parallel. A ``PartitionView`` combines the selected partitions: one frame,
+the partitions' cubes merged, and the ``LiveDataset`` interface (``snapshot``,
+``refresh``, ``source``, ``base_fingerprint``), so the app, report and API
+work on one zone or all of them the same way. Rows appended to a partition
+are appended to the end of the combined frame as well, so it only ever grows
+at the end, like a single file's frame.
+
+``python -m yulu_analytics.repartition`` splits CSVs into partitions and
+writes the manifest.
+"""
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+import pandas as pd
+
+from .aggregates import merge_cube_sets
+from .ingest import AppendBuffer
+from .profiling import traced
+from .sections import run_sections
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+PERIODS = {"month": "%Y-%m", "year": "%Y"}
+
+
+def manifest_path(directory):
+    return os.path.join(directory, MANIFEST_NAME)
+
+
+def is_partitioned(source):
+    """Whether ``source`` is a partition directory (has a manifest) rather than a CSV."""
+    return os.path.isdir(source) and os.path.exists(manifest_path(source))
+
+
+def _partition_entry(directory, path):
+    # Manifest entry of one partition file; its zone is the subdirectory it is in
+    relative = os.path.relpath(path, directory)
+    zone = os.path.dirname(relative).split(os.sep)[0] or os.path.basename(os.path.abspath(directory))
+    stamps = pd.to_datetime(pd.read_csv(path, usecols=["datetime"])["datetime"])
+    return {
+        "path": relative.replace(os.sep, "/"),
+        "zone": zone,
+        "start": stamps.min().isoformat() if len(stamps) else None,
+        "end": stamps.max().isoformat() if len(stamps) else None,
+        "rows": len(stamps),
+    }
+
+
+def write_manifest(directory):
+    """Scan the CSVs under ``directory`` and (re)write its manifest; returns the entries."""
+    paths = sorted(os.path.join(root, name) for root, _, names in os.walk(directory)
+                   for name in names if name.endswith(".csv"))
+    partitions = [entry for entry in (_partition_entry(directory, path) for path in paths) if entry["rows"]]
+    # Written to a temp file and renamed, so a running app never reads half a manifest
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump({"version": MANIFEST_VERSION, "partitions": partitions}, f, indent=2)
+    os.replace(tmp_path, manifest_path(directory))
+    return partitions
+
+
+def read_manifest(directory):
+    """The manifest's partitions, with ``start``/``end`` as Timestamps."""
+    with open(manifest_path(directory)) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version {manifest.get('version')} in {directory}")
+    return [{**entry, "start": pd.Timestamp(entry["start"]), "end": pd.Timestamp(entry["end"])}
+            for entry in manifest["partitions"]]
+
+
+@traced("partitions.split_csv")
+def split_csv(source, directory, zone, by="month"):
+    """Write the rows of ``source`` to ``<directory>/<zone>/<period>.csv`` files and re-index the directory."""
+    raw = pd.read_csv(source, dtype=str)
+    periods = pd.to_datetime(raw["datetime"]).dt.strftime(PERIODS[by])
+    os.makedirs(os.path.join(directory, zone), exist_ok=True)
+    for period, rows in raw.groupby(periods, sort=True):
+        rows.to_csv(os.path.join(directory, zone, f"{period}.csv"), index=False)
+    return write_manifest(directory)
+
+
+def combined_fingerprint(parts):
+    """One fingerprint for several (path, fingerprint) pairs."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path, fingerprint in parts:
+        digest.update(f"{path}={fingerprint}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class PartitionedDataset:
+    """The partitions of a manifest, opened on demand and shared by every view of them."""
+
+    def __init__(self, directory, open_partition):
+        self.directory = directory
+        self.open_partition = open_partition
+        self._opened = {}
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._manifest_mtime = None
+        self.reload_manifest()
+
+    def reload_manifest(self):
+        """Re-read the manifest if it changed since it was last read; returns whether it did."""
+        mtime = os.stat(manifest_path(self.directory)).st_mtime_ns
+        if mtime == self._manifest_mtime:
+            return False
+        partitions = read_manifest(self.directory)
+        with self._lock:
+            self.partitions = partitions
+            self._manifest_mtime = mtime
+        return True
+
+    def zones(self):
+        return sorted({entry["zone"] for entry in self.partitions})
+
+    def span(self, zones=None):
+        """First and last timestamp of the ``zones`` partitions (all zones by default)."""
+        entries = [entry for entry in self.partitions if zones is None or entry["zone"] in zones]
+        if not entries:
+            return None, None
+        return min(entry["start"] for entry in entries), max(entry["end"] for entry in entries)
+
+    def select(self, zones=None, start=None, end=None):
+        """Paths of the partitions of ``zones`` with rows in ``start <= datetime < end``; the rest are pruned."""
+        partitions = self.partitions
+        newest = {}
+        for entry in partitions:
+            if entry["zone"] not in newest or entry["start"] > newest[entry["zone"]]["start"]:
+                newest[entry["zone"]] = entry
+        selected = []
+        for entry in partitions:
+            if zones is not None and entry["zone"] not in zones:
+                continue
+            if end is not None and entry["start"] >= end:
+                continue
+            # The newest partition of a zone may have had rows appended since it was indexed
+            if start is not None and entry["end"] < start and newest[entry["zone"]] is not entry:
+                continue
+            selected.append(entry["path"])
+        return tuple(selected)
+
+    @traced("partitions.open")
+    def open(self, paths, mode="threads"):
+        """path -> ``LiveDataset`` for ``paths``, loading the ones not open yet together (see sections.py)."""
+        with self._load_lock:
+            missing = [path for path in paths if path not in self._opened]
+            if missing:
+                loaded = run_sections({path: functools.partial(self.open_partition, os.path.join(self.directory, path))
+                                       for path in missing}, mode)
+                with self._lock:
+                    self._opened.update(loaded)
+            return {path: self._opened[path] for path in paths}
+
+    def view(self, paths=None, mode="threads"):
+        """A ``PartitionView`` of ``paths`` (default: every partition)."""
+        return PartitionView(self, self.select() if paths is None else tuple(paths), mode)
+
+
+class PartitionView:
+    """Selected partitions as one frame with merged cubes, behaving like a ``LiveDataset``."""
+
+    @traced("partitions.view")
+    def __init__(self, dataset, paths, mode="threads"):
+        if not paths:
+            raise ValueError(f"No partitions selected in {dataset.directory}")
+        self.dataset = dataset
+        self.source = dataset.directory
+        self.paths = tuple(paths)
+        self.parts = dataset.open(self.paths, mode)
+        snapshots = [self.parts[path].snapshot() for path in self.paths]
+        self._lengths = {path: len(snapshot[0]) for path, snapshot in zip(self.paths, snapshots)}
+        data = pd.concat([snapshot[0] for snapshot in snapshots], ignore_index=True)
+        cubes = merge_cube_sets(*(snapshot[1] for snapshot in snapshots))
+        self.base_fingerprint = self._fingerprint()
+        self._state = (data, cubes, self.base_fingerprint)
+        self._pending = AppendBuffer()
+        self._lock = threading.Lock()
+
+    def _fingerprint(self):
+        return combined_fingerprint((path, self.parts[path].snapshot()[2]) for path in self.paths)
+
+    def snapshot(self):
+        """The current (frame, cubes, fingerprint); never mutated by later refreshes."""
+        return self._state
+
+    @traced("partitions.refresh")
+    def refresh(self, compact=False):
+        """Refresh every partition and append their new rows to the combined frame; returns how many.
+
+        Partitions publish their rows at once (a partition is small to copy);
+        the combined frame holds them back like ``LiveDataset.refresh``.
+        ``SourceRewritten`` from a partition is passed on: the caller reloads.
+        """
+        with self._lock:
+            for path in self.paths:
+                part = self.parts[path]
+                part.refresh(compact=True)
+                data = part.snapshot()[0]
+                if len(data) > self._lengths[path]:
+                    self._pending.add(data.iloc[self._lengths[path]:])
+                    self._lengths[path] = len(data)
+            data, cubes, _ = self._state
+            if not self._pending.due(len(data), compact):
+                return 0
+            published = self._pending.rows
+            self._state = (*self._pending.fold(data, cubes), self._fingerprint())
+            return published
+
@@ -0,0 +1,154 @@
+"""Nested wall-time spans for finding the slow sections of a rerun.
+
+A ``Profiler`` collects the spans of one unit of work (one Streamlit rerun,
+one report run). ``activate`` makes it current for the calling context;
+``span`` and the ``traced`` decorator record into the current profiler and
+cost a single ContextVar lookup when none is active, so the analytics
+functions stay instrumented in batch jobs, benchmarks and background threads.
+
+Each span records its start offset, wall time, the rows it processed (when
+known) and the change in the process's resident memory. Resident memory is
+process-wide, so concurrent sessions show up in each other's deltas.
+"""
+import contextvars
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+
+_current = contextvars.ContextVar("yulu_profiler", default=None)
+
+try:
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    PAGE_SIZE = 4096
+
+
+def rss_bytes():
+    """Resident set size of this process, or None where ``/proc`` is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class Profiler:
+    """Spans of one run, in start order (parents before their children)."""
+
+    def __init__(self, label=""):
+        self.label = label
+        self.started = time.time()
+        self.seconds = None
+        self.spans = []
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    @contextmanager
+    def span(self, name, rows=None, **attrs):
+        """Time the ``with`` body; the yielded dict takes extra attributes (e.g. a cache hit flag)."""
+        record = {"name": name, "depth": self._depth, "start": time.perf_counter() - self._origin,
+                  "seconds": None, "rows": rows, "mem_delta": None, **attrs}
+        self.spans.append(record)
+        memory = rss_bytes()
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            self._depth -= 1
+            if memory is not None:
+                record["mem_delta"] = rss_bytes() - memory
+
+    def adopt(self, name, child, **attrs):
+        """Record ``child``, a finished profiler of work done on another thread, as a span named ``name``.
+
+        The child's spans are nested under it at their real start times, so
+        concurrent sections overlap in the flame chart.
+        """
+        offset = child._origin - self._origin
+        self.spans.append({"name": name, "depth": self._depth, "start": offset, "seconds": child.seconds,
+                           "rows": None, "mem_delta": None, **attrs})
+        for record in child.completed():
+            self.spans.append({**record, "depth": record["depth"] + self._depth + 1,
+                               "start": record["start"] + offset})
+
+    def elapsed(self):
+        return time.perf_counter() - self._origin
+
+    def finish(self):
+        self.seconds = self.elapsed()
+        return self
+
+    def completed(self):
+        """Spans that have finished (an in-progress run still has its enclosing spans open)."""
+        return [record for record in self.spans if record["seconds"] is not None]
+
+    def to_jsonl(self):
+        """One JSON object per completed span, tagged with the run label and start time."""
+        return "".join(json.dumps({"run": self.label, "run_started": self.started, **record}, default=str) + "\n"
+                       for record in self.completed())
+
+
+def activate(profiler):
+    """Make ``profiler`` current for this context; returns a token for ``deactivate``."""
+    return _current.set(profiler)
+
+
+def deactivate(token):
+    _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+@contextmanager
+def span(name, rows=None, **attrs):
+    """``Profiler.span`` on the current profiler, or a no-op when there is none."""
+    profiler = _current.get()
+    if profiler is None:
+        yield {}
+        return
+    with profiler.span(name, rows, **attrs) as record:
+        yield record
+
+
+def traced(name):
+    """Record every call of the decorated function as a span named ``name``.
+
+    Rows are taken from the first argument when it is a frame or array.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _current.get()
+            if profiler is None:
+                return func(*args, **kwargs)
+            rows = len(args[0]) if args and hasattr(args[0], "shape") else None
+            with profiler.span(name, rows):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def summarize(profilers):
+    """Per span name: calls, total/mean/max seconds, rows and memory delta over ``profilers``.
+
+    Sorted by total time, slowest first.
+    """
+    totals = {}
+    for profiler in profilers:
+        for record in profiler.completed():
+            entry = totals.setdefault(record["name"], {"name": record["name"], "calls": 0, "total_s": 0.0,
+                                                       "max_s": 0.0, "rows": 0, "mem_delta": 0})
+            entry["calls"] += 1
+            entry["total_s"] += record["seconds"]
+            entry["max_s"] = max(entry["max_s"], record["seconds"])
+            entry["rows"] += record["rows"] or 0
+            entry["mem_delta"] += record["mem_delta"] or 0
+    for entry in totals.values():
+        entry["mean_s"] = entry["total_s"] / entry["calls"]
+    return sorted(totals.values(), key=lambda entry: entry["total_s"], reverse=True)
@@ -0,0 +1,33 @@
+"""Split CSVs into a partitioned dataset directory and (re)write its manifest.
+
+Usage: python -m yulu_analytics.repartition split yulu_data.csv data/ --zone delhi [--by month]
+       python -m yulu_analytics.repartition index data/
+"""
+import argparse
+
+from .partitions import PERIODS, manifest_path, split_csv, write_manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    split = commands.add_parser("split", help="split a CSV into one zone's period partitions")
+    split.add_argument("source")
+    split.add_argument("directory")
+    split.add_argument("--zone", required=True)
+    split.add_argument("--by", choices=sorted(PERIODS), default="month")
+    index = commands.add_parser("index", help="rewrite the manifest from the CSVs in a directory")
+    index.add_argument("directory")
+    args = parser.parse_args(argv)
+
+    if args.command == "split":
+        partitions = split_csv(args.source, args.directory, args.zone, args.by)
+    else:
+        partitions = write_manifest(args.directory)
+    zones = sorted({entry["zone"] for entry in partitions})
+    print(f"{manifest_path(args.directory)}: {len(partitions)} partitions, "
+          f"{sum(entry['rows'] for entry in partitions):,} rows in {len(zones)} zone(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Headless JSON report of the app's headline numbers, for batch jobs.
+
+Usage: python -m yulu_analytics.report [source] [--output report.json]
+"""
+import argparse
+import json
+import math
+import sys
+
+from .dataset import open_dataset
+from .insights import (category_profile, correlation_matrix, count_correlations, hourly_profile,
+                       hypothesis_tests, kpis, monthly_profile, weekly_profile)
+
+
+def json_safe(value):
+    """``value`` with NaN and infinities (untestable tests, constant columns) as None, for strict JSON."""
+    if isinstance(value, dict):
+        return {key: json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe(item) for item in value]
+    if hasattr(value, "item") and not hasattr(value, "__len__"):
+        # numpy scalars
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def strip_tables(results):
+    """``hypothesis_tests`` results without their observed / expected frequency tables, which are not output."""
+    return {name: {key: value for key, value in result.items() if key not in ("observed", "expected")}
+            for name, result in results.items()}
+
+
+def build_report(data, cube, stats):
+    """Collect every insight for ``data``, its calendar ``cube`` and column ``stats`` into one JSON dict."""
+    return {
+        "kpis": kpis(data, cube, stats),
+        "season": category_profile(cube, "season"),
+        "weather": category_profile(cube, "weather"),
+        "hourly": hourly_profile(cube),
+        "weekly": weekly_profile(cube),
+        "monthly": monthly_profile(cube),
+        "count_correlations": count_correlations(correlation_matrix(data)).to_dict(),
+        "hypothesis_tests": strip_tables(hypothesis_tests(data, cube)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="?", help="CSV to analyze (default: the app's data source)")
+    parser.add_argument("--output", help="write the report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    live = open_dataset(args.source)
+    data, cubes, fingerprint = live.snapshot()
+    report = {"source": live.source, "fingerprint": fingerprint,
+              **build_report(data, cubes["calendar"], cubes["stats"])}
+    text = json.dumps(json_safe(report), indent=2, default=str, allow_nan=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
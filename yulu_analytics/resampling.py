@@ -0,0 +1,209 @@
+"""Bootstrap confidence intervals and permutation tests for the group comparisons.
+
+``count`` is heavily skewed, so the Hypothesis Testing tab backs the t-test
+and ANOVAs with resampling. Both resample the per-group value counts
+(distinct values x groups) rather than the rows:
+
+- a bootstrap resample of a group of n rows draws each distinct value a
+  Multinomial(n, shares) number of times;
+- a permutation of the group labels hands the pooled value counts to the
+  groups as a random table with the pooled counts and the group sizes as
+  margins (multivariate hypergeometric for two groups, Patefield's algorithm
+  for more).
+
+Both are exact, and a resample costs O(distinct values x groups) however many
+rows the data has. On one core, 10k bootstrap plus 10k permutation resamples
+take about 6-8 s for the two-group working-day comparison and 10-13 s for
+the four-group season and weather ANOVAs (Patefield dominates), on the
+bundled ~10k rows and on 1M rows alike (~23 s for season at 1M, which has
+more distinct counts). Drawing row indices instead costs minutes at 1M
+rows. ``"processes"`` divides these times by the number of cores; the
+serial fallback of ``default_resampling_mode`` on single-core machines does
+not, so the dashboard defaults to 2,000 resamples per core of the default
+mode (at most ~2 s per comparison) and leaves larger counts opt-in.
+
+Resamples are drawn in batches, each from its own child of the seed's
+``SeedSequence``, so results depend only on the seed and the number of
+resamples, not on how the batches are run: one after another (``"serial"``),
+on the section thread pool (``"threads"``) or on a process pool
+(``"processes"``). Unlike the dashboard sections, a batch's inputs are a few
+small arrays, so sending them to another process costs next to nothing.
+"""
+import functools
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.stats import random_table
+
+from .profiling import traced
+from .sections import run_sections
+
+RESAMPLING_MODES = ("serial", "threads", "processes")
+
+RESAMPLING_WORKERS = int(os.environ.get("YULU_RESAMPLING_WORKERS", os.cpu_count() or 1))
+
+BATCH_SIZE = 1000
+
+# comparison name -> (grouping column, group order); the first two groups are compared by mean difference
+COMPARISONS = {
+    "workingday": ("workingday", ["Yes", "No"]),
+    "season": ("season", None),
+    "weather": ("weather", None),
+}
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def default_resampling_mode():
+    """``YULU_RESAMPLING_MODE`` if set, else processes on multi-core machines and serial otherwise."""
+    mode = os.environ.get("YULU_RESAMPLING_MODE")
+    if mode in RESAMPLING_MODES:
+        return mode
+    return "processes" if RESAMPLING_WORKERS > 1 else "serial"
+
+
+def _get_pool():
+    # Spawned rather than forked: the app process runs server and worker threads
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=RESAMPLING_WORKERS,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+@traced("resampling.group_value_counts")
+def group_value_counts(data, by, value="count", order=None):
+    """Distinct ``value`` values and how often each occurs in every ``by`` group.
+
+    Returns (labels, values, counts) with ``counts[g, k]`` the rows of group
+    ``labels[g]`` holding ``values[k]``. Groups are ordered like ``groupby``,
+    or as ``order`` lists them (labels absent from the data are dropped).
+    """
+    codes, labels = pd.factorize(data[by], sort=True)
+    values, inverse = np.unique(data[value].to_numpy(), return_inverse=True)
+    valid = codes >= 0
+    counts = np.bincount(codes[valid] * len(values) + inverse[valid],
+                         minlength=len(labels) * len(values)).reshape(len(labels), len(values))
+    labels = list(labels)
+    if order is not None:
+        rows = [labels.index(label) for label in order if label in labels]
+        labels, counts = [labels[row] for row in rows], counts[rows]
+    return labels, values.astype("float64"), counts
+
+
+def _bootstrap_batch(values, counts, seed, size):
+    # (size, groups) means of multinomial resamples of each group
+    rng = np.random.default_rng(seed)
+    means = np.empty((size, len(counts)))
+    for g, group in enumerate(counts):
+        # Values the group never takes cannot be drawn: leave them out of the multinomial
+        held = group > 0
+        n = group.sum()
+        means[:, g] = rng.multinomial(n, group[held] / n, size=size) @ values[held] / n
+    return means
+
+
+def _permutation_batch(values, counts, seed, size):
+    # (size, groups) sums of the groups after shuffling the labels
+    rng = np.random.default_rng(seed)
+    pooled, sizes = counts.sum(axis=0), counts.sum(axis=1)
+    if len(sizes) == 2:
+        first = rng.multivariate_hypergeometric(pooled, sizes[0], size=size, method="marginals") @ values
+        return np.column_stack([first, pooled @ values - first])
+    tables = random_table(pooled, sizes).rvs(size=size, method="patefield", random_state=rng)
+    return np.einsum("bkg,k->bg", tables, values)
+
+
+def _run_batches(task, values, counts, seed, resamples, mode):
+    sizes = [min(BATCH_SIZE, resamples - start) for start in range(0, resamples, BATCH_SIZE)]
+    seeds = seed.spawn(len(sizes))
+    if mode == "processes":
+        pool = _get_pool()
+        futures = [pool.submit(task, values, counts, child, size) for child, size in zip(seeds, sizes)]
+        return np.concatenate([future.result() for future in futures])
+    batches = run_sections({i: functools.partial(task, values, counts, child, size)
+                            for i, (child, size) in enumerate(zip(seeds, sizes))},
+                           "threads" if mode == "threads" else "serial")
+    return np.concatenate(list(batches.values()))
+
+
+def _f_statistic(sums, sizes, total, total_sumsq):
+    # One-way ANOVA F from the group sums; the total sum of squares is the same for every permutation
+    n, k = sizes.sum(), len(sizes)
+    between = (sums ** 2 / sizes).sum(axis=-1) - total ** 2 / n
+    within = total_sumsq - total ** 2 / n - between
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (between / (k - 1)) / (within / (n - k))
+
+
+def _percentiles(samples, confidence):
+    tail = (1 - confidence) / 2 * 100
+    return np.percentile(samples, [tail, 100 - tail], axis=0)
+
+
+@traced("resampling.resampling_test")
+def resampling_test(data, by, value="count", order=None, resamples=10_000, confidence=0.95, seed=0,
+                    mode="serial"):
+    """Bootstrap confidence intervals of the ``by`` group means and a permutation test of their equality.
+
+    With two groups the statistic is the difference of their means (first
+    minus second, tested two-sided), otherwise the one-way ANOVA F. The
+    p-value counts the permutations at least as extreme as the data, plus
+    one, over ``resamples + 1``. It is NaN when fewer than two groups have
+    rows, like the parametric tests.
+    """
+    if mode not in RESAMPLING_MODES:
+        raise ValueError(f"Unknown resampling mode {mode!r}")
+    started = time.perf_counter()
+    labels, values, counts = group_value_counts(data, by, value, order)
+    present = counts.sum(axis=1) > 0
+    labels, counts = [label for label, keep in zip(labels, present) if keep], counts[present]
+    sizes = counts.sum(axis=1)
+    sums = counts @ values
+    boot_seed, perm_seed = np.random.SeedSequence(seed).spawn(2)
+
+    result = {
+        "labels": labels, "n": sizes.tolist(), "means": (sums / sizes).tolist(),
+        "ci_low": [], "ci_high": [], "difference": None,
+        "statistic": float("nan"), "p_value": float("nan"),
+        "resamples": resamples, "confidence": confidence, "seed": seed, "mode": mode,
+    }
+    if len(labels):
+        means = _run_batches(_bootstrap_batch, values, counts, boot_seed, resamples, mode)
+        low, high = _percentiles(means, confidence)
+        result["ci_low"], result["ci_high"] = low.tolist(), high.tolist()
+        if len(labels) == 2:
+            diff_low, diff_high = _percentiles(means[:, 0] - means[:, 1], confidence)
+            result["difference"] = {"value": float(sums[0] / sizes[0] - sums[1] / sizes[1]),
+                                    "ci_low": float(diff_low), "ci_high": float(diff_high)}
+
+    if len(labels) >= 2 and sizes.sum() > len(labels):
+        permuted = _run_batches(_permutation_batch, values, counts, perm_seed, resamples, mode)
+        if len(labels) == 2:
+            observed = result["difference"]["value"]
+            extreme = np.abs(permuted[:, 0] / sizes[0] - permuted[:, 1] / sizes[1])
+            statistic = abs(observed)
+        else:
+            total, total_sumsq = sums.sum(), counts.sum(axis=0) @ values ** 2
+            observed = float(_f_statistic(sums, sizes, total, total_sumsq))
+            extreme = _f_statistic(permuted, sizes, total, total_sumsq)
+            statistic = observed
+        # Permutations that tie the data differ from it only by rounding
+        hits = int((extreme >= statistic * (1 - 1e-9)).sum())
+        result["statistic"], result["p_value"] = observed, (hits + 1) / (resamples + 1)
+
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def comparison_test(data, name, **options):
+    """``resampling_test`` of one of the ``COMPARISONS`` of the Hypothesis Testing tab."""
+    by, order = COMPARISONS[name]
+    return resampling_test(data, by, order=order, **options)
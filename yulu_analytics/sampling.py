@@ -0,0 +1,71 @@
+"""Bounded-size inputs for the large scatter plots.
+
+Scatter plots ship every point to the browser, so above a row threshold the
+app draws a stratified sample (or a 2D binned aggregate) instead. Trendlines
+are fitted on the full data from running sums, so they do not depend on the
+sample and need no statsmodels refit.
+"""
+import numpy as np
+import pandas as pd
+
+
+def stratified_sample(data, by, max_rows, seed=0):
+    """Sample at most about ``max_rows`` rows, keeping each ``by`` group's share."""
+    if len(data) <= max_rows:
+        return data
+    frac = max_rows / len(data)
+    return data.groupby(by, observed=True, group_keys=False).sample(frac=frac, random_state=seed)
+
+
+def ols_trendlines(data, x, y, by=None):
+    """Least-squares fit of ``y`` on ``x`` per ``by`` group (one fit if ``by`` is None).
+
+    Returns a dict of group label -> slope, intercept, r2, n and the x range.
+    """
+    xv = data[x].to_numpy(dtype="float64")
+    yv = data[y].to_numpy(dtype="float64")
+    keys = data[by] if by is not None else np.zeros(len(data), dtype="int8")
+    grouped = pd.DataFrame({
+        "x": xv, "y": yv, "xx": xv * xv, "xy": xv * yv, "yy": yv * yv,
+    }, index=data.index).groupby(keys, observed=True)
+    sums = grouped.sum()
+    n = grouped.size()
+    x_range = grouped["x"].agg(["min", "max"])
+
+    sxx = sums["xx"] - sums["x"] ** 2 / n
+    sxy = sums["xy"] - sums["x"] * sums["y"] / n
+    syy = sums["yy"] - sums["y"] ** 2 / n
+    slope = sxy / sxx
+    intercept = (sums["y"] - slope * sums["x"]) / n
+    r2 = sxy ** 2 / (sxx * syy)
+
+    return {
+        (label if by is not None else None): {
+            "slope": float(slope[label]),
+            "intercept": float(intercept[label]),
+            "r2": float(r2[label]),
+            "n": int(n[label]),
+            "x_min": float(x_range.loc[label, "min"]),
+            "x_max": float(x_range.loc[label, "max"]),
+        }
+        for label in sums.index
+    }
+
+
+def binned_mean(data, x, y, value, bins=40):
+    """Aggregate points onto a ``bins`` x ``bins`` grid with the mean of ``value`` per cell.
+
+    Returns the x and y bin centers and a (y, x) grid of means, NaN for empty cells.
+    """
+    xv = data[x].to_numpy(dtype="float64")
+    yv = data[y].to_numpy(dtype="float64")
+    counts, x_edges, y_edges = np.histogram2d(xv, yv, bins=bins)
+    totals, _, _ = np.histogram2d(xv, yv, bins=[x_edges, y_edges], weights=data[value].to_numpy(dtype="float64"))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, totals / counts, np.nan)
+    return {
+        "x": (x_edges[:-1] + x_edges[1:]) / 2,
+        "y": (y_edges[:-1] + y_edges[1:]) / 2,
+        "z": means.T,
+        "counts": counts.T,
+    }
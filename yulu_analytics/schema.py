@@ -0,0 +1,92 @@
+"""Explicit column schema for the Yulu dataset.
+
+Raw CSV columns are read straight into small numeric dtypes, coded columns
+are decoded into categoricals and the derived calendar columns are kept as
+categoricals and small integers, instead of object strings and int64.
+"""
+import numpy as np
+import pandas as pd
+
+# dtypes used when parsing the raw CSV
+RAW_DTYPES = {
+    "season": "int8",
+    "holiday": "int8",
+    "workingday": "int8",
+    "weather": "int8",
+    "temp": "float32",
+    "atemp": "float32",
+    "humidity": "int8",
+    "windspeed": "float32",
+    # int32 rather than int16 so per-hour totals of large zones cannot overflow
+    "casual": "int32",
+    "registered": "int32",
+    "count": "int32",
+}
+
+# coded raw columns -> {code: label}, in display order
+CATEGORY_LABELS = {
+    "season": {1: "Spring", 2: "Summer", 3: "Fall", 4: "Winter"},
+    "weather": {1: "Clear", 2: "Cloudy", 3: "Little Rain", 4: "Heavy Rain"},
+    "workingday": {0: "No", 1: "Yes"},
+    "holiday": {0: "No", 1: "Yes"},
+}
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December"]
+
+# continuous columns summarized and correlated throughout the analysis
+NUMERICAL_COLUMNS = ["temp", "atemp", "humidity", "windspeed", "casual", "registered", "count"]
+
+DERIVED_CATEGORIES = {"day": DAY_NAMES, "Month_name": MONTH_NAMES}
+DERIVED_DTYPES = {"hour": "int8", "Month": "int8", "year": "int16"}
+
+
+def decode_categories(series, labels):
+    """Map integer codes to a ``Categorical`` of labels; unknown codes become NaN."""
+    codes = pd.Index(list(labels)).get_indexer(series.to_numpy())
+    return pd.Categorical.from_codes(codes, categories=list(labels.values()))
+
+
+def apply_schema(data):
+    """Convert a preprocessed frame to the compact schema in place."""
+    for column, labels in CATEGORY_LABELS.items():
+        if not isinstance(data[column].dtype, pd.CategoricalDtype):
+            data[column] = decode_categories(data[column], labels)
+    for column, categories in DERIVED_CATEGORIES.items():
+        data[column] = pd.Categorical(data[column], categories=categories)
+    for column, dtype in DERIVED_DTYPES.items():
+        data[column] = data[column].astype(dtype)
+    return data
+
+
+def _legacy_equivalent(series):
+    """Rebuild a column the way load_data() used to hold it (object strings, 64-bit numbers)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.astype(object)
+    if series.name == "date":
+        return pd.Series(series.dt.date, name=series.name)
+    if series.dtype.kind in "iu":
+        return series.astype("int64")
+    if series.dtype.kind == "f":
+        return series.astype("float64")
+    return series
+
+
+def memory_report(data):
+    """Per-column memory of ``data`` compared with the untyped legacy layout."""
+    rows = []
+    for column in data.columns:
+        series = data[column]
+        legacy = _legacy_equivalent(series)
+        rows.append({
+            "Column": column,
+            "Legacy dtype": str(legacy.dtype),
+            "Compact dtype": str(series.dtype),
+            "Legacy (KB)": legacy.memory_usage(deep=True, index=False) / 1024,
+            "Compact (KB)": series.memory_usage(deep=True, index=False) / 1024,
+        })
+    report = pd.DataFrame(rows)
+    report["Saved (KB)"] = report["Legacy (KB)"] - report["Compact (KB)"]
+    report["Reduction"] = report["Legacy (KB)"] / report["Compact (KB)"].replace(0, np.nan)
+    return report
@@ -0,0 +1,89 @@
+"""Run independent dashboard computations together on a shared worker pool.
+
+The sections of the Complete Analysis tab and the hypothesis tests do not
+depend on each other. ``run_sections`` takes them as named zero-argument
+callables and either runs them one after another in the calling thread
+(``"serial"``) or submits them all to a process-wide thread pool and waits
+for every result (``"threads"``), so the caller renders only once everything
+is computed. pandas/NumPy groupbys, sorts and the SciPy tests release the GIL
+for most of their work; plotly's figure validation does not, so figure-heavy
+sections gain less.
+
+A thread pool rather than a process pool: tasks read the shared
+(memory-mapped) frame and fill the in-process figure cache, both of which a
+worker process would have to receive by pickling.
+
+Each task runs under its own ``Profiler`` on the worker, and its spans are
+grafted into the caller's profiler as a ``section.<name>`` span, so the Logs
+tab still shows what every section spent its time on.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .profiling import Profiler, activate, current, deactivate, span
+
+EXECUTION_MODES = ("serial", "threads")
+
+SECTION_WORKERS = int(os.environ.get("YULU_SECTION_WORKERS", min(8, os.cpu_count() or 1)))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def default_mode():
+    """``YULU_EXECUTION_MODE`` if set, else threads on multi-core machines and serial otherwise."""
+    mode = os.environ.get("YULU_EXECUTION_MODE")
+    if mode in EXECUTION_MODES:
+        return mode
+    return "threads" if SECTION_WORKERS > 1 else "serial"
+
+
+def _get_pool():
+    # One pool for the whole process, shared by every session
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=SECTION_WORKERS, thread_name_prefix="yulu-section")
+        return _pool
+
+
+def _profiled(task):
+    profiler = Profiler()
+    token = activate(profiler)
+    try:
+        return task(), profiler.finish()
+    finally:
+        deactivate(token)
+
+
+def run_sections(tasks, mode="serial"):
+    """Run ``tasks`` (name -> zero-argument callable) and return name -> result, in the same order.
+
+    Every task is waited for before an exception from the first failing one
+    is raised, so no section is still running when the caller renders.
+    """
+    if mode not in EXECUTION_MODES:
+        raise ValueError(f"Unknown execution mode {mode!r}")
+    if mode == "serial" or len(tasks) < 2:
+        results = {}
+        for name, task in tasks.items():
+            with span(f"section.{name}"):
+                results[name] = task()
+        return results
+
+    pool = _get_pool()
+    futures = {name: pool.submit(_profiled, task) for name, task in tasks.items()}
+    parent = current()
+    results, error = {}, None
+    for name, future in futures.items():
+        try:
+            results[name], profiler = future.result()
+        except Exception as e:
+            error = error or e
+            continue
+        if parent is not None:
+            parent.adopt(f"section.{name}", profiler, worker=True)
+    if error is not None:
+        raise error
+    return results
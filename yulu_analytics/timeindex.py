@@ -0,0 +1,82 @@
+"""Time-range slicing and range aggregates over the hourly rows.
+
+``TimeIndex`` keeps the row timestamps in sorted order (the frame itself when
+it is already sorted, as files appended to over time are, otherwise through
+an argsort permutation) and the prefix sums of n, sum and sum of squares of
+each measure in that order. A date window is two binary searches: its rows
+are a contiguous run of the sorted order, so ``slice`` is a view (or one
+gather) of just those rows, and ``totals`` is the difference of two prefix
+sum rows. Window totals and means therefore cost O(log n) however long the
+history, and charts over a window only ever touch the window's rows.
+"""
+import numpy as np
+import pandas as pd
+
+from .aggregates import MEASURES
+from .profiling import traced
+
+
+def _cube_columns(measures):
+    return ["n"] + [f"{measure}_{part}" for measure in measures for part in ("sum", "sumsq")]
+
+
+class TimeIndex:
+    """Sorted ``datetime`` of a frame with prefix sums of its measures."""
+
+    @traced("timeindex.build")
+    def __init__(self, data, measures=MEASURES):
+        stamps = data["datetime"].to_numpy()
+        if pd.Index(stamps).is_monotonic_increasing:
+            self.order = None
+        else:
+            self.order = np.argsort(stamps, kind="stable")
+            stamps = stamps[self.order]
+        self.stamps = stamps
+        self.measures = list(measures)
+        self.columns = _cube_columns(self.measures)
+
+        # Row i holds the sums over the first i rows in time order, so any window is one subtraction
+        self.prefix = np.zeros((len(stamps) + 1, len(self.columns)), dtype="int64")
+        self.prefix[1:, 0] = np.arange(1, len(stamps) + 1)
+        for j, measure in enumerate(self.measures):
+            values = data[measure].to_numpy().astype("int64")
+            if self.order is not None:
+                values = values[self.order]
+            np.cumsum(values, out=self.prefix[1:, 1 + 2 * j])
+            np.cumsum(values * values, out=self.prefix[1:, 2 + 2 * j])
+
+    def __len__(self):
+        return len(self.stamps)
+
+    def span(self):
+        """First and last timestamp, or (None, None) for an empty frame."""
+        if not len(self.stamps):
+            return None, None
+        return pd.Timestamp(self.stamps[0]), pd.Timestamp(self.stamps[-1])
+
+    def _position(self, when, side):
+        return int(np.searchsorted(self.stamps, np.datetime64(pd.Timestamp(when)).astype(self.stamps.dtype), side))
+
+    def bounds(self, start=None, end=None):
+        """Sorted positions [lo, hi) of the rows with ``start <= datetime < end`` (open-ended when None)."""
+        lo = 0 if start is None else self._position(start, "left")
+        hi = len(self.stamps) if end is None else self._position(end, "left")
+        return lo, max(lo, hi)
+
+    def positions(self, start=None, end=None):
+        """Row positions in the frame of the window, in time order (a slice when the frame is sorted)."""
+        lo, hi = self.bounds(start, end)
+        return slice(lo, hi) if self.order is None else self.order[lo:hi]
+
+    @traced("timeindex.slice")
+    def slice(self, data, start=None, end=None):
+        """The rows of ``data`` (the frame the index was built on) in the window."""
+        return data.iloc[self.positions(start, end)]
+
+    def totals(self, start=None, end=None):
+        """n, sum and sum of squares per measure over the window, as a one-row cube.
+
+        The result works with the cube helpers, e.g. ``total`` and ``overall_mean``.
+        """
+        lo, hi = self.bounds(start, end)
+        return pd.DataFrame([self.prefix[hi] - self.prefix[lo]], columns=self.columns)